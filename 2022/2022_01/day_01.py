@@ -1,7 +1,22 @@
-"""Solution --- Day 1: Calorie Counting ---"""
+"""
+Solution --- Day 1: Calorie Counting ---
+
+The totals are streamed, keeping only the highest ones in a bounded heap. For
+huge inputs, the file can also be split into chunks at blank lines (so that no
+elf's inventory is split), which are reduced to their highest totals in a pool
+of processes; the highest totals over all chunks are then selected from these.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import itertools
+import re
 
 import aoc_tools as aoc
 
+CHUNK_SIZE = 1 << 24
+BLANK_LINE_REGEX = re.compile(rb"\n[ \t\r]*\n")
+
 
 def main():
     filename = "input_01.txt"
@@ -13,25 +28,100 @@ def main():
 
 def sum_top_totals(filename, cut_off_rank):
     """Read file input, and sum the {cut_off_rank}-highest totals."""
-    calorie_lines = aoc.read_stripped_lines(filename, add_line="")
-    sorted_totals = sorted(calculate_elf_totals(calorie_lines))
-    if cut_off_rank <= len(sorted_totals):
-        return sum(sorted_totals[-cut_off_rank:])
+    return sum_top_totals_for_ranks(filename, (cut_off_rank,))[0]
+
+
+def sum_top_totals_for_ranks(filename, cut_off_ranks):
+    """Stream file input once, and sum the highest totals for every rank."""
+    calorie_lines = aoc.iter_stripped_lines(filename, add_line="")
+    top_totals = select_top_totals(
+        iter_elf_totals(calorie_lines), max(cut_off_ranks)
+    )
+    if max(cut_off_ranks) <= len(top_totals):
+        return tuple(sum(top_totals[:rank]) for rank in cut_off_ranks)
+    else:
+        raise IndexError("Cut-off rank exceeds the number of elves!")
+
+
+def sum_top_totals_chunked(
+    filename, cut_off_ranks, workers=None, chunk_size=CHUNK_SIZE
+):
+    """Sum the highest totals for every rank, reducing chunks in parallel."""
+    nr_totals = max(cut_off_ranks)
+    with aoc.read_mapped(filename) as buffer:
+        bounds = find_chunk_bounds(buffer, chunk_size)
+    if len(bounds) == 1:
+        chunk_tops = [reduce_chunk(filename, *bounds[0], nr_totals)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_tops = list(
+                executor.map(
+                    reduce_chunk,
+                    itertools.repeat(filename),
+                    *zip(*bounds),
+                    itertools.repeat(nr_totals),
+                )
+            )
+    top_totals = heapq.nlargest(nr_totals, itertools.chain(*chunk_tops))
+    if nr_totals <= len(top_totals):
+        return tuple(sum(top_totals[:rank]) for rank in cut_off_ranks)
     else:
         raise IndexError("Cut-off rank exceeds the number of elves!")
 
 
+def find_chunk_bounds(buffer, chunk_size):
+    """Split a buffer into (start, end) chunks, at blank lines between elves."""
+    bounds = []
+    start = 0
+    while start < len(buffer):
+        match = BLANK_LINE_REGEX.search(buffer, start + chunk_size)
+        if match is None:
+            bounds.append((start, len(buffer)))
+            break
+        bounds.append((start, match.start()))
+        start = match.end()
+    return bounds
+
+
+def reduce_chunk(filename, start, end, nr_totals):
+    """Compute the highest totals of the elves in a chunk of a file."""
+    with aoc.read_mapped(filename) as buffer:
+        chunk = buffer[start:end]
+    elf_totals = (
+        sum(map(int, inventory.split()))
+        for inventory in BLANK_LINE_REGEX.split(chunk)
+    )
+    return heapq.nlargest(nr_totals, elf_totals)
+
+
+@aoc.instrument
+def select_top_totals(elf_totals, nr_totals):
+    """Select the highest totals (descending), keeping a min-heap of them."""
+    heap = []
+    if nr_totals < 1:
+        return heap
+    for elf_total in elf_totals:
+        if len(heap) < nr_totals:
+            heapq.heappush(heap, elf_total)
+        elif elf_total > heap[0]:
+            heapq.heapreplace(heap, elf_total)
+    return sorted(heap, reverse=True)
+
+
 def calculate_elf_totals(calorie_lines):
     """Calculate the total number of calories for all elves."""
-    all_totals = []
+    return list(iter_elf_totals(calorie_lines))
+
+
+def iter_elf_totals(calorie_lines):
+    """Generate the total number of calories per elf, one elf at a time."""
     elf_total = 0
     for calorie_line in calorie_lines:
         if calorie_line:
             elf_total += int(calorie_line)
         else:
-            all_totals.append(elf_total)
+            yield elf_total
             elf_total = 0
-    return all_totals
 
 
 if __name__ == "__main__":
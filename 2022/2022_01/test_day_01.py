@@ -28,6 +28,33 @@ class TestSolution(unittest.TestCase):
         top_totals_sum = d01.sum_top_totals(FILENAME, cut_off_rank=3)
         self.assertEqual(top_totals_sum, 211447)
 
+    def test_ranks_one_pass(self):
+        """Test whether several ranks are answered from one pass."""
+        self.assertEqual(
+            d01.sum_top_totals_for_ranks(FILENAME_EXAMPLE, (1, 3, 5)),
+            (24000, 45000, 55000),
+        )
+        with self.assertRaises(IndexError):
+            d01.sum_top_totals_for_ranks(FILENAME_EXAMPLE, (1, 6))
+        self.assertEqual(d01.sum_top_totals(FILENAME_EXAMPLE, 0), 0)
+        self.assertEqual(
+            d01.calculate_elf_totals(["1", "2", "", "3", ""]), [3, 3]
+        )
+
+    def test_chunked(self):
+        """Test whether chunked reduction agrees with streaming."""
+        for chunk_size in (1, 50, 1 << 24):
+            self.assertEqual(
+                d01.sum_top_totals_chunked(
+                    FILENAME, (1, 3), workers=2, chunk_size=chunk_size
+                ),
+                (71934, 211447),
+            )
+        self.assertEqual(
+            d01.sum_top_totals_chunked(FILENAME_EXAMPLE, (1, 3), chunk_size=8),
+            (24000, 45000),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,23 @@
-"""Solution --- Day 2: Rock Paper Scissors ---"""
+"""
+Solution --- Day 2: Rock Paper Scissors ---
+
+There are only nine distinct rounds. Hence, the default 'histogram' engine
+counts the occurrences of every round (as a line) with bytes.count, on
+fixed-size chunks of the memory-mapped input, after which the score for either
+part is the dot product of the counts with the round scores. As every round line
+takes four bytes, a chunk holds only rounds if its line count times four is its
+length, and its round counts sum to its line count. Inputs in another layout
+(e.g. with trailing spaces) are counted line by line instead. The 'lines' engine
+looks up the score of every line.
+"""
 
 import aoc_tools as aoc
 
+CHUNK_SIZE = 1 << 20
+ROUNDS = tuple(f"{a} {b}" for a in "ABC" for b in "XYZ")
+ROUND_LINES = {r: f"{r}\n".encode() for r in ROUNDS}
+ROUND_LINE_LENGTH = 4
+
 
 def main():
     filename = "input_02.txt"
@@ -11,13 +27,76 @@ def main():
     print(f"The part-2 score following the strategy guide is {total_score}.")
 
 
-def evaluate_strategy_guide(filename, part):
+@aoc.instrument
+def evaluate_strategy_guide(filename, part, engine="histogram"):
     """Read file input, and calculate the total score of the strategy guide."""
-    round_lines = aoc.read_stripped_lines(filename)
     round_score = get_round_score(part)
+    if engine == "histogram":
+        return score_histogram(count_rounds(filename), round_score)
+    elif engine != "lines":
+        raise ValueError(f"Unknown engine {engine}!")
+    round_lines = aoc.iter_stripped_lines(filename)
     return sum(round_score[line] for line in round_lines)
 
 
+def solve_parts(filename):
+    """Calculate the total scores of both parts, from one round histogram."""
+    round_counts = count_rounds(filename)
+    return tuple(
+        score_histogram(round_counts, get_round_score(part)) for part in (1, 2)
+    )
+
+
+@aoc.instrument
+def count_rounds(filename, chunk_size=CHUNK_SIZE):
+    """Read file input in chunks, and count the occurrences of every round."""
+    round_counts = dict.fromkeys(ROUNDS, 0)
+    with aoc.read_mapped(filename) as buffer:
+        partial_line = b""
+        for start in range(0, len(buffer), chunk_size):
+            chunk = partial_line + buffer[start : start + chunk_size]
+            end = chunk.rfind(b"\n") + 1
+            partial_line = chunk[end:]  # Completed by the next chunk, if any
+            if not add_round_counts(round_counts, chunk, end):
+                return count_round_lines(filename)
+    if partial_line:
+        chunk = partial_line + b"\n"
+        if not add_round_counts(round_counts, chunk, len(chunk)):
+            return count_round_lines(filename)
+    return round_counts
+
+
+def add_round_counts(round_counts, chunk, end):
+    """Add the counts of the lines up to an end, if all of them are rounds."""
+    nr_lines = chunk.count(b"\n", 0, end)
+    if end != ROUND_LINE_LENGTH * nr_lines:
+        return False
+    chunk_counts = {
+        r: chunk.count(round_line, 0, end)
+        for r, round_line in ROUND_LINES.items()
+    }
+    if sum(chunk_counts.values()) != nr_lines:
+        return False
+    for r, count in chunk_counts.items():
+        round_counts[r] += count
+    return True
+
+
+def count_round_lines(filename):
+    """Read file input by line, and count the occurrences of every round."""
+    round_counts = dict.fromkeys(ROUNDS, 0)
+    for line in aoc.iter_stripped_lines(filename):
+        if line not in round_counts:
+            raise ValueError(f"The strategy guide has a line {line!r}!")
+        round_counts[line] += 1
+    return round_counts
+
+
+def score_histogram(round_counts, round_score):
+    """Calculate the total score, from the counts and scores of the rounds."""
+    return sum(count * round_score[r] for r, count in round_counts.items())
+
+
 def get_round_score(part):
     """Get scoring rule for a round, for the specified part of the puzzle."""
     if part == 1:
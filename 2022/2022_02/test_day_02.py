@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import day_02 as d02
 
@@ -28,6 +30,47 @@ class TestSolution(unittest.TestCase):
         total_score = d02.evaluate_strategy_guide(FILENAME, part=2)
         self.assertEqual(total_score, 10398)
 
+    def test_engines(self):
+        """Test whether the histogram engine agrees with the lines engine."""
+        for filename in (FILENAME_EXAMPLE, FILENAME):
+            for part in (1, 2):
+                self.assertEqual(
+                    d02.evaluate_strategy_guide(filename, part, "histogram"),
+                    d02.evaluate_strategy_guide(filename, part, "lines"),
+                )
+        self.assertEqual(d02.solve_parts(FILENAME), (13009, 10398))
+
+    def test_chunks(self):
+        """Test whether lines split across chunks are counted once."""
+        for chunk_size in (1, 3, 5, 4096):
+            self.assertEqual(
+                d02.count_rounds(FILENAME, chunk_size),
+                d02.count_rounds(FILENAME),
+            )
+
+    def test_other_layouts(self):
+        """Test whether rounds with trailing spaces are counted line by line."""
+        file_descriptor, filename = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "w") as file_object:
+            file_object.write("A Y \nB X\r\nC Z\n")
+        try:
+            round_counts = d02.count_rounds(filename)
+        finally:
+            os.remove(filename)
+        self.assertEqual(sum(round_counts.values()), 3)
+        self.assertEqual(round_counts["A Y"], 1)
+
+    def test_invalid_rounds(self):
+        """Test whether lines that are not rounds are refused."""
+        file_descriptor, filename = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "w") as file_object:
+            file_object.write("A Y\nB W\nC Z")
+        try:
+            with self.assertRaises(ValueError):
+                d02.count_rounds(filename)
+        finally:
+            os.remove(filename)
+
 
 if __name__ == "__main__":
     unittest.main()
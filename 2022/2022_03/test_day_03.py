@@ -28,6 +28,34 @@ class TestSolution(unittest.TestCase):
         priority_sum = d03.sum_badge_type_priorities(FILENAME)
         self.assertEqual(priority_sum, 2413)
 
+    def test_engines(self):
+        """Test whether the masks engine agrees with the sets engine."""
+        for filename in (FILENAME_EXAMPLE, FILENAME):
+            for solver in (
+                d03.sum_two_type_priorities,
+                d03.sum_badge_type_priorities,
+            ):
+                self.assertEqual(
+                    solver(filename, "masks"), solver(filename, "sets")
+                )
+        self.assertEqual(d03.solve_parts(FILENAME), (8394, 2413))
+
+    def test_invalid_rucksacks(self):
+        """Test whether rucksacks without a single shared item are refused."""
+        with self.assertRaises(ValueError):
+            d03.scan_rucksacks(["abAB", "abab", "abBB"])
+        with self.assertRaises(ValueError):
+            d03.scan_rucksacks(["aa", "bb", "cc"])
+
+    def test_part_1_without_badges(self):
+        """Test whether part 1 ignores groups without a single badge."""
+        rucksacks = ["aAbA", "cCdC", "eEfE"]
+        self.assertEqual(
+            d03.scan_rucksacks(rucksacks, find_badges=False)[0], 87
+        )
+        with self.assertRaises(ValueError):
+            d03.scan_rucksacks(rucksacks)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,17 @@
-"""Solution --- Day 4: Camp Cleanup ---"""
+"""
+Solution --- Day 4: Camp Cleanup ---
 
-import re
+The endpoints of all range pairs are parsed once, into a flat integer array,
+and both parts are counted together (see count_pairs). The 'python' engine (the
+default) checks every pair in one scan. The 'numpy' engine (the default with the
+numpy backend, see aoc_tools.set_backend) reshapes the array into four endpoint
+columns, and evaluates both checks on all pairs at once.
+"""
 
 import aoc_tools as aoc
 
+PER_PAIR = 4
+
 
 def main():
     filename = "input_04.txt"
@@ -13,17 +21,40 @@ def main():
     print(f"In {nr_overlaps} pairs, the ranges overlap.")
 
 
-def count_supersets(filename):
+def count_supersets(filename, engine=None):
     """Count the number of pairs where one range fully contains the other."""
-    pair_regex = re.compile(r"(\d+)-(\d+),(\d+)-(\d+)")
-    pair_lines = aoc.read_stripped_lines(filename)
-    nr_supersets = 0
-    for line in pair_lines:
-        range_endpoints = (int(x) for x in pair_regex.search(line).groups())
+    return count_pairs(filename, engine)[0]
+
+
+def count_overlaps(filename, engine=None):
+    """Count the number of pairs whose ranges overlap."""
+    return count_pairs(filename, engine)[1]
+
+
+def count_pairs(filename, engine=None):
+    """Count the pairs with a superset, and the pairs with an overlap."""
+    if engine is None:
+        engine = "numpy" if aoc.get_backend() == "numpy" else "python"
+    endpoints = parse_endpoints(filename)
+    if engine == "numpy":
+        return count_pairs_array(endpoints)
+    elif engine != "python":
+        raise ValueError(f"Unknown engine {engine}!")
+    nr_supersets = nr_overlaps = 0
+    for range_endpoints in aoc.iter_records(endpoints, PER_PAIR):
         nr_supersets += is_superset(*range_endpoints)
-    return nr_supersets
+        nr_overlaps += has_overlap(*range_endpoints)
+    return nr_supersets, nr_overlaps
+
+
+@aoc.cache_parsed()
+def parse_endpoints(filename):
+    """Read file input, and get the range endpoints as a flat array."""
+    with aoc.read_mapped(filename) as buffer:
+        return aoc.extract_ints(buffer, per_record=PER_PAIR)
 
 
+@aoc.instrument
 def is_superset(lower_1, upper_1, lower_2, upper_2):
     """Check whether range 1 is a sub- or superset of range 2."""
     return (lower_1 >= lower_2 and upper_1 <= upper_2) or (
@@ -31,21 +62,25 @@ def is_superset(lower_1, upper_1, lower_2, upper_2):
     )
 
 
-def count_overlaps(filename):
-    """Count the number of pairs whose ranges overlap."""
-    pair_regex = re.compile(r"(\d+)-(\d+),(\d+)-(\d+)")
-    pair_lines = aoc.read_stripped_lines(filename)
-    nr_overlaps = 0
-    for line in pair_lines:
-        range_endpoints = (int(x) for x in pair_regex.search(line).groups())
-        nr_overlaps += has_overlap(*range_endpoints)
-    return nr_overlaps
-
-
+@aoc.instrument
 def has_overlap(lower_1, upper_1, lower_2, upper_2):
     """Check whether range 1 has an overlap with range 2."""
     return not (lower_1 > upper_2 or upper_1 < lower_2)
 
 
+def count_pairs_array(endpoints):
+    """Count the pairs with a superset and with an overlap, using NumPy."""
+    np = aoc.import_numpy()
+    pairs = np.frombuffer(endpoints, dtype=np.int64).reshape(-1, PER_PAIR)
+    lower_1, upper_1, lower_2, upper_2 = pairs.T
+    is_superset = ((lower_1 >= lower_2) & (upper_1 <= upper_2)) | (
+        (lower_1 <= lower_2) & (upper_1 >= upper_2)
+    )
+    has_overlap = (lower_1 <= upper_2) & (upper_1 >= lower_2)
+    return int(np.count_nonzero(is_superset)), int(
+        np.count_nonzero(has_overlap)
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_04 as d04
 
 FILENAME = "input_04.txt"
@@ -28,6 +29,16 @@ class TestSolution(unittest.TestCase):
         nr_overlaps = d04.count_overlaps(FILENAME)
         self.assertEqual(nr_overlaps, 841)
 
+    def test_count_pairs(self):
+        """Test whether both counts are returned together."""
+        self.assertEqual(d04.count_pairs(FILENAME_EXAMPLE), (2, 4))
+        self.assertEqual(d04.count_pairs(FILENAME), (534, 841))
+
+
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 4, with the numpy backend."""
+
 
 if __name__ == "__main__":
     unittest.main()
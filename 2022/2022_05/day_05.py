@@ -1,7 +1,6 @@
 """Solution --- Day 5: Supply Stacks ---"""
 
 from collections import deque
-import re
 
 import aoc_tools as aoc
 
@@ -39,13 +38,12 @@ def initialize_stacks(filename_initial):
     return crate_stacks
 
 
+@aoc.instrument
 def rearrange_stacks(crate_stacks, filename_moves, mover_9001):
     """Read file input, and move the crates between the stacks."""
-    move_regex = re.compile(r"move (\d+) from (\d+) to (\d+)")
-    move_lines = aoc.read_stripped_lines(filename_moves)
-    for line in move_lines:
-        move_data = (int(x) for x in move_regex.search(line).groups())
-        move_size, from_stack, to_stack = move_data
+    with aoc.read_mapped(filename_moves) as buffer:
+        move_data = aoc.extract_ints(buffer, per_record=3)
+    for move_size, from_stack, to_stack in aoc.iter_records(move_data, 3):
         if not mover_9001:
             for _ in range(move_size):
                 crate_stacks[to_stack].append(crate_stacks[from_stack].pop())
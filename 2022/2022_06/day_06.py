@@ -11,6 +11,7 @@ def main():
     print(f"The first start-of-message marker is at character {nr_characters}.")
 
 
+@aoc.instrument
 def get_first_start_marker(filename, pattern_length):
     """Determine the number of characters before a start marker is detected."""
     signal = aoc.read_stripped(filename)
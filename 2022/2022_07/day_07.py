@@ -41,6 +41,7 @@ def get_size_delete_directory(filename):
     return next(d.size for d in directories if d.size >= min_del_size)
 
 
+@aoc.cache_parsed(copier=list)
 def get_directories(filename):
     """Read file input, and identify the directories and their size."""
     file_regex = re.compile(r"(\d+) (\S+)")
@@ -72,6 +73,8 @@ def get_directories(filename):
 class Directory:
     """Class to represent a directory."""
 
+    __slots__ = ("name", "size", "parent", "children", "count_ls")
+
     def __init__(self, name, parent=None):
         """Create a directory with a parent, or a root directory."""
         self.name = name
@@ -86,6 +89,7 @@ class Directory:
         """Add a child directory to this directory."""
         self.children.append(directory)
 
+    @aoc.instrument
     def update_size(self, file_size):
         """Increase the size of this directory and all its ascendants."""
         self.size += file_size
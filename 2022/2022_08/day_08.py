@@ -1,6 +1,16 @@
-"""Solution --- Day 8: Treetop Tree House ---"""
+"""
+Solution --- Day 8: Treetop Tree House ---
+
+With the numpy backend, viewing distances are computed for all trees at once,
+per direction and per tree height: the nearest tree blocking the view of a tree
+of a given height is found by a running maximum over the positions of trees at
+least as tall.
+"""
 
 import aoc_tools as aoc
+from grid import Grid
+
+OUTSIDE = 255
 
 
 def main():
@@ -13,42 +23,85 @@ def main():
 def calculate_tree_house_metrics(filename):
     """Read file input, calculate viewing distances, and derive metrics."""
     tree_lines = aoc.read_stripped_lines(filename)
-    grid = [[int(x) for x in list(line)] for line in tree_lines]
-    grid_height = len(grid)
-    grid_width = len(grid[0])
-
-    scenic_scores = [[1] * grid_width for _ in range(grid_height)]
-    is_visibles = [[False] * grid_width for _ in range(grid_height)]
-    for idx_y in range(grid_height):
-        for idx_x in range(grid_width):
-            for d_y, d_x in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                view_distance, is_visible = evaluate_direction(
-                    grid, grid_height, grid_width, idx_y, idx_x, d_y, d_x
-                )
-                scenic_scores[idx_y][idx_x] *= view_distance
-                if not is_visibles[idx_y][idx_x]:
-                    is_visibles[idx_y][idx_x] = is_visible
-
-    max_scenic_score = max(max(row) for row in scenic_scores)
-    nr_visible = sum(sum(row) for row in is_visibles)
+    heights = {str(height): height for height in range(10)}
+    grid = Grid.from_lines(tree_lines, heights, padding=1, border=OUTSIDE)
+    if aoc.get_backend() == "numpy":
+        return calculate_metrics_numpy(grid)
+
+    nr_visible = 0
+    max_scenic_score = 0
+    for idx in grid.iter_indices():
+        scenic_score = 1
+        is_visible = False
+        for offset in grid.neighbor_offsets:
+            view_distance, is_visible_from = evaluate_direction(
+                grid.cells, idx, offset
+            )
+            scenic_score *= view_distance
+            is_visible = is_visible or is_visible_from
+        nr_visible += is_visible
+        max_scenic_score = max(max_scenic_score, scenic_score)
     return nr_visible, max_scenic_score
 
 
-def evaluate_direction(grid, grid_height, grid_width, idx_y, idx_x, d_y, d_x):
+@aoc.instrument
+def evaluate_direction(cells, idx, offset):
     """Evaluate the number of visible trees in a given direction from a tree."""
     view_distance = 0
-    is_visible = True
-    target_y = idx_y + d_y
-    target_x = idx_x + d_x
-
-    while 0 <= target_y < grid_height and 0 <= target_x < grid_width:
+    height = cells[idx]
+    target = idx + offset
+    while cells[target] != OUTSIDE:
         view_distance += 1
-        is_visible = grid[target_y][target_x] < grid[idx_y][idx_x]
-        target_y += d_y
-        target_x += d_x
-        if not is_visible:
-            break
-    return view_distance, is_visible
+        if cells[target] >= height:
+            return view_distance, False
+        target += offset
+    return view_distance, True
+
+
+def calculate_metrics_numpy(grid):
+    """Calculate the metrics, viewing in all directions at once with NumPy."""
+    np = aoc.import_numpy()
+    padded = np.frombuffer(grid.cells, dtype=np.uint8)
+    padded = padded.reshape(-1, grid.stride)
+    heights = padded[1:-1, 1:-1]
+
+    # View to the left, right, top, and bottom by transforming the heights:
+    is_visible = np.zeros(heights.shape, dtype=bool)
+    scenic_scores = np.ones(heights.shape, dtype=np.int64)
+    for transform, inverse in (
+        (lambda a: a, lambda a: a),
+        (lambda a: a[:, ::-1], lambda a: a[:, ::-1]),
+        (lambda a: a.T, lambda a: a.T),
+        (lambda a: a.T[:, ::-1], lambda a: a[:, ::-1].T),
+    ):
+        view_distances, is_visible_from = view_left_numpy(
+            np.ascontiguousarray(transform(heights))
+        )
+        is_visible |= inverse(is_visible_from)
+        scenic_scores *= inverse(view_distances)
+    return int(is_visible.sum()), int(scenic_scores.max())
+
+
+def view_left_numpy(heights):
+    """Evaluate, for all trees, the trees that are visible to the left."""
+    np = aoc.import_numpy()
+    cols = np.broadcast_to(np.arange(heights.shape[1]), heights.shape)
+    view_distances = np.zeros(heights.shape, dtype=np.int64)
+    is_visible_from = np.zeros(heights.shape, dtype=bool)
+    for height in range(int(heights.max()) + 1):
+        # The position of the nearest tree to the left at least as tall:
+        positions = np.where(heights >= height, cols, -1)
+        blocking = np.full(heights.shape, -1)
+        np.maximum.accumulate(positions[:, :-1], axis=1, out=blocking[:, 1:])
+        is_height = heights == height
+        is_blocked = blocking >= 0
+        view_distances = np.where(
+            is_height,
+            np.where(is_blocked, cols - blocking, cols),
+            view_distances,
+        )
+        is_visible_from |= is_height & ~is_blocked
+    return view_distances, is_visible_from
 
 
 if __name__ == "__main__":
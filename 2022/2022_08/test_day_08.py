@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_08 as d08
 
 FILENAME = "input_08.txt"
@@ -29,5 +30,10 @@ class TestSolution(unittest.TestCase):
         self.assertEqual(scenic_score, 486540)
 
 
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 8, with the numpy backend."""
+
+
 if __name__ == "__main__":
     unittest.main()
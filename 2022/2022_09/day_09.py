@@ -1,6 +1,7 @@
 """Solution --- Day 9: Rope Bridge ---"""
 
 import aoc_tools as aoc
+from grid import Grid
 
 
 def main():
@@ -17,6 +18,7 @@ def count_visited_positions(filename, nr_knots):
     return simulate_rope(nr_knots, directions, move_sizes)
 
 
+@aoc.cache_parsed()
 def initialize_moves(filename):
     """Read file input to get the directions and move sizes."""
     head_move_lines = aoc.read_stripped_lines(filename)
@@ -25,12 +27,15 @@ def initialize_moves(filename):
     return directions, move_sizes
 
 
+@aoc.instrument
 def simulate_rope(nr_knots, directions, move_sizes):
     """Simulate the rope and count the positions visited by its tail."""
     min_y, max_y, min_x, max_x = bound_rope_positions(directions, move_sizes)
     grid_height = max_y - min_y + 1
     grid_width = max_x - min_x + 1
-    is_visited = [[False] * grid_width for _ in range(grid_height)]
+    is_visited = Grid(grid_height, grid_width)
+    origin = is_visited.index(-min_y, -min_x)
+    stride = is_visited.stride
     knots_y = [0] * nr_knots
     knots_x = [0] * nr_knots
 
@@ -46,8 +51,8 @@ def simulate_rope(nr_knots, directions, move_sizes):
                 knots_x[0] += 1
             for idx in range(1, nr_knots):
                 move_knot(knots_y, knots_x, idx)
-            is_visited[knots_y[-1] - min_y][knots_x[-1] - min_x] = True
-    return sum(sum(row) for row in is_visited)
+            is_visited.cells[origin + knots_y[-1] * stride + knots_x[-1]] = 1
+    return is_visited.count(1)
 
 
 def bound_rope_positions(directions, move_sizes):
@@ -71,6 +76,7 @@ def bound_rope_positions(directions, move_sizes):
     return min_y, max_y, min_x, max_x
 
 
+@aoc.instrument
 def move_knot(knots_y, knots_x, idx):
     """Move the (idx+1)-th knot in response to the idx-th knot."""
     dist_y = knots_y[idx - 1] - knots_y[idx]
@@ -24,6 +24,7 @@ def simulate_crt(filename):
     return signal_strength_sum, pixel_pattern
 
 
+@aoc.instrument
 def compute_register_values(filename):
     """Read file input, and compute the value of the X register."""
     program_lines = aoc.read_stripped_lines(filename)
@@ -53,6 +53,7 @@ def initialize_monkeys(filename):
     return monkeys
 
 
+@aoc.instrument
 def play_keep_away(monkeys, nr_rounds, worry_management):
     """Simulate a number of rounds of keep away."""
     factor_out = math.prod(mk.test_divisor for mk in monkeys)
@@ -73,6 +74,14 @@ def play_keep_away(monkeys, nr_rounds, worry_management):
 class Monkey:
     """Class to represent a monkey."""
 
+    __slots__ = (
+        "items",
+        "operation_function",
+        "test_divisor",
+        "test_outcomes",
+        "nr_inspections",
+    )
+
     def __init__(self, items, operation_function, test_divisor, test_outcomes):
         """Create a monkey with an item queue, and operation/test functions."""
         self.items = deque(items)
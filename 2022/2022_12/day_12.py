@@ -1,12 +1,15 @@
 """
 Solution --- Day 12: Hill Climbing Algorithm ---
 
-Instead of using Dijkstra's algorithm to compute the shortest path to the sink,
-this solution uses it to compute the shortest distance from the sink (either to
-a fixed source or to all squares with elevation level 'a').
+Instead of searching for the shortest path to the sink, this solution searches
+backward from the sink for the nearest source (either a fixed source or any
+square with elevation level 'a'). As all steps take one move, a breadth-first
+search suffices, and it stops as soon as a source is reached.
 """
 
 import aoc_tools as aoc
+from grid import Grid
+import search
 
 
 def main():
@@ -18,106 +21,54 @@ def main():
 
 
 def compute_shortest(filename, fix_source=True):
-    """Compute the length of the shortest path using Dijkstra's algorithm."""
+    """Compute the length of the shortest path using breadth-first search."""
     elevation, source, sink = set_heightmap(filename)
-    distances = compute_distances_from_sink(elevation, sink)
-    if fix_source:
-        return get_sink_source_distance(elevation, distances, source)
-    else:
-        return get_sink_source_distance(elevation, distances)
 
+    def is_source(idx):
+        """Check whether a square is the source or, if not fixed, any 'a'."""
+        if fix_source:
+            return idx == source
+        return elevation.cells[idx] == ord("a")
 
+    distances, nearest = compute_distances_from_sink(elevation, sink, is_source)
+    if nearest is None:
+        raise ValueError("Reaching the sink is impossible!")
+    return distances.cells[nearest]
+
+
+@aoc.cache_parsed()
 def set_heightmap(filename):
     """Read file input, and convert to numeric elevations."""
     elevation_lines = aoc.read_stripped_lines(filename)
-    source = next(
-        (
-            (i, line.index("S"))
-            for i, line in enumerate(elevation_lines)
-            if "S" in line
-        )
-    )
-    sink = next(
-        (
-            (i, line.index("E"))
-            for i, line in enumerate(elevation_lines)
-            if "E" in line
-        )
-    )
-    elevation_lines[source[0]] = elevation_lines[source[0]].replace("S", "a")
-    elevation_lines[sink[0]] = elevation_lines[sink[0]].replace("E", "z")
-    elevation = [[ord(char) for char in line] for line in elevation_lines]
+    # A border of elevation 0 is never climbable, so no bounds checks needed:
+    elevation = Grid.from_lines(elevation_lines, padding=1, border=0)
+    source = elevation.cells.index(ord("S"))
+    sink = elevation.cells.index(ord("E"))
+    elevation.cells[source] = ord("a")
+    elevation.cells[sink] = ord("z")
     return elevation, source, sink
 
 
-def compute_distances_from_sink(elevation, sink):
-    """Use Dijkstra's algorithm to compute all distances from the sink."""
-    grid_height = len(elevation)
-    grid_width = len(elevation[0])
-    upper_bound = grid_height * grid_width
-    distances = [[upper_bound] * grid_width for _ in range(grid_height)]
-    distances[sink[0]][sink[1]] = 0
-    has_been_visited = [[False] * grid_width for _ in range(grid_height)]
-
-    next_min_distance = 0
-    current_y = sink[0]
-    current_x = sink[1]
-
-    while next_min_distance < upper_bound:
-        has_been_visited[current_y][current_x] = True
-
-        neighbors = []
-        if current_y > 0:
-            neighbors.append((current_y - 1, current_x))
-        if current_y < grid_height - 1:
-            neighbors.append((current_y + 1, current_x))
-        if current_x > 0:
-            neighbors.append((current_y, current_x - 1))
-        if current_x < grid_width - 1:
-            neighbors.append((current_y, current_x + 1))
-        for neighbor_y, neighbor_x in neighbors:
-            if (
-                elevation[neighbor_y][neighbor_x]
-                >= elevation[current_y][current_x] - 1
-                and not has_been_visited[neighbor_y][neighbor_x]
-            ):
-                distances[neighbor_y][neighbor_x] = min(
-                    distances[neighbor_y][neighbor_x],
-                    distances[current_y][current_x] + 1,
-                )
-
-        next_min_distance = upper_bound
-        for idx_y in range(grid_height):
-            for idx_x in range(grid_width):
-                if (
-                    not has_been_visited[idx_y][idx_x]
-                    and distances[idx_y][idx_x] < next_min_distance
-                ):
-                    next_min_distance = distances[idx_y][idx_x]
-                    current_y = idx_y
-                    current_x = idx_x
-    return distances
-
-
-def get_sink_source_distance(elevation, distances, source=None):
-    """Select the distance to the given source or to the best source."""
-    grid_height = len(elevation)
-    grid_width = len(elevation[0])
-    upper_bound = grid_height * grid_width
-
-    if source is not None:
-        shortest_length = distances[source[0]][source[1]]
-    else:
-        shortest_length = upper_bound
-        for idx_y in range(grid_height):
-            for idx_x in range(grid_width):
-                if elevation[idx_y][idx_x] == ord("a"):
-                    shortest_length = min(
-                        shortest_length, distances[idx_y][idx_x]
-                    )
-    if shortest_length == upper_bound:
-        raise ValueError("Reaching the sink is impossible!")
-    return shortest_length
+@aoc.instrument
+def compute_distances_from_sink(elevation, sink, is_source=None):
+    """Use breadth-first search to compute distances from the sink."""
+    level = elevation.cells
+    offsets = elevation.neighbor_offsets
+    distances = Grid(
+        elevation.height, elevation.width, search.UNREACHED, 1, typecode="l"
+    )
+
+    def neighbors(idx):
+        """Yield the squares from which one can climb to the given square."""
+        min_level = level[idx] - 1
+        for offset in offsets:
+            if level[idx + offset] >= min_level:
+                yield idx + offset
+
+    _, nearest = search.breadth_first_search(
+        [sink], neighbors, is_source, distances.cells
+    )
+    return distances, nearest
 
 
 if __name__ == "__main__":
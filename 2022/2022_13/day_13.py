@@ -52,6 +52,7 @@ def compare(left, right):
     return -1 if is_correct else 1
 
 
+@aoc.instrument
 def check_order(left, right):
     """Recursively check whether nested lists (packets) are in right order."""
     is_correct = False
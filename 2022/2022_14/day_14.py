@@ -1,9 +1,16 @@
-"""Solution --- Day 14: Regolith Reservoir ---"""
+"""
+Solution --- Day 14: Regolith Reservoir ---
+
+With a floor, sand eventually comes to rest on every position that it can reach,
+i.e. every position not blocked by rock that is below, diagonally below-left, or
+diagonally below-right of a reachable position. With the numpy backend, these
+positions are determined a whole row at a time rather than a unit at a time.
+"""
 
-import copy
 import re
 
 import aoc_tools as aoc
+from grid import Grid
 
 SAND_ENTRANCE = (500, 0)
 FLOOR_DISTANCE = 2
@@ -22,9 +29,11 @@ def compute_rest_units(filename, has_floor=False):
     is_rock, min_x, max_y = initialize_grid(filename, has_floor)
     if not has_floor:
         is_occupied = simulate_without_floor(is_rock, min_x, max_y)
+    elif aoc.get_backend() == "numpy":
+        is_occupied = simulate_with_floor_numpy(is_rock, min_x)
     else:
         is_occupied = simulate_with_floor(is_rock, min_x)
-    return sum(sum(io) for io in is_occupied) - sum(sum(ir) for ir in is_rock)
+    return is_occupied.count(True) - is_rock.count(True)
 
 
 def initialize_grid(filename, has_floor):
@@ -48,7 +57,7 @@ def initialize_grid(filename, has_floor):
         max_y = comax_y + FLOOR_DISTANCE
         min_x = min(comin_x - 1, SAND_ENTRANCE[0] - max_y)
         max_x = max(comax_x + 1, SAND_ENTRANCE[0] + max_y)
-    is_rock = [[False] * (max_x - min_x + 1) for _ in range(max_y + 1)]
+    is_rock = Grid(max_y + 1, max_x - min_x + 1)
 
     # Set points on the rock path (and the floor) to True:
     for rock_path in rock_paths:
@@ -57,59 +66,85 @@ def initialize_grid(filename, has_floor):
                 start_y = min(rock_path[co_idx][1], rock_path[co_idx + 1][1])
                 end_y = max(rock_path[co_idx][1], rock_path[co_idx + 1][1])
                 for pos_y in range(start_y, end_y + 1):
-                    is_rock[pos_y][rock_path[co_idx][0] - min_x] = True
+                    is_rock[pos_y, rock_path[co_idx][0] - min_x] = True
             elif rock_path[co_idx][1] == rock_path[co_idx + 1][1]:
                 start_x = min(rock_path[co_idx][0], rock_path[co_idx + 1][0])
                 end_x = max(rock_path[co_idx][0], rock_path[co_idx + 1][0])
                 for pos_x in range(start_x, end_x + 1):
-                    is_rock[rock_path[co_idx][1]][pos_x - min_x] = True
+                    is_rock[rock_path[co_idx][1], pos_x - min_x] = True
     if has_floor:
         for pos_x in range(min_x, max_x + 1):
-            is_rock[max_y][pos_x - min_x] = True
+            is_rock[max_y, pos_x - min_x] = True
     return is_rock, min_x, max_y
 
 
+@aoc.instrument
 def simulate_without_floor(is_rock, min_x, max_y):
     """Simulate the falling of sand until it flows into the abyss."""
-    is_occupied = copy.deepcopy(is_rock)
-    into_abyss = False
-    while not into_abyss:
-        sand_x, sand_y = SAND_ENTRANCE
-        while not into_abyss:
-            if not is_occupied[sand_y + 1][sand_x - min_x]:
-                sand_y += 1
-            elif not is_occupied[sand_y + 1][sand_x - min_x - 1]:
-                sand_x -= 1
-                sand_y += 1
-            elif not is_occupied[sand_y + 1][sand_x - min_x + 1]:
-                sand_x += 1
-                sand_y += 1
+    is_occupied = is_rock.copy()
+    cells, stride = is_occupied.cells, is_occupied.stride
+    entrance = is_occupied.index(SAND_ENTRANCE[1], SAND_ENTRANCE[0] - min_x)
+    abyss = is_occupied.index(max_y, 0)
+    while True:
+        sand = entrance
+        while True:
+            below = sand + stride
+            if not cells[below]:
+                sand = below
+            elif not cells[below - 1]:
+                sand = below - 1
+            elif not cells[below + 1]:
+                sand = below + 1
             else:
-                is_occupied[sand_y][sand_x - min_x] = True
+                cells[sand] = True
                 break
-            into_abyss = sand_y == max_y
-    return is_occupied
+            if sand >= abyss:
+                return is_occupied
 
 
+@aoc.instrument
 def simulate_with_floor(is_rock, min_x):
     """Simulate the falling of sand until the source gets blocked."""
-    is_occupied = copy.deepcopy(is_rock)
-    while not is_occupied[0][SAND_ENTRANCE[0] - min_x]:
-        sand_x, sand_y = SAND_ENTRANCE
+    is_occupied = is_rock.copy()
+    cells, stride = is_occupied.cells, is_occupied.stride
+    entrance = is_occupied.index(SAND_ENTRANCE[1], SAND_ENTRANCE[0] - min_x)
+    while not cells[entrance]:
+        sand = entrance
         while True:
-            if not is_occupied[sand_y + 1][sand_x - min_x]:
-                sand_y += 1
-            elif not is_occupied[sand_y + 1][sand_x - min_x - 1]:
-                sand_x -= 1
-                sand_y += 1
-            elif not is_occupied[sand_y + 1][sand_x - min_x + 1]:
-                sand_x += 1
-                sand_y += 1
+            below = sand + stride
+            if not cells[below]:
+                sand = below
+            elif not cells[below - 1]:
+                sand = below - 1
+            elif not cells[below + 1]:
+                sand = below + 1
             else:
-                is_occupied[sand_y][sand_x - min_x] = True
+                cells[sand] = True
                 break
     return is_occupied
 
 
+@aoc.instrument
+def simulate_with_floor_numpy(is_rock, min_x):
+    """Determine the positions reachable by sand, a row at a time."""
+    np = aoc.import_numpy()
+    rock = np.frombuffer(is_rock.cells, dtype=np.uint8).reshape(
+        -1, is_rock.width
+    )
+    rock = rock.astype(bool)
+    is_reachable = np.zeros(rock.shape, dtype=bool)
+    is_reachable[SAND_ENTRANCE[1], SAND_ENTRANCE[0] - min_x] = True
+    for pos_y in range(SAND_ENTRANCE[1] + 1, len(rock)):
+        above = is_reachable[pos_y - 1]
+        row = above.copy()
+        row[1:] |= above[:-1]
+        row[:-1] |= above[1:]
+        is_reachable[pos_y] = row & ~rock[pos_y]
+
+    is_occupied = is_rock.copy()
+    is_occupied.cells[:] = (rock | is_reachable).astype(np.uint8).tobytes()
+    return is_occupied
+
+
 if __name__ == "__main__":
     main()
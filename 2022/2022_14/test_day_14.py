@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_14 as d14
 
 FILENAME = "input_14.txt"
@@ -29,5 +30,10 @@ class TestSolution(unittest.TestCase):
         self.assertEqual(rest_units, 29076)
 
 
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 14, with the numpy backend."""
+
+
 if __name__ == "__main__":
     unittest.main()
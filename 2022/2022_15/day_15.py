@@ -1,7 +1,5 @@
 """--- Day 15: Beacon Exclusion Zone ---"""
 
-import re
-
 import aoc_tools as aoc
 
 X_MULTIPLIER = 4_000_000
@@ -60,21 +58,15 @@ def calculate_tuning_frequency(filename, range_x, range_y):
     return pos_x * X_MULTIPLIER + pos_y * Y_MULTIPLIER
 
 
+@aoc.cache_parsed(copier=list)
 def initialize_sensors(filename):
     """Read input file, and initialize the sensors."""
-    sensor_lines = aoc.read_stripped_lines(filename)
-    sensor_regex = re.compile(
-        r"Sensor at x=(-?\d+), y=(-?\d+): "
-        r"closest beacon is at x=(-?\d+), y=(-?\d+)"
-    )
-    sensors = []
-    for line in sensor_lines:
-        sensor_data = sensor_regex.search(line).groups()
-        pos_x, pos_y, beacon_x, beacon_y = (int(x) for x in sensor_data)
-        sensors.append(Sensor(pos_x, pos_y, beacon_x, beacon_y))
-    return sensors
+    with aoc.read_mapped(filename) as buffer:
+        sensor_data = aoc.extract_ints(buffer, per_record=4)
+    return [Sensor(*record) for record in aoc.iter_records(sensor_data, 4)]
 
 
+@aoc.instrument
 def find_distress_beacon(sensors, range_x, range_y):
     """
     In an area with only one feasible distress beacon location, find the beacon.
@@ -188,6 +180,18 @@ def select_top_left_distances(sensors, range_x, range_y):
 class Sensor:
     """Class to represent a sensor."""
 
+    __slots__ = (
+        "pos_x",
+        "pos_y",
+        "beacon_x",
+        "beacon_y",
+        "radius",
+        "min_top_left",
+        "max_top_left",
+        "min_bottom_left",
+        "max_bottom_left",
+    )
+
     def __init__(self, pos_x, pos_y, beacon_x, beacon_y):
         """Create a sensor with a position and closest beacon position."""
         self.pos_x = pos_x
@@ -60,6 +60,17 @@ def maximize_pressure_release(filename, nr_minutes, nr_agents):
     return maximize_total(path_vals, nr_agents)
 
 
+def solve_parts(filename, nr_minutes=(30, 26)):
+    """Solve both parts, reading the input and computing distances once."""
+    init_valve, key_valves, dist = initialize_network(filename)
+    max_pressure_releases = []
+    for nr_agents, minutes in enumerate(nr_minutes, 1):
+        path_vals = evaluate_paths(init_valve, key_valves, dist, minutes)
+        max_pressure_releases.append(maximize_total(path_vals, nr_agents))
+    return tuple(max_pressure_releases)
+
+
+@aoc.cache_parsed()
 def initialize_network(filename):
     """Read file input, identify initial and key valves, compute distances."""
     valve_lines = aoc.read_stripped_lines(filename)
@@ -109,6 +120,7 @@ def compute_distances(valves, neighbor_sets):
     return dist
 
 
+@aoc.instrument
 def evaluate_paths(init_valve, key_valves, dist, nr_minutes):
     """
     Evaluate max pressure release for all single-path key-valve sets.
@@ -137,6 +149,7 @@ def evaluate_paths(init_valve, key_valves, dist, nr_minutes):
     pathset_vals[open_set] = value
     bench[open_set] = -1  # arbitrary value to ensure empty set is not dominated
     dominated = set()
+    best_value = value
 
     # Iteratively consider larger sets, and add new sets:
     for n in range(len(key_valves)):
@@ -170,6 +183,9 @@ def evaluate_paths(init_valve, key_valves, dist, nr_minutes):
                     cache[n + 1][new_open_set][v] = new_times_values
                     if local_max > pathset_vals[new_open_set]:
                         pathset_vals[new_open_set] = local_max
+                        best_value = max(best_value, local_max)
+        # Any single path is a lower bound, also if there are more agents:
+        aoc.report_progress(lower_bound=best_value, nr_valves_opened=n + 1)
 
     # Delete dominated sets:
     for open_set in dominated:
@@ -207,6 +223,7 @@ def maximize_total(pathset_vals, nr_agents):
         return pair_max_asymmetric(pathset_vals, combset_vals)
 
 
+@aoc.instrument
 def update_combined_values(pathset_vals, combset_vals=None):
     """Update combined-path sets and values if one more path can be selected."""
     break_symmetry = combset_vals is None
@@ -216,6 +233,7 @@ def update_combined_values(pathset_vals, combset_vals=None):
     max_index = 1 << max(pathset_vals).bit_length()
     cache = set()
 
+    @aoc.instrument
     def combine(key_index, open_set_1, open_set_2):
         """Assign indexed valve to the current path, next path(s), or none."""
         if break_symmetry:
@@ -251,6 +269,7 @@ def update_combined_values(pathset_vals, combset_vals=None):
     return new_combset_vals
 
 
+@aoc.instrument
 def pair_max_symmetric(pathset_vals):
     """Select a current-path set and a next-path set to maximize value sum."""
     slist = sorted(pathset_vals.items(), key=lambda x: x[1], reverse=True)
@@ -263,6 +282,7 @@ def pair_max_symmetric(pathset_vals):
                 break
             elif not open_set_1 & open_set_2:
                 max_value = value_1 + value_2
+                aoc.report_progress(lower_bound=max_value)
                 break
     return max_value
 
@@ -279,6 +299,7 @@ def pair_max_asymmetric(pathset_vals, combset_vals):
                 break
             elif not open_set_1 & open_set_2:
                 max_value = value_1 + value_2
+                aoc.report_progress(lower_bound=max_value)
                 break
     return max_value
 
@@ -286,6 +307,8 @@ def pair_max_asymmetric(pathset_vals, combset_vals):
 class Valve:
     """Class to represent a valve."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         """Create a valve, defined by its name."""
         self.name = name
@@ -294,6 +317,8 @@ class Valve:
 class KeyValve(Valve):
     """Class to represent a valve with a positive flow rate."""
 
+    __slots__ = ("flow_rate", "index")
+
     def __init__(self, name, flow_rate, index):
         """Create a valve with a name and flow rate, identified by an index."""
         super().__init__(name)
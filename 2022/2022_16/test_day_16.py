@@ -36,6 +36,11 @@ class TestSolution(unittest.TestCase):
         )
         self.assertEqual(max_pressure_release, 2790)
 
+    def test_solve_parts(self):
+        """Test whether both parts are solved from one shared parse."""
+        self.assertEqual(d16.solve_parts(FILENAME_EXAMPLE), (1651, 1707))
+        self.assertEqual(d16.solve_parts(FILENAME), (2059, 2790))
+
 
 if __name__ == "__main__":
     unittest.main()
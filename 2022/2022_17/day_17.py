@@ -4,10 +4,13 @@ Solution --- Day 17: Pyroclastic Flow ---
 Simulate the falling of rocks until a repetition is detected (in that the next
 shape, jet index, and relevant aspects of the pattern of stopped rocks in the
 chamber have occurred before) or until the maximum number of rocks has been
-reached, whichever occurs first.
+reached, whichever occurs first. The chamber is a board of bitset rows going
+upward (see bitset.py), with a bit set per stopped-rock unit, so that collisions
+of a rock with the chamber are checked a whole row at a time.
 """
 
 import aoc_tools as aoc
+import bitset
 
 CHAMBER_WIDTH = 7
 HORZ_DIST = 2
@@ -67,18 +70,19 @@ def simulate_falling_rocks(filename, nr_rocks):
 
 def initialize_simulation(filename):
     """Initialize the chamber, the jet pattern, and the shapes."""
-    chamber = [[False] * CHAMBER_WIDTH for _ in range(VERT_DIST)]
+    chamber = [0] * VERT_DIST
     jet_pattern = aoc.read_stripped(filename)
     shapes = [Shape(units) for units in SHAPE_UNITS]
     return chamber, jet_pattern, shapes
 
 
+@aoc.instrument
 def determine_depths(chamber):
     """Determine the depth of the latest stopped rock in every column."""
     depths = []
     for col in range(CHAMBER_WIDTH):
         row = len(chamber) - VERT_DIST
-        while not chamber[row][col] and row > 0:
+        while not chamber[row] >> col & 1 and row > 0:
             row -= 1
         depths.append(len(chamber) - row)
     return tuple(depths)
@@ -89,6 +93,7 @@ def check_repetition(state_history, jet_idx, shape_idx, depths):
     return state_history.get((jet_idx, shape_idx, depths))
 
 
+@aoc.instrument
 def simulate_single_rock(chamber, jet_pattern, jet_idx, shape):
     """Simulate the falling of a rock."""
     bottom_left_x = HORZ_DIST
@@ -108,48 +113,59 @@ def simulate_single_rock(chamber, jet_pattern, jet_idx, shape):
         bottom_left_y -= 1
 
     # Thereafter, check for floor or stopped rock collisions:
-    while bottom_left_y > 0 and not any(
-        chamber[bottom_left_y + u[0] - 1][bottom_left_x + u[1]]
-        for u in shape.units
+    while bottom_left_y > 0 and not shape.collides(
+        chamber, bottom_left_x, bottom_left_y - 1
     ):
         bottom_left_y -= 1
         if jet_pattern[jet_idx] == "<":
-            if bottom_left_x > 0 and not any(
-                chamber[bottom_left_y + u[0]][bottom_left_x + u[1] - 1]
-                for u in shape.units
+            if bottom_left_x > 0 and not shape.collides(
+                chamber, bottom_left_x - 1, bottom_left_y
             ):
                 bottom_left_x -= 1
         elif jet_pattern[jet_idx] == ">":
-            if bottom_left_x < CHAMBER_WIDTH - shape.width and not any(
-                chamber[bottom_left_y + u[0]][bottom_left_x + u[1] + 1]
-                for u in shape.units
+            if bottom_left_x < CHAMBER_WIDTH - shape.width and not (
+                shape.collides(chamber, bottom_left_x + 1, bottom_left_y)
             ):
                 bottom_left_x += 1
         jet_idx = (jet_idx + 1) % len(jet_pattern)
 
     # The rock has come to rest:
-    for u in shape.units:
-        chamber[bottom_left_y + u[0]][bottom_left_x + u[1]] = True
+    bitset.stamp(chamber, shape.rows[bottom_left_x], bottom_left_y)
 
     # Add rows to chamber to ensure VERT_DIST on top of highest stopped rock:
     if bottom_left_y + shape.height > len(chamber) - VERT_DIST:
         for _ in range(bottom_left_y + shape.height - len(chamber) + VERT_DIST):
-            chamber.append([False] * CHAMBER_WIDTH)
+            chamber.append(0)
     return jet_idx
 
 
 class Shape:
     """Class to represent a rock shape."""
 
+    __slots__ = ("units", "height", "width", "rows")
+
     def __init__(self, units):
-        """Create a shape, and set its height and width."""
+        """Create a shape, and set its height, width, and rows per x-offset."""
         self.units = units
         self.height = max(u[0] for u in self.units) + 1
         self.width = max(u[1] for u in self.units) + 1
+        shape_rows = [0] * self.height
+        for unit_y, unit_x in units:
+            shape_rows[unit_y] |= 1 << unit_x
+        self.rows = [
+            tuple(
+                bitset.shift_east(row, CHAMBER_WIDTH, x) for row in shape_rows
+            )
+            for x in range(CHAMBER_WIDTH - self.width + 1)
+        ]
 
         # Violating the following condition would lead to IndexErrors later on:
         assert self.height <= VERT_DIST
 
+    def collides(self, chamber, bottom_left_x, bottom_left_y):
+        """Check whether the shape at a position overlaps with stopped rock."""
+        return bitset.overlaps(chamber, self.rows[bottom_left_x], bottom_left_y)
+
 
 if __name__ == "__main__":
     main()
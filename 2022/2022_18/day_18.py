@@ -1,9 +1,15 @@
-"""Solution --- Day 18: Boiling Boulders ---"""
+"""
+Solution --- Day 18: Boiling Boulders ---
+
+With the numpy backend, the outer surface is computed on a box of voxels: the
+accessible empty space grows from the outside by one voxel in every direction
+at a time, until it no longer changes.
+"""
 
-from itertools import product
 import re
 
 import aoc_tools as aoc
+import search
 
 
 def main():
@@ -19,10 +25,13 @@ def calculate_surface(filename, outer=False):
     cube_list = set_cubes(filename)
     if not outer:
         return check_facets(cube_list)
+    elif aoc.get_backend() == "numpy":
+        return check_outer_facets_numpy(cube_list)
     else:
         return check_outer_facets(cube_list, map_accessibility(cube_list))
 
 
+@aoc.cache_parsed()
 def set_cubes(filename):
     """Read file input, and create a set with cube coordinates."""
     cube_lines = aoc.read_stripped_lines(filename)
@@ -52,59 +61,86 @@ def check_facets(cube_set):
     return droplet_surface
 
 
+@aoc.instrument
 def map_accessibility(cube_set):
     """
-    Determine whether empty spaces are accessible from outside.
+    Determine which empty spaces are accessible from outside.
 
-    A box containing the droplet in its iterior is created. With the outside
-    initialized as accessible, the procedure iteratively identifies accessible
-    empty spaces in the interior until all such spaces have been identified.
+    A box containing the droplet in its interior is created. Starting from a
+    corner of the box, which is outside the droplet, a breadth-first search
+    through the empty spaces of the box identifies all accessible ones.
     """
     bmin = [min(c[i] for c in cube_set) - 1 for i in range(3)]
     bmax = [max(c[i] for c in cube_set) + 1 for i in range(3)]
-    box_list = list(product(*[range(bmin[i], bmax[i] + 1) for i in range(3)]))
-    interior = list(product(*[range(bmin[i] + 1, bmax[i]) for i in range(3)]))
-
-    is_accessible = {pos: True for pos in box_list}
-    for pos in interior:
-        is_accessible[pos] = False
 
-    is_complete = False
-    while not is_complete:
-        is_complete = True
-        for i, j, k in interior:
-            if (i, j, k) not in cube_set and not is_accessible[(i, j, k)]:
+    def neighbors(pos):
+        """Yield the empty spaces in the box adjacent to a given space."""
+        for axis in range(3):
+            for step in (-1, 1):
+                neighbor = list(pos)
+                neighbor[axis] += step
+                neighbor = tuple(neighbor)
                 if (
-                    is_accessible[(i - 1, j, k)]
-                    or is_accessible[(i + 1, j, k)]
-                    or is_accessible[(i, j - 1, k)]
-                    or is_accessible[(i, j + 1, k)]
-                    or is_accessible[(i, j, k - 1)]
-                    or is_accessible[(i, j, k + 1)]
+                    bmin[axis] <= neighbor[axis] <= bmax[axis]
+                    and neighbor not in cube_set
                 ):
-                    is_accessible[(i, j, k)] = True
-                    is_complete = False
+                    yield neighbor
+
+    is_accessible, _ = search.breadth_first_search([tuple(bmin)], neighbors)
     return is_accessible
 
 
+@aoc.instrument
 def check_outer_facets(cube_set, is_accessible):
     """For all facets, check whether they connect to accessible empty space."""
     droplet_surface = 0
     for cube in cube_set:
-        if is_accessible[(cube[0] + 1, cube[1], cube[2])]:
+        if (cube[0] + 1, cube[1], cube[2]) in is_accessible:
             droplet_surface += 1
-        if is_accessible[(cube[0] - 1, cube[1], cube[2])]:
+        if (cube[0] - 1, cube[1], cube[2]) in is_accessible:
             droplet_surface += 1
-        if is_accessible[(cube[0], cube[1] + 1, cube[2])]:
+        if (cube[0], cube[1] + 1, cube[2]) in is_accessible:
             droplet_surface += 1
-        if is_accessible[(cube[0], cube[1] - 1, cube[2])]:
+        if (cube[0], cube[1] - 1, cube[2]) in is_accessible:
             droplet_surface += 1
-        if is_accessible[(cube[0], cube[1], cube[2] + 1)]:
+        if (cube[0], cube[1], cube[2] + 1) in is_accessible:
             droplet_surface += 1
-        if is_accessible[(cube[0], cube[1], cube[2] - 1)]:
+        if (cube[0], cube[1], cube[2] - 1) in is_accessible:
             droplet_surface += 1
     return droplet_surface
 
 
+@aoc.instrument
+def check_outer_facets_numpy(cube_set):
+    """Flood the box around the droplet, and count facets next to the flood."""
+    np = aoc.import_numpy()
+    cubes = np.array(sorted(cube_set))
+    # Leave an empty layer around the droplet, and another to avoid wrapping:
+    cubes -= cubes.min(axis=0) - 2
+    is_cube = np.zeros(tuple(cubes.max(axis=0) + 3), dtype=bool)
+    is_cube[tuple(cubes.T)] = True
+    is_interior = np.zeros(is_cube.shape, dtype=bool)
+    is_interior[1:-1, 1:-1, 1:-1] = True
+
+    is_accessible = ~is_interior
+    is_complete = False
+    while not is_complete:
+        grown = is_accessible.copy()
+        for axis in range(3):
+            grown |= np.roll(is_accessible, 1, axis)
+            grown |= np.roll(is_accessible, -1, axis)
+        grown &= ~is_cube
+        is_complete = np.array_equal(grown, is_accessible)
+        is_accessible = grown
+
+    droplet_surface = 0
+    for axis in range(3):
+        for shift in (1, -1):
+            droplet_surface += int(
+                (is_cube & np.roll(is_accessible, shift, axis)).sum()
+            )
+    return droplet_surface
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_18 as d18
 
 FILENAME = "input_18.txt"
@@ -29,5 +30,10 @@ class TestSolution(unittest.TestCase):
         self.assertEqual(droplet_surface, 2006)
 
 
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 18, with the numpy backend."""
+
+
 if __name__ == "__main__":
     unittest.main()
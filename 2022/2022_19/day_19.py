@@ -50,7 +50,6 @@ then the maximum value-to-go will be higher or equal.
 """
 
 import math
-import re
 
 import aoc_tools as aoc
 
@@ -66,24 +65,38 @@ def main():
 def summarize_evaluations(filename, nr_minutes, max_blueprints=None):
     """Generate summary statistics of (a number of) evaluated blueprints."""
     blueprints = set_blueprints(filename, max_blueprints)
-    max_geodes = [evaluate_blueprint(bp, nr_minutes) for bp in blueprints]
+    max_geodes = []
+    for bp in blueprints:
+        max_geodes.append(evaluate_blueprint(bp, nr_minutes))
+        aoc.report_progress(max_geodes=max_geodes[:])
     quality_levels = [mg * bp.id_num for mg, bp in zip(max_geodes, blueprints)]
     return math.prod(max_geodes), sum(quality_levels)
 
 
+def solve_parts(filename, nr_minutes=(24, 32), max_blueprints=3):
+    """Solve both parts, reading the input and creating blueprints once."""
+    blueprints = read_blueprints(filename)
+    max_geodes = [evaluate_blueprint(bp, nr_minutes[0]) for bp in blueprints]
+    quality_levels = [mg * bp.id_num for mg, bp in zip(max_geodes, blueprints)]
+    max_geodes = [
+        evaluate_blueprint(bp, nr_minutes[1])
+        for bp in blueprints[:max_blueprints]
+    ]
+    return sum(quality_levels), math.prod(max_geodes)
+
+
 def set_blueprints(filename, max_blueprints=None):
     """Read file input, and initialize (a number of) blueprints."""
-    blueprint_lines = aoc.read_stripped_lines(filename)
-    if max_blueprints is not None and len(blueprint_lines) > max_blueprints:
-        blueprint_lines = blueprint_lines[:max_blueprints]
-    blueprint_regex = re.compile(
-        r"Blueprint (\d+): Each ore robot costs (\d+) ore. Each clay robot "
-        r"costs (\d+) ore. Each obsidian robot costs (\d+) ore and (\d+) clay. "
-        r"Each geode robot costs (\d+) ore and (\d+) obsidian."
-    )
+    return read_blueprints(filename)[:max_blueprints]
+
+
+@aoc.cache_parsed()
+def read_blueprints(filename):
+    """Read file input, and initialize all blueprints."""
+    with aoc.read_mapped(filename) as buffer:
+        numbers = aoc.extract_ints(buffer, per_record=7)
     blueprints = []
-    for line in blueprint_lines:
-        blueprint_data = [int(x) for x in blueprint_regex.search(line).groups()]
+    for blueprint_data in aoc.iter_records(numbers, 7):
         cost = {"ore": {}, "cla": {}, "obs": {}, "geo": {}}
         cost["ore"]["ore"] = blueprint_data[1]
         cost["cla"]["ore"] = blueprint_data[2]
@@ -95,6 +108,7 @@ def set_blueprints(filename, max_blueprints=None):
     return blueprints
 
 
+@aoc.instrument
 def evaluate_blueprint(bp, nr_minutes):
     """For a given blueprint, compute the maximum number of geodes to open."""
     nodes = [{} for _ in range(nr_minutes + 1)]
@@ -115,6 +129,7 @@ def evaluate_blueprint(bp, nr_minutes):
                 if new_v > max_value:
                     nodes[new_ttg][new_s] = new_v
                     max_value = new_v
+                    aoc.report_progress(blueprint=bp.id_num, lower_bound=new_v)
                 # Check whether the node could improve on the best LB:
                 elif new_v + new_ttg * (new_ttg - 1) / 2 > max_value:
                     # The node might already exist with a higher value:
@@ -123,6 +138,7 @@ def evaluate_blueprint(bp, nr_minutes):
     return max_value
 
 
+@aoc.instrument
 def prune_using_monotonicity(node_list):
     """
     Prune monotonicity-dominated state-value tuples.
@@ -153,6 +169,7 @@ def prune_using_monotonicity(node_list):
         return pruned_list
 
 
+@aoc.instrument
 def generate_successors(bp, state, value, time_to_go):
     """
     Given a current node, create its successor nodes by building robot types.
@@ -321,6 +338,8 @@ def postprocess_state(bp, resources, robots, time_to_go):
 class Blueprint:
     """Class to represent a blueprint for the robot factory."""
 
+    __slots__ = ("id_num", "cost")
+
     def __init__(self, id_num, cost):
         """Create a blueprint, defined by an id and a cost dictionary."""
         self.id_num = id_num
@@ -330,6 +349,8 @@ class Blueprint:
 class State:
     """Class to represent a state in the branch-and-bound algorithm."""
 
+    __slots__ = ("resources", "robots")
+
     def __init__(self, resources, robots):
         """Create a state defined by (non-geode) resource and robot levels."""
         self.resources = resources
@@ -34,6 +34,11 @@ class TestSolution(unittest.TestCase):
         )
         self.assertEqual(max_geode_multiple, 7200)
 
+    def test_solve_parts(self):
+        """Test whether both parts are solved from one shared parse."""
+        self.assertEqual(d19.solve_parts(FILENAME_EXAMPLE), (33, 56 * 62))
+        self.assertEqual(d19.solve_parts(FILENAME), (2193, 7200))
+
 
 if __name__ == "__main__":
     unittest.main()
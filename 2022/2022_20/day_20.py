@@ -40,6 +40,7 @@ def initialize_numbers(filename, decryption_key):
     return original_list, original_list[idx_zero]
 
 
+@aoc.instrument
 def mix_numbers(original_list):
     """Move all numbers in the order they originally appear in the file."""
     for node in original_list:
@@ -87,6 +88,8 @@ def get_grove_coordinates(node_zero, list_len):
 class MovingNumber:
     """Class to represent a number that is being moved in the mixing process."""
 
+    __slots__ = ("number", "left", "right", "shift")
+
     def __init__(self, number):
         """Create a moving number to use as node in a circularly linked list."""
         self.number = number
@@ -46,6 +46,7 @@ def initialize_monkeys(filename, override_humn):
     return monkeys, root_monkey
 
 
+@aoc.instrument
 def yell_numbers(monkeys, root_monkey, override_humn):
     """Simulate yelling of linear expressions until root inputs are known."""
     while any(i.constant is None for i in root_monkey.inputs):
@@ -62,12 +63,17 @@ def yell_numbers(monkeys, root_monkey, override_humn):
         num = root_monkey.inputs[1].constant - root_monkey.inputs[0].constant
         denom = root_monkey.inputs[0].slope - root_monkey.inputs[1].slope
         answer = num / denom
-    return int(answer) if answer.is_integer() else answer
+    # Without divisions, the answer is an integer already:
+    if isinstance(answer, float) and answer.is_integer():
+        answer = int(answer)
+    return answer
 
 
 class Monkey:
     """Class to represent a monkey."""
 
+    __slots__ = ("name", "constant", "slope", "inputs", "operation")
+
     def __init__(self, name, constant=None, slope=None):
         """Create a named monkey with (possibly) a constant or coefficient."""
         self.name = name
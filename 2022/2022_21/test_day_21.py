@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import day_21 as d21
 
@@ -28,6 +30,17 @@ class TestSolution(unittest.TestCase):
         humn_number = d21.calculate_number(FILENAME, override_humn=True)
         self.assertEqual(humn_number, 3882224466191)
 
+    def test_without_divisions(self):
+        """Test whether monkeys that never divide yield integer answers."""
+        file_descriptor, filename = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "w") as file_object:
+            file_object.write("root: abcd + humn\nabcd: 3\nhumn: 4\n")
+        try:
+            self.assertEqual(d21.calculate_number(filename), 7)
+            self.assertEqual(d21.calculate_number(filename, True), 3)
+        finally:
+            os.remove(filename)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,7 @@ def compute_password(filename_map, filename_moves, part=2):
     )
 
 
+@aoc.cache_parsed()
 def read_moves(filename_moves):
     """Read file input, and generate a list of one-move strings."""
     move_regex = re.compile(r"([LR]\d+)")
@@ -49,6 +50,7 @@ def read_moves(filename_moves):
     return move_regex.findall(move_string)
 
 
+@aoc.cache_parsed(copier=dict)
 def read_map(filename_map):
     """Read file input, and set the tiles for all cube net positions."""
     map_lines = aoc.read_stripped_lines(filename_map)
@@ -92,6 +94,7 @@ def read_map(filename_map):
     return cube_net
 
 
+@aoc.instrument
 def fold_cube_net(cube_net):
     """Fold a cube net and (arbitrarily) position it in a 3D grid."""
     # Arbitrarily set the bottom facet:
@@ -256,6 +259,7 @@ def create_tile_transition_fu(facing_1, facing_2, edge_length):
     return fu, mir_fu
 
 
+@aoc.instrument
 def simulate_moves(move_list, facets, f_transitions, t_transitions):
     """
     Simulate the path, and obtain the final row, column, and facing.
@@ -368,6 +372,18 @@ def simulate_moves(move_list, facets, f_transitions, t_transitions):
 class Facet:
     """Class to represent a cube facet."""
 
+    __slots__ = (
+        "cn_position",
+        "is_wall",
+        "bl",
+        "br",
+        "tl",
+        "tr",
+        "dim",
+        "entry",
+        "exit",
+    )
+
     def __init__(self, cn_position, is_wall, bl, br, tl, tr):
         """
         Create a facet with tiles, positioned in a 3D grid.
@@ -1,6 +1,22 @@
-"""Solution --- Day 23: Unstable Diffusion ---"""
+"""
+Solution --- Day 23: Unstable Diffusion ---
+
+Three engines are provided. The 'elves' engine simulates the elves one by one.
+The 'bitset' engine (the default) represents the elf positions as a list of
+rows, each an int with a bit set per elf, and simulates a whole row of elves per
+operation: e.g. the elves that cannot move north are those whose row, shifted
+by -1, 0, or +1 columns, overlaps with the row above. Only elves proposing
+opposite moves can propose the same position, so conflicts are found by
+comparing the north and south proposals two rows apart, and the west and east
+proposals two columns apart. The 'numpy' engine (the default with the numpy
+backend) simulates all elves at once on a boolean array.
+"""
 
 import aoc_tools as aoc
+import bitset
+from grid import Grid
+
+ARRAY_PADDING = 10
 
 
 def main():
@@ -11,8 +27,16 @@ def main():
     print(f"The first round without moves is {nr_rounds}.")
 
 
-def simulate_elves(filename, max_rounds=None):
+def simulate_elves(filename, max_rounds=None, engine=None):
     """Simulate movements for a given number of rounds or until completion."""
+    if engine is None:
+        engine = "numpy" if aoc.get_backend() == "numpy" else "bitset"
+    if engine == "bitset":
+        return simulate_board(filename, max_rounds)
+    elif engine == "numpy":
+        return simulate_array(filename, max_rounds)
+    elif engine != "elves":
+        raise ValueError(f"Unknown engine {engine}!")
     elves = initialize_elves(filename)
     idx_preferred_direction = 0
     is_complete = False
@@ -31,6 +55,173 @@ def simulate_elves(filename, max_rounds=None):
     return empty_tiles, nr_rounds
 
 
+def simulate_board(filename, max_rounds=None):
+    """Simulate movements of the elves as a board of bitset rows."""
+    board = initialize_board(filename)
+    idx_preferred_direction = 0
+    is_complete = False
+    empty_tiles = None
+    nr_rounds = 0
+
+    while not is_complete:
+        nr_rounds += 1
+        board, is_complete = simulate_round(
+            pad_board(board), idx_preferred_direction
+        )
+        idx_preferred_direction = (idx_preferred_direction + 1) % 4
+        if max_rounds is not None and nr_rounds == max_rounds:
+            break
+    if max_rounds is not None:
+        min_x, max_x, min_y, max_y = bitset.bounding_box(board)
+        rectangle = (max_x - min_x + 1) * (max_y - min_y + 1)
+        empty_tiles = rectangle - bitset.count(board)
+    return empty_tiles, nr_rounds
+
+
+def initialize_board(filename):
+    """Read file input, and initialize the board of elf positions."""
+    return bitset.from_lines(aoc.read_stripped_lines(filename))
+
+
+def pad_board(board):
+    """Trim the board to the elves, and pad by two empty rows and a column."""
+    rows_y = [idx_y for idx_y, row in enumerate(board) if row]
+    board = [0, 0] + board[rows_y[0] : rows_y[-1] + 1] + [0, 0]
+    if any(row & 1 for row in board):
+        board = [row << 1 for row in board]
+    return board
+
+
+@aoc.instrument
+def simulate_round(board, idx_preferred_direction):
+    """Simulate the proposals and moves of all elves, a row at a time."""
+    nr_rows = len(board)
+    # Proposed moves north, south, west, and east, per row:
+    proposals = [[0] * nr_rows for _ in range(4)]
+    for idx_y in range(1, nr_rows - 1):
+        row = board[idx_y]
+        if not row:
+            continue
+        above, below = board[idx_y - 1], board[idx_y + 1]
+        column = above | row | below
+        # Per direction, the elves having another elf in that direction:
+        is_blocked = (
+            above | above << 1 | above >> 1,
+            below | below << 1 | below >> 1,
+            column << 1,
+            column >> 1,
+        )
+        pending = row & (is_blocked[0] | is_blocked[1] | row << 1 | row >> 1)
+        for shift in range(4):
+            idx_direction = (idx_preferred_direction + shift) % 4
+            proposal = pending & ~is_blocked[idx_direction]
+            proposals[idx_direction][idx_y] = proposal
+            pending &= ~proposal
+
+    # Execute the proposals that do not conflict with an opposite proposal:
+    north, south, west, east = [[0] * nr_rows for _ in range(4)]
+    for idx_y in range(2, nr_rows - 2):
+        north[idx_y] = proposals[0][idx_y] & ~proposals[1][idx_y - 2]
+        south[idx_y] = proposals[1][idx_y] & ~proposals[0][idx_y + 2]
+        west[idx_y] = proposals[2][idx_y] & ~(proposals[3][idx_y] << 2)
+        east[idx_y] = proposals[3][idx_y] & ~(proposals[2][idx_y] >> 2)
+    new_board = [0] * nr_rows
+    is_complete = True
+    for idx_y in range(1, nr_rows - 1):
+        moves = north[idx_y] | south[idx_y] | west[idx_y] | east[idx_y]
+        if moves:
+            is_complete = False
+        new_board[idx_y] = (
+            (board[idx_y] & ~moves)
+            | north[idx_y + 1]
+            | south[idx_y - 1]
+            | west[idx_y] >> 1
+            | east[idx_y] << 1
+        )
+    return new_board, is_complete
+
+
+def simulate_array(filename, max_rounds=None):
+    """Simulate movements of the elves as a boolean NumPy array."""
+    np = aoc.import_numpy()
+    is_elf = initialize_array(filename)
+    idx_preferred_direction = 0
+    is_complete = False
+    empty_tiles = None
+    nr_rounds = 0
+
+    while not is_complete:
+        nr_rounds += 1
+        # Keep an empty margin of two, such that rolled arrays do not wrap:
+        if (
+            is_elf[:2].any()
+            or is_elf[-2:].any()
+            or is_elf[:, :2].any()
+            or is_elf[:, -2:].any()
+        ):
+            is_elf = np.pad(is_elf, ARRAY_PADDING)
+        is_elf, is_complete = simulate_array_round(
+            is_elf, idx_preferred_direction
+        )
+        idx_preferred_direction = (idx_preferred_direction + 1) % 4
+        if max_rounds is not None and nr_rounds == max_rounds:
+            break
+    if max_rounds is not None:
+        rows_y, cols_x = np.nonzero(is_elf)
+        rectangle = (np.ptp(rows_y) + 1) * (np.ptp(cols_x) + 1)
+        empty_tiles = int(rectangle) - len(rows_y)
+    return empty_tiles, nr_rounds
+
+
+@aoc.instrument
+def simulate_array_round(is_elf, idx_preferred_direction):
+    """Simulate the proposals and moves of all elves at once."""
+    np = aoc.import_numpy()
+
+    def has_elf(step_y, step_x):
+        """Mark the positions with an elf at the given step from them."""
+        return np.roll(is_elf, (-step_y, -step_x), axis=(0, 1))
+
+    north, south = has_elf(-1, 0), has_elf(1, 0)
+    west, east = has_elf(0, -1), has_elf(0, 1)
+    north_west, north_east = has_elf(-1, -1), has_elf(-1, 1)
+    south_west, south_east = has_elf(1, -1), has_elf(1, 1)
+    is_blocked = (
+        north | north_west | north_east,
+        south | south_west | south_east,
+        west | north_west | south_west,
+        east | north_east | south_east,
+    )
+    pending = is_elf & (is_blocked[0] | is_blocked[1] | west | east)
+    proposals = [None] * 4
+    for shift in range(4):
+        idx_direction = (idx_preferred_direction + shift) % 4
+        proposals[idx_direction] = pending & ~is_blocked[idx_direction]
+        pending &= ~proposals[idx_direction]
+
+    # Count the proposals per position, and execute the unique ones:
+    steps = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    targets = [
+        np.roll(proposal, step, axis=(0, 1))
+        for proposal, step in zip(proposals, steps)
+    ]
+    is_unique = sum(target.astype(np.int8) for target in targets) == 1
+    has_moved = np.zeros(is_elf.shape, dtype=bool)
+    for proposal, step in zip(proposals, steps):
+        has_moved |= proposal & np.roll(
+            is_unique, (-step[0], -step[1]), axis=(0, 1)
+        )
+    new_is_elf = (is_elf & ~has_moved) | is_unique
+    return new_is_elf, not has_moved.any()
+
+
+def initialize_array(filename):
+    """Read file input, and initialize a boolean array of elf positions."""
+    np = aoc.import_numpy()
+    grid_lines = aoc.read_stripped_lines(filename)
+    return np.array([[char == "#" for char in line] for line in grid_lines])
+
+
 def initialize_elves(filename):
     """Read file input, and initialize the elves."""
     grid_lines = aoc.read_stripped_lines(filename)
@@ -42,21 +233,22 @@ def initialize_elves(filename):
     return elves
 
 
+@aoc.instrument
 def simulate_proposals(elves, idx_preferred_direction):
     """Generate the proposed moves of all elves."""
     min_x, min_y, elf_grid = generate_pos_grid(elves)
+    cells, stride = elf_grid.cells, elf_grid.stride
     for elf in elves:
-        idx_y = elf.pos_y - min_y + 1
-        idx_x = elf.pos_x - min_x + 1
+        idx = elf_grid.index(elf.pos_y - min_y, elf.pos_x - min_x)
         if not (
-            elf_grid[idx_y - 1][idx_x - 1]
-            or elf_grid[idx_y - 1][idx_x]
-            or elf_grid[idx_y - 1][idx_x + 1]
-            or elf_grid[idx_y][idx_x - 1]
-            or elf_grid[idx_y][idx_x + 1]
-            or elf_grid[idx_y + 1][idx_x - 1]
-            or elf_grid[idx_y + 1][idx_x]
-            or elf_grid[idx_y + 1][idx_x + 1]
+            cells[idx - stride - 1]
+            or cells[idx - stride]
+            or cells[idx - stride + 1]
+            or cells[idx - 1]
+            or cells[idx + 1]
+            or cells[idx + stride - 1]
+            or cells[idx + stride]
+            or cells[idx + stride + 1]
         ):
             elf.is_pending = False
         else:
@@ -65,36 +257,36 @@ def simulate_proposals(elves, idx_preferred_direction):
                 idx_direction = (idx_preferred_direction + shift) % 4
                 if idx_direction == 0:
                     if not (
-                        elf_grid[idx_y - 1][idx_x - 1]
-                        or elf_grid[idx_y - 1][idx_x]
-                        or elf_grid[idx_y - 1][idx_x + 1]
+                        cells[idx - stride - 1]
+                        or cells[idx - stride]
+                        or cells[idx - stride + 1]
                     ):
                         elf.proposal_x = elf.pos_x
                         elf.proposal_y = elf.pos_y - 1
                         elf.is_pending = True
                 elif idx_direction == 1:
                     if not (
-                        elf_grid[idx_y + 1][idx_x - 1]
-                        or elf_grid[idx_y + 1][idx_x]
-                        or elf_grid[idx_y + 1][idx_x + 1]
+                        cells[idx + stride - 1]
+                        or cells[idx + stride]
+                        or cells[idx + stride + 1]
                     ):
                         elf.proposal_x = elf.pos_x
                         elf.proposal_y = elf.pos_y + 1
                         elf.is_pending = True
                 elif idx_direction == 2:
                     if not (
-                        elf_grid[idx_y - 1][idx_x - 1]
-                        or elf_grid[idx_y][idx_x - 1]
-                        or elf_grid[idx_y + 1][idx_x - 1]
+                        cells[idx - stride - 1]
+                        or cells[idx - 1]
+                        or cells[idx + stride - 1]
                     ):
                         elf.proposal_x = elf.pos_x - 1
                         elf.proposal_y = elf.pos_y
                         elf.is_pending = True
                 elif idx_direction == 3:
                     if not (
-                        elf_grid[idx_y - 1][idx_x + 1]
-                        or elf_grid[idx_y][idx_x + 1]
-                        or elf_grid[idx_y + 1][idx_x + 1]
+                        cells[idx - stride + 1]
+                        or cells[idx + 1]
+                        or cells[idx + stride + 1]
                     ):
                         elf.proposal_x = elf.pos_x + 1
                         elf.proposal_y = elf.pos_y
@@ -102,15 +294,16 @@ def simulate_proposals(elves, idx_preferred_direction):
                 shift += 1
 
 
+@aoc.instrument
 def simulate_execution(elves):
     """Decide on the execution of proposed moves."""
     is_complete = True
     min_x, min_y, elf_grid = generate_proposal_grid(elves)
     for elf in elves:
         if elf.is_pending:
-            idx_y = elf.proposal_y - min_y + 1
-            idx_x = elf.proposal_x - min_x + 1
-            if elf_grid[idx_y][idx_x] == 1:
+            idx_y = elf.proposal_y - min_y
+            idx_x = elf.proposal_x - min_x
+            if elf_grid[idx_y, idx_x] == 1:
                 elf.pos_x = elf.proposal_x
                 elf.pos_y = elf.proposal_y
                 elf.is_pending = False
@@ -126,17 +319,13 @@ def generate_pos_grid(elves):
     """
     Generate a grid in which elf positions are marked as True.
 
-    An extra top and bottom row and extra left and right column is added to
-    avoid IndexErrors when elves are checking whether a direction is valid.
+    The grid is padded by one cell on every side to avoid IndexErrors when
+    elves are checking whether a direction is valid.
     """
     min_x, max_x, min_y, max_y = get_rectangle_dimensions(elves)
-    grid_height = max_y - min_y + 1 + 2
-    grid_width = max_x - min_x + 1 + 2
-    elf_grid = [[False] * grid_width for _ in range(grid_height)]
+    elf_grid = Grid(max_y - min_y + 1, max_x - min_x + 1, False, padding=1)
     for elf in elves:
-        idx_y = elf.pos_y - min_y + 1
-        idx_x = elf.pos_x - min_x + 1
-        elf_grid[idx_y][idx_x] = True
+        elf_grid[elf.pos_y - min_y, elf.pos_x - min_x] = True
     return min_x, min_y, elf_grid
 
 
@@ -144,18 +333,14 @@ def generate_proposal_grid(elves):
     """
     Generate a grid that counts the number of elves proposing a position.
 
-    An extra top and bottom row and extra left and right column is added because
-    elves' proposals can be outside the current smallest rectangle.
+    The grid is padded by one cell on every side because elves' proposals can
+    be outside the current smallest rectangle.
     """
     min_x, max_x, min_y, max_y = get_rectangle_dimensions(elves)
-    grid_height = max_y - min_y + 1 + 2
-    grid_width = max_x - min_x + 1 + 2
-    elf_grid = [[0] * grid_width for _ in range(grid_height)]
+    elf_grid = Grid(max_y - min_y + 1, max_x - min_x + 1, 0, padding=1)
     for elf in elves:
         if elf.is_pending:
-            idx_y = elf.proposal_y - min_y + 1
-            idx_x = elf.proposal_x - min_x + 1
-            elf_grid[idx_y][idx_x] += 1
+            elf_grid[elf.proposal_y - min_y, elf.proposal_x - min_x] += 1
     return min_x, min_y, elf_grid
 
 
@@ -177,6 +362,8 @@ def get_rectangle_dimensions(elves):
 class Elf:
     "Class to represent an elf."
 
+    __slots__ = ("pos_x", "pos_y", "proposal_x", "proposal_y", "is_pending")
+
     def __init__(self, pos_x, pos_y):
         "Create an elf, with a position and (possibly pending) proposal."
         self.pos_x = pos_x
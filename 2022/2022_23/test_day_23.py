@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_23 as d23
 
 FILENAME = "input_23.txt"
@@ -32,6 +33,20 @@ class TestSolution(unittest.TestCase):
         _, nr_rounds = d23.simulate_elves(FILENAME)
         self.assertEqual(nr_rounds, 976)
 
+    def test_engines(self):
+        """Test whether the elves engine agrees with the bitset engine."""
+        for filename in FILENAMES_EXAMPLES:
+            for max_rounds in (10, None):
+                self.assertEqual(
+                    d23.simulate_elves(filename, max_rounds, engine="elves"),
+                    d23.simulate_elves(filename, max_rounds, engine="bitset"),
+                )
+
+
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 23, with the numpy backend."""
+
 
 if __name__ == "__main__":
     unittest.main()
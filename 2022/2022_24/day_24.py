@@ -1,17 +1,38 @@
 """
 Solution --- Day 24: Blizzard Basin ---
 
-Note that every grid_width * grid_height minutes, the locations of blizzards
-repeat themselves. If during such a cycle, it is not possible to get one 'step'
-closer to the sink, it follows that the sink can never be reached. Hence, if
-the sink can be reached, it takes at most (grid_height * grid_width) *
-(grid_height * grid_width + 1) minutes. Furthermore, if the sink can be reached
-from the source, then the source can be reached from the sink.
+Note that every grid_width * grid_height minutes (or, more precisely, every
+least common multiple of both), the locations of blizzards repeat themselves.
+Rather than moving every blizzard every minute, the blizzard-free positions at a
+given minute are derived from the initial map: a blizzard moving right or left
+is found by rotating its row, and a blizzard moving down or up by looking at an
+earlier or later row.
+
+Three engines are provided. The 'search' engine defines a state by a position
+and the minute modulo the period, and uses a breadth-first search over states.
+The 'bitset' engine (the default) keeps, per row, an int with a bit set for
+every position that can be reached at the current minute, and computes the
+positions reachable a minute later by shifting and combining whole rows. The
+'numpy' engine (the default with the numpy backend) does the same for all rows
+at once, on boolean arrays. In all cases, it follows that the sink cannot be
+reached if the reachable positions repeat themselves after a period.
 """
 
-import copy
+import math
 
 import aoc_tools as aoc
+import bitset
+from grid import Grid
+import search
+
+FREE_CELLS_CACHE_SIZE = 2
+
+# Translation tables marking the blizzards moving in a direction, and zeros:
+MASKS = {
+    char: bytes(int(chr(byte) == char) for byte in range(256))
+    for char in "><v^"
+}
+IS_ZERO = bytes([1]) + bytes(255)
 
 
 def main():
@@ -22,108 +43,209 @@ def main():
     print(f"Shortest path to twice reach the sink is {length_shortest} long.")
 
 
-def compute_shortest(filename, nr_sink_visits):
+def compute_shortest(filename, nr_sink_visits, engine=None):
     """Compute shortest back-and-forth path for given number of sink visits."""
-    blizzards, grid_height, grid_width = initialize_blizzards(filename)
-    grid_size = grid_width * grid_height
+    if engine is None:
+        engine = "numpy" if aoc.get_backend() == "numpy" else "bitset"
+    if engine == "bitset":
+        cross = cross_valley_by_rows
+    elif engine == "numpy":
+        cross = cross_valley_numpy
+    elif engine == "search":
+        cross = cross_valley
+    else:
+        raise ValueError(f"Unknown engine {engine}!")
+    valley = initialize_valley(filename)
     minutes = 0
-    no_reach = {
-        "source": False,
-        "in": [[False] * grid_width for _ in range(grid_height)],
-        "sink": False,
-    }
-
     for sink_visit in range(nr_sink_visits):
-        can_reach = copy.deepcopy(no_reach)
-        can_reach["source"] = True
-        while not can_reach["sink"]:
-            can_reach = dynamic_programming_update(blizzards, can_reach)
-            minutes += 1
-            if minutes == grid_size * (grid_size + 1):
-                raise ValueError("Reaching the sink is impossible!")
-
+        minutes = cross(valley, minutes, valley.source, valley.sink)
         if sink_visit < nr_sink_visits - 1:
-            can_reach = copy.deepcopy(no_reach)
-            can_reach["sink"] = True
-            while not can_reach["source"]:
-                can_reach = dynamic_programming_update(blizzards, can_reach)
-                minutes += 1
+            minutes = cross(valley, minutes, valley.sink, valley.source)
     return minutes
 
 
-def initialize_blizzards(filename):
-    """Read file input, and initialize the blizzards."""
+def initialize_valley(filename):
+    """Read file input, and initialize the valley."""
     grid_lines = aoc.read_stripped_lines(filename)
-    grid_height = len(grid_lines) - 2
-    grid_width = len(grid_lines[0]) - 2
-    blizzards = []
-    for idx_y in range(1, grid_height + 1):
-        for idx_x in range(1, grid_width + 1):
-            if not grid_lines[idx_y][idx_x] == ".":
-                blizzards.append(
-                    Blizzard(idx_x - 1, idx_y - 1, grid_lines[idx_y][idx_x])
-                )
-    return blizzards, grid_height, grid_width
-
-
-def dynamic_programming_update(blizzards, can_reach):
-    """Given reachable locations, identify reachables after one more minute."""
-    old_source = can_reach["source"]
-    old_sink = can_reach["sink"]
-    old_in = can_reach["in"]
-    grid_height = len(old_in)
-    grid_width = len(old_in[0])
-
-    for blizzard in blizzards:
-        blizzard.move(grid_height, grid_width)
-    is_blizzard = map_valley(blizzards, grid_height, grid_width)
-
-    new_source = old_source or old_in[0][0]
-    new_sink = old_sink or old_in[-1][-1]
-    new_in = [[False] * grid_width for _ in range(grid_height)]
-    for idx_y in range(grid_height):
-        for idx_x in range(grid_width):
-            new_in[idx_y][idx_x] = not is_blizzard[idx_y][idx_x] and (
-                old_in[idx_y][idx_x]
-                or (idx_y > 0 and old_in[idx_y - 1][idx_x])
-                or (idx_y < grid_height - 1 and old_in[idx_y + 1][idx_x])
-                or (idx_x > 0 and old_in[idx_y][idx_x - 1])
-                or (idx_x < grid_width - 1 and old_in[idx_y][idx_x + 1])
+    return Valley([line[1:-1] for line in grid_lines[1:-1]])
+
+
+@aoc.instrument
+def cross_valley(valley, minutes, start, end):
+    """Search for the earliest minute at which the end can be reached."""
+    size = valley.size
+    moves = (0, -valley.stride, valley.stride, -1, 1)
+
+    # A state is identified by the minute (modulo the period) and a position:
+    def neighbors(state):
+        """Yield the states that can be reached in the next minute."""
+        minute, idx = divmod(state, size)
+        minute = (minute + 1) % valley.period
+        is_free = valley.free_cells(minute).cells
+        for move in moves:
+            if is_free[idx + move]:
+                yield minute * size + idx + move
+
+    def is_end(state):
+        """Check whether the end has been reached."""
+        return state % size == end
+
+    first_state = minutes % valley.period * size + start
+    distances, reached = search.breadth_first_search(
+        [first_state], neighbors, is_end
+    )
+    if reached is None:
+        raise ValueError("Reaching the sink is impossible!")
+    return minutes + distances[reached]
+
+
+@aoc.instrument
+def cross_valley_by_rows(valley, minutes, start, end):
+    """Identify the reachable positions minute by minute, a row at a time."""
+    last_x = valley.grid_width - 1
+    entries = {valley.source: (0, 1), valley.sink: (-1, 1 << last_x)}
+    start_y, start_bit = entries[start]
+    end_y, end_bit = entries[end]
+    phase = minutes % valley.period
+    can_reach = [0] * valley.grid_height
+    previous = None
+
+    while not can_reach[end_y] & end_bit:
+        if minutes % valley.period == phase:
+            if can_reach == previous:
+                raise ValueError("Reaching the sink is impossible!")
+            previous = can_reach
+        minutes += 1
+        # It is also possible to enter the valley from the start:
+        can_reach = bitset.dilate(can_reach, valley.grid_width)
+        can_reach[start_y] |= start_bit
+        can_reach = [
+            reach & free
+            for reach, free in zip(can_reach, valley.free_rows(minutes))
+        ]
+    # It takes another minute to leave the valley:
+    return minutes + 1
+
+
+@aoc.instrument
+def cross_valley_numpy(valley, minutes, start, end):
+    """Identify the reachable positions minute by minute, using NumPy."""
+    np = aoc.import_numpy()
+    blizzards = {
+        char: np.array(cells, dtype=bool)
+        for char, cells in valley.blizzard_cells().items()
+    }
+    entries = {valley.source: (0, 0), valley.sink: (-1, -1)}
+    start_pos = entries[start]
+    end_pos = entries[end]
+    phase = minutes % valley.period
+    can_reach = np.zeros(blizzards[">"].shape, dtype=bool)
+    previous = None
+
+    while not can_reach[end_pos]:
+        if minutes % valley.period == phase:
+            if previous is not None and np.array_equal(can_reach, previous):
+                raise ValueError("Reaching the sink is impossible!")
+            previous = can_reach
+        minutes += 1
+        has_blizzard = (
+            np.roll(blizzards[">"], minutes, axis=1)
+            | np.roll(blizzards["<"], -minutes, axis=1)
+            | np.roll(blizzards["v"], minutes, axis=0)
+            | np.roll(blizzards["^"], -minutes, axis=0)
+        )
+        new_can_reach = can_reach.copy()
+        new_can_reach[1:] |= can_reach[:-1]
+        new_can_reach[:-1] |= can_reach[1:]
+        new_can_reach[:, 1:] |= can_reach[:, :-1]
+        new_can_reach[:, :-1] |= can_reach[:, 1:]
+        # It is also possible to enter the valley from the start:
+        new_can_reach[start_pos] = True
+        can_reach = new_can_reach & ~has_blizzard
+    # It takes another minute to leave the valley:
+    return minutes + 1
+
+
+class Valley:
+    """Class to represent a valley, with blizzards moving in straight lines."""
+
+    def __init__(self, rows):
+        """Create a valley from its rows, and set the source and sink."""
+        self.grid_height = len(rows)
+        self.grid_width = len(rows[0])
+        self.period = math.lcm(self.grid_height, self.grid_width)
+        self.blizzards = {
+            char: [row.encode().translate(mask) for row in rows]
+            for char, mask in MASKS.items()
+        }
+        self.blizzard_rows = {
+            char: bitset.from_lines(rows, char) for char in MASKS
+        }
+        # A padding of two ensures that neighbors of the source and sink exist:
+        layout = Grid(self.grid_height, self.grid_width, 0, padding=2)
+        self.size = len(layout.cells)
+        self.stride = layout.stride
+        self.source = layout.index(-1, 0)
+        self.sink = layout.index(self.grid_height, self.grid_width - 1)
+        self.free_cells_cache = {}
+
+    def free_cells(self, minute):
+        """Get a grid in which blizzard-free positions are marked (cached)."""
+        minute %= self.period
+        is_free = self.free_cells_cache.get(minute)
+        if is_free is None:
+            is_free = self.generate_free_cells(minute)
+            self.free_cells_cache[minute] = is_free
+            # The search needs the grids of two consecutive minutes at most:
+            if len(self.free_cells_cache) > FREE_CELLS_CACHE_SIZE:
+                del self.free_cells_cache[next(iter(self.free_cells_cache))]
+        return is_free
+
+    def generate_free_cells(self, minute):
+        """Generate a grid in which blizzard-free positions are marked."""
+        height, width = self.grid_height, self.grid_width
+        is_free = Grid(height, width, 0, padding=2)
+        shift = minute % width
+        for idx_y in range(height):
+            right = self.blizzards[">"][idx_y]
+            left = self.blizzards["<"][idx_y]
+            nr_blizzards = (
+                int.from_bytes(right[width - shift :] + right[: width - shift])
+                + int.from_bytes(left[shift:] + left[:shift])
+                + int.from_bytes(self.blizzards["v"][(idx_y - minute) % height])
+                + int.from_bytes(self.blizzards["^"][(idx_y + minute) % height])
+            )
+            is_free.set_row(
+                idx_y, nr_blizzards.to_bytes(width).translate(IS_ZERO)
+            )
+        is_free.cells[self.source] = True
+        is_free.cells[self.sink] = True
+        return is_free
+
+    def blizzard_cells(self):
+        """Get, per direction, the rows of cells that mark the blizzards."""
+        width = self.grid_width
+        return {
+            char: [[row >> x & 1 for x in range(width)] for row in rows]
+            for char, rows in self.blizzard_rows.items()
+        }
+
+    def free_rows(self, minute):
+        """Generate the rows in which blizzard-free positions are marked."""
+        height, width = self.grid_height, self.grid_width
+        right, left = self.blizzard_rows[">"], self.blizzard_rows["<"]
+        down, up = self.blizzard_rows["v"], self.blizzard_rows["^"]
+        all_free = bitset.row_mask(width)
+        return [
+            all_free
+            & ~(
+                bitset.rotate_east(right[idx_y], width, minute)
+                | bitset.rotate_west(left[idx_y], width, minute)
+                | down[(idx_y - minute) % height]
+                | up[(idx_y + minute) % height]
             )
-    # It is also possible to enter valley from source or sink:
-    new_in[0][0] = new_in[0][0] or (not is_blizzard[0][0] and old_source)
-    new_in[-1][-1] = new_in[-1][-1] or (not is_blizzard[-1][-1] and old_sink)
-
-    return {"source": new_source, "in": new_in, "sink": new_sink}
-
-
-def map_valley(blizzards, grid_height, grid_width):
-    """Generate a grid in which blizzard locations are marked as True."""
-    is_blizzard = [[False] * grid_width for _ in range(grid_height)]
-    for blizzard in blizzards:
-        is_blizzard[blizzard.idx_y][blizzard.idx_x] = True
-    return is_blizzard
-
-
-class Blizzard:
-    """Class to represent a blizzard."""
-
-    def __init__(self, idx_x, idx_y, direction):
-        """Create a blizzard with x- and y-indices and a direction of motion."""
-        self.idx_x = idx_x
-        self.idx_y = idx_y
-        self.direction = direction
-
-    def move(self, grid_height, grid_width):
-        """Move the blizzard in its indicated direction."""
-        if self.direction == "^":
-            self.idx_y = (self.idx_y - 1) % grid_height
-        elif self.direction == "v":
-            self.idx_y = (self.idx_y + 1) % grid_height
-        elif self.direction == "<":
-            self.idx_x = (self.idx_x - 1) % grid_width
-        elif self.direction == ">":
-            self.idx_x = (self.idx_x + 1) % grid_width
+            for idx_y in range(height)
+        ]
 
 
 if __name__ == "__main__":
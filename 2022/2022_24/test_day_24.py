@@ -1,4 +1,5 @@
 import unittest
+import aoc_tools as aoc
 import day_24 as d24
 
 FILENAME = "input_24.txt"
@@ -32,6 +33,34 @@ class TestSolution(unittest.TestCase):
         length_shortest = d24.compute_shortest(FILENAME, nr_sink_visits)
         self.assertEqual(length_shortest, 807)
 
+    def test_engines(self):
+        """Test whether the search engine agrees with the bitset engine."""
+        for nr_sink_visits in (1, 2):
+            self.assertEqual(
+                d24.compute_shortest(
+                    FILENAME_EXAMPLE, nr_sink_visits, "search"
+                ),
+                d24.compute_shortest(
+                    FILENAME_EXAMPLE, nr_sink_visits, "bitset"
+                ),
+            )
+
+    def test_free_cells_cache(self):
+        """Test whether the blizzard-free grids are cached per valley."""
+        valley = d24.initialize_valley(FILENAME_EXAMPLE)
+        is_free = valley.free_cells(1)
+        self.assertIs(valley.free_cells(1 + valley.period), is_free)
+        for minute in range(2, 6):
+            valley.free_cells(minute)
+        self.assertEqual(
+            len(valley.free_cells_cache), d24.FREE_CELLS_CACHE_SIZE
+        )
+
+
+@unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+class TestSolutionNumpy(aoc.NumpyBackendMixin, TestSolution):
+    """Tests for the solution of day 24, with the numpy backend."""
+
 
 if __name__ == "__main__":
     unittest.main()
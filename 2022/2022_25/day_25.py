@@ -13,11 +13,12 @@ def main():
 
 def compute_snafu_total(filename):
     """Convert file input to decimal numbers, and the total back to SNAFU."""
-    snafu_lines = aoc.read_stripped_lines(filename)
+    snafu_lines = aoc.iter_stripped_lines(filename)
     total_requirement = sum(convert_to_decimal(line) for line in snafu_lines)
     return convert_to_snafu(total_requirement)
 
 
+@aoc.instrument
 def convert_to_decimal(snafu):
     """Convert a given SNAFU number (string) to a decimal number."""
     fuel_requirement = 0
@@ -37,6 +38,7 @@ def convert_to_decimal(snafu):
     return fuel_requirement
 
 
+@aoc.instrument
 def convert_to_snafu(decimal):
     """
     Convert a given decimal number to a SNAFU number (string).
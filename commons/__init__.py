@@ -0,0 +1,16 @@
+"""
+Tools shared by the puzzle solutions.
+
+The solutions import these modules by their top-level names (the README advises
+to add this directory to the PYTHONPATH environment variable). When a module is
+run as part of the package instead, e.g. 'python -m commons.run' from the
+repository root, this directory is added to the module search path here.
+"""
+
+import os
+import sys
+
+COMMONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if COMMONS_DIR not in sys.path:
+    sys.path.insert(0, COMMONS_DIR)
@@ -0,0 +1,221 @@
+"""
+Store answers of solved puzzle parts persistently, to return them instantly.
+
+Answers are kept in an SQLite database in a cache directory. An answer is keyed
+by the puzzle part, the solver and its parameters, the SHA-256 digests of the
+input files, and a SHA-256 digest of the sources of the solution module and of
+the commons modules (which solutions import, e.g. aoc_tools and grid). Hence, a
+stored answer is no longer used once the input or the solution changes (the
+outdated rows can be removed with prune()). Lookups are counted, per store and
+in the database, to report hit rates. Example, from the repository root:
+
+    python -m commons.answers --report
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+import aoc_tools as aoc
+import puzzles
+
+STORE_DIR_VARIABLE = "AOC_ANSWER_STORE_DIR"
+DEFAULT_STORE_DIR = os.path.join("~", ".cache", "advent_of_code")
+DATABASE_NAME = "answers.sqlite3"
+COMMONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    args = parse_arguments()
+    with contextlib.closing(AnswerStore(args.directory)) as store:
+        if args.prune:
+            print(f"Removed {store.prune()} outdated answers.")
+        print(json.dumps(store.report(), indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--directory",
+        help=f"default: ${STORE_DIR_VARIABLE} or {DEFAULT_STORE_DIR}",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="report the stored answers and hit rates (the default action)",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="remove answers for solution sources that have since changed",
+    )
+    return parser.parse_args(argv)
+
+
+def get_store_dir(directory=None):
+    """Get the store directory: as given, from the environment, or default."""
+    if directory is None:
+        directory = os.environ.get(STORE_DIR_VARIABLE) or DEFAULT_STORE_DIR
+    return os.path.expanduser(directory)
+
+
+def make_key(
+    year, day, part, solver, kwargs, filenames, module_file, commons_dir=None
+):
+    """Make the key of an answer, from the part, parameters, and digests."""
+    parameters = json.dumps([solver, kwargs], sort_keys=True)
+    input_hash = ",".join(aoc.hash_file(f) for f in filenames)
+    solver_hash = hash_solver(module_file, commons_dir)
+    return (year, day, part, parameters, input_hash, solver_hash)
+
+
+def hash_solver(module_file, commons_dir=None):
+    """Hash the sources of a solution module and the (non-test) commons."""
+    if commons_dir is None:
+        commons_dir = COMMONS_DIR
+    source_files = [module_file] + sorted(
+        path
+        for path in glob.glob(os.path.join(commons_dir, "*.py"))
+        if not os.path.basename(path).startswith("test_")
+    )
+    digest = hashlib.sha256()
+    for source_file in source_files:
+        digest.update(aoc.hash_file(source_file).encode())
+    return digest.hexdigest()
+
+
+class AnswerStore:
+    """Class to represent a persistent store of answers, keyed by digests."""
+
+    def __init__(self, directory=None):
+        """Open (or create) the store database in the given directory."""
+        directory = get_store_dir(directory)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DATABASE_NAME)
+        self.connection = sqlite3.connect(self.path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "year INTEGER, day INTEGER, part INTEGER, parameters TEXT, "
+                "input_hash TEXT, solver_hash TEXT, answer TEXT, "
+                "solve_time REAL, stored_at REAL, "
+                "PRIMARY KEY (year, day, part, parameters, input_hash, "
+                "solver_hash))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "year INTEGER, day INTEGER, hits INTEGER, misses INTEGER, "
+                "PRIMARY KEY (year, day))"
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Get a stored answer and its original solve time (None if absent)."""
+        row = self.connection.execute(
+            "SELECT answer, solve_time FROM answers WHERE year = ? AND day = ? "
+            "AND part = ? AND parameters = ? AND input_hash = ? "
+            "AND solver_hash = ?",
+            key,
+        ).fetchone()
+        is_hit = row is not None
+        self.hits += is_hit
+        self.misses += not is_hit
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO lookups VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (year, day) DO UPDATE SET "
+                "hits = hits + excluded.hits, "
+                "misses = misses + excluded.misses",
+                (key[0], key[1], int(is_hit), int(not is_hit)),
+            )
+        if not is_hit:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key, answer, solve_time):
+        """Store an answer (which must be JSON serializable)."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(answer), solve_time, time.time()),
+            )
+
+    def prune(self):
+        """Remove answers of solutions whose source (or commons) has changed."""
+        current_hashes = {}
+        for year, day in puzzles.PUZZLES:
+            module_file = puzzles.get_module_path(year, day)
+            current_hashes[(year, day)] = hash_solver(module_file)
+        rows = self.connection.execute(
+            "SELECT DISTINCT year, day, solver_hash FROM answers"
+        ).fetchall()
+        outdated = [
+            row for row in rows if current_hashes.get(row[:2]) != row[2]
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM answers WHERE year = ? AND day = ? "
+                "AND solver_hash = ?",
+                outdated,
+            )
+        return len(outdated)
+
+    def info(self):
+        """Get the numbers of lookups by this store, and the hit rate."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": get_hit_rate(self.hits, self.misses),
+        }
+
+    def report(self):
+        """Report the stored answers and the hit rates over all lookups."""
+        nr_answers = self.connection.execute(
+            "SELECT COUNT(*) FROM answers"
+        ).fetchone()[0]
+        days = []
+        for year, day, hits, misses in self.connection.execute(
+            "SELECT year, day, hits, misses FROM lookups ORDER BY year, day"
+        ):
+            days.append(
+                {
+                    "year": year,
+                    "day": day,
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": get_hit_rate(hits, misses),
+                }
+            )
+        hits = sum(d["hits"] for d in days)
+        misses = sum(d["misses"] for d in days)
+        return {
+            "path": self.path,
+            "answers": nr_answers,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": get_hit_rate(hits, misses),
+            "days": days,
+        }
+
+    def close(self):
+        """Close the store database."""
+        self.connection.close()
+
+
+def get_hit_rate(hits, misses):
+    """Get the fraction of lookups that were hits (None without lookups)."""
+    if hits + misses == 0:
+        return None
+    return hits / (hits + misses)
+
+
+if __name__ == "__main__":
+    main()
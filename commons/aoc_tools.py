@@ -1,5 +1,40 @@
 """This module provides useful tools for solving advent-of-code puzzles."""
 
+from array import array
+from collections import OrderedDict
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+READ_BUFFER_SIZE = 1 << 16
+WHITESPACE = b" \t\n\r\x0b\x0c"
+PARSE_CACHE_SIZE = 32
+PARSE_CACHE_DIR_VARIABLE = "AOC_PARSE_CACHE_DIR"
+INSTRUMENT_VARIABLE = "AOC_INSTRUMENT"
+BACKEND_VARIABLE = "AOC_BACKEND"
+BACKENDS = ("python", "numpy")
+# An integer, with a minus sign unless the minus follows a digit (as in "2-4"):
+INT_REGEX = re.compile(rb"(?<!\d)-?\d+")
+
+_parse_cache = OrderedDict()
+_parse_cache_stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+_instrument_mode = None
+_instrument_stats = {}
+_instrument_stack = []
+_instrument_depths = {}
+_backend = None
+_progress = {}
+
 
 def read(filename):
     """Read file content, return as string."""
@@ -39,3 +74,371 @@ def read_stripped_lines(filename, add_line=None):
     elif not add_line is None:
         file_lines.append(add_line)
     return file_lines
+
+
+def iter_lines(filename, add_line=None):
+    """Read file content, return as iterator over lines."""
+    if os.path.getsize(filename) == 0:
+        raise ValueError("The input file is empty!")
+    return _generate_lines(filename, add_line, stripped=False)
+
+
+def iter_stripped_lines(filename, add_line=None):
+    """Read file content, return as iterator over right-stripped lines."""
+    if os.path.getsize(filename) == 0:
+        raise ValueError("The input file is empty!")
+    return _generate_lines(filename, add_line, stripped=True)
+
+
+def _generate_lines(filename, add_line, stripped):
+    """Generate file lines, reading ahead at most READ_BUFFER_SIZE bytes."""
+    with open(filename, buffering=READ_BUFFER_SIZE) as file_object:
+        for line in file_object:
+            yield line.rstrip() if stripped else line
+    if add_line is not None:
+        yield add_line
+
+
+@contextlib.contextmanager
+def read_mapped(filename):
+    """
+    Memory-map file content, yield as read-only bytes buffer.
+
+    The file content is not copied into memory; pages are loaded on demand.
+    Slices handed out by iter_mapped_lines() are views on this buffer, so they
+    must be released (or go out of scope) before leaving the with-block.
+    """
+    with open(filename, "rb") as file_object:
+        if os.fstat(file_object.fileno()).st_size == 0:
+            raise ValueError("The input file is empty!")
+        with mmap.mmap(
+            file_object.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            yield buffer
+
+
+def index_lines(buffer):
+    """
+    Index the lines of a buffer, return as array of line start offsets.
+
+    The array has one more entry than there are lines: line i spans the offsets
+    from offsets[i] up to (but not including) offsets[i + 1].
+    """
+    offsets = array("q", [0])
+    buffer_length = len(buffer)
+    idx = buffer.find(b"\n")
+    while idx != -1 and idx + 1 < buffer_length:
+        offsets.append(idx + 1)
+        idx = buffer.find(b"\n", idx + 1)
+    offsets.append(buffer_length)
+    return offsets
+
+
+def iter_mapped_lines(buffer, offsets=None, stripped=False):
+    """Iterate over the lines of a buffer, yield as zero-copy memoryviews."""
+    if offsets is None:
+        offsets = index_lines(buffer)
+    view = memoryview(buffer)
+    try:
+        for idx in range(len(offsets) - 1):
+            start = offsets[idx]
+            end = offsets[idx + 1]
+            if stripped:
+                while end > start and buffer[end - 1] in WHITESPACE:
+                    end -= 1
+            yield view[start:end]
+    finally:
+        view.release()
+
+
+def extract_ints(buffer, per_record=None):
+    """
+    Extract all (signed) integers from a buffer, return as flat array.
+
+    The buffer is scanned once, with one regular expression; it can be bytes,
+    a memory map (see read_mapped), or a string. If all records (e.g. lines)
+    hold the same number of integers, per_record can be given to check that the
+    integers split into whole records: record i consists of the integers at
+    indices i * per_record up to (but not including) (i + 1) * per_record.
+    """
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+    numbers = array("q", map(int, INT_REGEX.findall(buffer)))
+    if per_record is not None and len(numbers) % per_record:
+        raise ValueError(
+            f"The {len(numbers)} integers do not split into records of "
+            f"{per_record}!"
+        )
+    return numbers
+
+
+def iter_records(numbers, per_record):
+    """Iterate over the records in a flat array, yield as tuples."""
+    return zip(*[iter(numbers)] * per_record)
+
+
+def hash_file(filename):
+    """Hash file content, return as hexadecimal SHA-256 digest."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file_object:
+        for chunk in iter(lambda: file_object.read(READ_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_parsed(copier=None):
+    """
+    Decorate a parser, such that its results are cached by input content.
+
+    Results are keyed by the parser, the SHA-256 hash of the content of the
+    input file (the first argument), and the other (hashable) arguments. The
+    PARSE_CACHE_SIZE most recently used results are kept in memory. If the
+    AOC_PARSE_CACHE_DIR environment variable is set, results are also pickled
+    to (and loaded from) that directory. If the caller mutates the result, pass
+    a copier (e.g. copy.deepcopy) to hand out a copy on every call.
+    """
+
+    def decorator(parser):
+        @functools.wraps(parser)
+        def cached_parser(filename, *args, **kwargs):
+            content_hash = hash_file(filename)
+            key = (parser, content_hash, args, tuple(sorted(kwargs.items())))
+            if key in _parse_cache:
+                _parse_cache.move_to_end(key)
+                _parse_cache_stats["hits"] += 1
+                result = _parse_cache[key]
+            else:
+                disk_path = _get_disk_path(parser, key)
+                result = _load_pickled(disk_path)
+                if result is not None:
+                    _parse_cache_stats["disk_hits"] += 1
+                else:
+                    _parse_cache_stats["misses"] += 1
+                    result = parser(filename, *args, **kwargs)
+                    _store_pickled(disk_path, result)
+                _parse_cache[key] = result
+                if len(_parse_cache) > PARSE_CACHE_SIZE:
+                    _parse_cache.popitem(last=False)
+            return result if copier is None else copier(result)
+
+        return cached_parser
+
+    return decorator
+
+
+def clear_parse_cache():
+    """Clear the in-memory tier of the parse cache, and reset its statistics."""
+    _parse_cache.clear()
+    for stat in _parse_cache_stats:
+        _parse_cache_stats[stat] = 0
+
+
+def parse_cache_info():
+    """Get the parse cache statistics, and the number of results in memory."""
+    return {**_parse_cache_stats, "size": len(_parse_cache)}
+
+
+def _get_disk_path(parser, key):
+    """Get the pickle path of a parse result (None if disk caching is off)."""
+    cache_dir = os.environ.get(PARSE_CACHE_DIR_VARIABLE)
+    if not cache_dir:
+        return None
+    # Include the source of the parser module, as the parser may have changed:
+    source_hash = hash_file(sys.modules[parser.__module__].__file__)
+    disk_key = (parser.__module__, parser.__qualname__, source_hash, *key[1:])
+    digest = hashlib.sha256(repr(disk_key).encode()).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.pickle")
+
+
+def _load_pickled(path):
+    """Load a pickled parse result (None if absent or unreadable)."""
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file_object:
+            return pickle.load(file_object)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+
+
+def _store_pickled(path, result):
+    """Pickle a parse result atomically (skipped if it cannot be pickled)."""
+    if path is None:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path), suffix=".tmp", delete=False
+    ) as file_object:
+        try:
+            pickle.dump(result, file_object)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            pickled = False
+        else:
+            pickled = True
+    if pickled:
+        os.replace(file_object.name, path)
+    else:
+        os.remove(file_object.name)
+
+
+def instrument(function):
+    """
+    Decorate a (hot) function, to record its calls, time, and peak memory.
+
+    Unless instrumentation is enabled when the function is decorated (e.g. by
+    setting the AOC_INSTRUMENT environment variable before the solution is
+    imported), the function is returned as is, so there is no overhead. Per
+    function, the report holds the number of calls, the cumulative time (of
+    outermost calls only, for recursive functions), the self time (excluding
+    time in other instrumented functions), and the peak traced memory above
+    the memory in use at the start of a call (unless AOC_INSTRUMENT=time).
+    """
+    if _instrument_mode is None:
+        return function
+    name = f"{function.__module__}.{function.__qualname__}"
+    key = name.replace(".<locals>", "")
+    stats = _instrument_stats.setdefault(
+        key, {"calls": 0, "cumulative": 0.0, "self": 0.0, "peak": 0}
+    )
+    trace_memory = _instrument_mode != "time"
+
+    @functools.wraps(function)
+    def instrumented_function(*args, **kwargs):
+        depth = _instrument_depths.get(key, 0)
+        _instrument_depths[key] = depth + 1
+        memory = 0
+        if trace_memory:
+            # Keep the peak of the caller, before resetting it for this call:
+            memory, peak = tracemalloc.get_traced_memory()
+            if _instrument_stack:
+                _instrument_stack[-1][3] = max(_instrument_stack[-1][3], peak)
+            tracemalloc.reset_peak()
+        frame = [time.perf_counter(), 0.0, memory, memory]
+        _instrument_stack.append(frame)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - frame[0]
+            _instrument_stack.pop()
+            _instrument_depths[key] = depth
+            stats["calls"] += 1
+            stats["self"] += elapsed - frame[1]
+            if depth == 0:
+                stats["cumulative"] += elapsed
+            if _instrument_stack:
+                _instrument_stack[-1][1] += elapsed
+            if trace_memory:
+                peak = max(frame[3], tracemalloc.get_traced_memory()[1])
+                stats["peak"] = max(stats["peak"], peak - frame[2])
+                if _instrument_stack:
+                    _instrument_stack[-1][3] = max(
+                        _instrument_stack[-1][3], peak
+                    )
+
+    return instrumented_function
+
+
+def enable_instrumentation(mode="all"):
+    """Enable instrumentation of functions decorated from now on."""
+    global _instrument_mode
+    if _instrument_mode is None:
+        atexit.register(print_instrument_report)
+    _instrument_mode = mode
+    if mode != "time" and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def instrument_report():
+    """Get the instrumentation statistics, sorted by cumulative time."""
+    report = [
+        {"function": key, **stats}
+        for key, stats in _instrument_stats.items()
+        if stats["calls"] > 0
+    ]
+    return sorted(report, key=lambda r: r["cumulative"], reverse=True)
+
+
+def print_instrument_report(file=None):
+    """Print the instrumentation statistics as a table (to standard error)."""
+    report = instrument_report()
+    if not report:
+        return
+    file = sys.stderr if file is None else file
+    width = max(len(r["function"]) for r in report)
+    header = ("calls", "cumul (s)", "self (s)", "peak (KiB)")
+    print(
+        f"{'function':<{width}} " + " ".join(f"{h:>12}" for h in header),
+        file=file,
+    )
+    for r in report:
+        print(
+            f"{r['function']:<{width}} {r['calls']:>12}"
+            f" {r['cumulative']:>12.4f} {r['self']:>12.4f}"
+            f" {r['peak'] / 1024:>12.1f}",
+            file=file,
+        )
+
+
+def get_backend():
+    """Get the selected backend (by default, set by AOC_BACKEND or "python")."""
+    if _backend is None:
+        set_backend(os.environ.get(BACKEND_VARIABLE) or BACKENDS[0])
+    return _backend
+
+
+def set_backend(name):
+    """Select the backend used by solutions that have multiple backends."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name}, choose from {BACKENDS}!")
+    if name == "numpy":
+        import_numpy()
+    _backend = name
+
+
+def has_numpy():
+    """Check whether NumPy is installed (without importing it)."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def import_numpy():
+    """Import NumPy, which is only required by the numpy backend."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("The numpy backend requires NumPy!") from error
+    return numpy
+
+
+class NumpyBackendMixin:
+    """Mixin for test cases, to run every test with the numpy backend."""
+
+    def setUp(self):
+        """Select the numpy backend for the duration of a test."""
+        super().setUp()
+        self.addCleanup(set_backend, get_backend())
+        set_backend("numpy")
+
+
+def report_progress(**values):
+    """
+    Report the progress of a solver, e.g. the best lower bound found so far.
+
+    The latest values are kept until cleared, so that a runner that cancels a
+    solver (e.g. when it exceeds a time limit) can still report them.
+    """
+    _progress.update(values)
+
+
+def get_progress():
+    """Get a copy of the progress values reported since the last clearance."""
+    return dict(_progress)
+
+
+def clear_progress():
+    """Clear the reported progress values."""
+    _progress.clear()
+
+
+if os.environ.get(INSTRUMENT_VARIABLE, "") not in ("", "0"):
+    enable_instrumentation(os.environ[INSTRUMENT_VARIABLE])
@@ -0,0 +1,114 @@
+"""
+Solve all parts of a puzzle for many inputs, streaming results as they finish.
+
+Every input (set of input files) is a job for a pool of processes, and the job
+solves all parts of the puzzle. Puzzles with an all-parts solver in the registry
+(see puzzles.py) compute the parts from shared intermediate results; for other
+puzzles, the parts are solved one by one, but parsers decorated with
+aoc_tools.cache_parsed still parse the input only once. At most a few jobs per
+worker are queued at any time, so inputs can be streamed from a long list. The
+results are printed as JSON lines, in order of completion. Example, from the
+repository root (for puzzles with multiple input files, separate the files of
+one input by commas):
+
+    python -m commons.batch --day 16 inputs/*.txt
+"""
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import os
+import time
+
+import puzzles
+import run
+
+JOBS_PER_WORKER = 2
+
+
+def main():
+    args = parse_arguments()
+    input_sets = (tuple(i.split(",")) for i in args.inputs)
+    for result in solve_batch(args.year, args.day, input_sets, args.workers):
+        print(json.dumps(result), flush=True)
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument(
+        "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="input file (comma-separated files for multi-file puzzles)",
+    )
+    return parser.parse_args(argv)
+
+
+def solve_batch(year, day, input_sets, workers=None):
+    """Solve all parts for every input set, yielding results as they finish."""
+    puzzles.get_puzzle(year, day)
+    max_pending = JOBS_PER_WORKER * (workers or os.cpu_count())
+    input_sets = iter(input_sets)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for filenames in input_sets:
+            pending.add(executor.submit(solve_inputs, year, day, filenames))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def solve_inputs(year, day, filenames):
+    """Solve all parts for one input set (in a worker process)."""
+    result = {"year": year, "day": day, "inputs": list(filenames)}
+    start = time.perf_counter()
+    try:
+        answers, parse_time = solve_all_parts(year, day, filenames)
+    except Exception as e:
+        status, answers, parse_time = f"error: {e!r}", None, 0.0
+    else:
+        status = "ok"
+    result.update(
+        status=status,
+        answers=answers,
+        parse_time=parse_time,
+        solve_time=time.perf_counter() - start - parse_time,
+        pid=os.getpid(),
+    )
+    return result
+
+
+def solve_all_parts(year, day, filenames):
+    """Solve all parts of a puzzle, and return the answers and parse time."""
+    puzzle = puzzles.get_puzzle(year, day)
+    module = puzzles.load_module(year, day)
+    batch_solver = puzzles.get_batch_solver(year, day)
+    with run.time_parsers(module, puzzle["parsers"]) as parse_timer:
+        if batch_solver is not None:
+            solver_name, kwargs = batch_solver
+            answers = getattr(module, solver_name)(*filenames, **kwargs)
+        else:
+            answers = []
+            for part in puzzle["parts"]:
+                solver_name, kwargs, result_index = puzzles.get_solver(
+                    year, day, part
+                )
+                answer = getattr(module, solver_name)(*filenames, **kwargs)
+                if result_index is not None:
+                    answer = answer[result_index]
+                answers.append(answer)
+    return dict(zip(puzzle["parts"], answers)), parse_timer.elapsed
+
+
+if __name__ == "__main__":
+    main()
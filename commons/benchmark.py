@@ -0,0 +1,213 @@
+"""
+Benchmark the puzzle solutions, and compare timings against stored baselines.
+
+Every registered puzzle part is solved on the puzzle input and on the example
+inputs: first a number of warmup runs, then a number of timed runs (the parse
+cache is cleared before every run, so that parsing is timed too). The median
+times are reported as JSON, and can be stored as baselines. When comparing
+against baselines, every part whose median time exceeds its baseline by more
+than a given fraction (and by more than a minimum absolute difference, to
+ignore noise on tiny inputs) is flagged as a regression. With --memory, every
+result also holds a memory profile from a separate run (see memory.py): the
+peak traced memory, the RSS high-water mark, and the largest allocation sites.
+Example, from the repository root:
+
+    python -m commons.benchmark --save baselines.json
+    python -m commons.benchmark --compare baselines.json --threshold 0.25
+"""
+
+import argparse
+import json
+import statistics
+import sys
+
+import aoc_tools as aoc
+import memory
+import puzzles
+import run
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA = 0.001
+
+
+def main():
+    args = parse_arguments()
+    results = run_benchmarks(
+        args.year,
+        args.day,
+        args.part,
+        args.inputs,
+        args.warmup,
+        args.repeat,
+        args.memory,
+    )
+    report = {"warmup": args.warmup, "repeat": args.repeat, "results": results}
+    if args.compare is not None:
+        baselines = load_baselines(args.compare)
+        report["regressions"] = find_regressions(
+            results, baselines, args.threshold, args.min_delta
+        )
+    if args.save is not None:
+        save_baselines(report, args.save)
+    print(json.dumps(report, indent=2))
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--day", type=int)
+    parser.add_argument("--part", type=int)
+    parser.add_argument(
+        "--inputs",
+        choices=("all", "puzzle", "examples"),
+        default="all",
+        help="which inputs to benchmark on (default: all)",
+    )
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also profile memory use (in a separate, untimed run)",
+    )
+    parser.add_argument("--save", help="store the results as baselines")
+    parser.add_argument("--compare", help="compare against stored baselines")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="flag medians exceeding the baseline by this fraction",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="ignore increases of fewer seconds than this",
+    )
+    return parser.parse_args(argv)
+
+
+def run_benchmarks(
+    year=None,
+    day=None,
+    part=None,
+    inputs="all",
+    warmup=DEFAULT_WARMUP,
+    repeat=DEFAULT_REPEAT,
+    profile_memory=False,
+):
+    """Benchmark (a selection of) the puzzle parts on the selected inputs."""
+    results = []
+    for puzzle_year, puzzle_day, puzzle_part in puzzles.iter_parts(year, day):
+        if part is not None and puzzle_part != part:
+            continue
+        for example in select_examples(puzzle_year, puzzle_day, inputs):
+            result = benchmark_part(
+                puzzle_year, puzzle_day, puzzle_part, example, warmup, repeat
+            )
+            if profile_memory:
+                result["memory"] = memory.profile_part(
+                    puzzle_year, puzzle_day, puzzle_part, example=example
+                )
+            results.append(result)
+    return results
+
+
+def select_examples(year, day, inputs):
+    """Select the inputs to benchmark on (None refers to the puzzle input)."""
+    nr_examples = len(puzzles.get_puzzle(year, day)["examples"])
+    examples = []
+    if inputs in ("all", "puzzle"):
+        examples.append(None)
+    if inputs in ("all", "examples"):
+        examples.extend(range(1, nr_examples + 1))
+    return examples
+
+
+def benchmark_part(
+    year, day, part, example=None, warmup=DEFAULT_WARMUP, repeat=DEFAULT_REPEAT
+):
+    """Time a puzzle part after warmup runs, and summarize the timed runs."""
+    for _ in range(warmup):
+        solve_uncached(year, day, part, example)
+    runs = [
+        solve_uncached(year, day, part, example) for _ in range(max(repeat, 1))
+    ]
+    times = [r["parse_time"] + r["solve_time"] for r in runs]
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "input": get_input_label(example),
+        "answer": runs[0]["answer"],
+        "median": statistics.median(times),
+        "median_parse": statistics.median(r["parse_time"] for r in runs),
+        "median_solve": statistics.median(r["solve_time"] for r in runs),
+        "times": times,
+    }
+
+
+def solve_uncached(year, day, part, example=None):
+    """Solve a puzzle part, after clearing the parse cache."""
+    aoc.clear_parse_cache()
+    return run.solve_part(year, day, part, example=example)
+
+
+def get_input_label(example):
+    """Get a label for the puzzle input or the (n-th) example input."""
+    return "puzzle" if example is None else f"example_{example}"
+
+
+def save_baselines(report, path):
+    """Store a benchmark report as JSON, to serve as baselines."""
+    with open(path, "w") as file_object:
+        json.dump(report, file_object, indent=2)
+
+
+def load_baselines(path):
+    """Load baselines, return as dictionary keyed by year/day/part/input."""
+    with open(path) as file_object:
+        report = json.load(file_object)
+    return {
+        (r["year"], r["day"], r["part"], r["input"]): r
+        for r in report["results"]
+    }
+
+
+def find_regressions(
+    results, baselines, threshold=DEFAULT_THRESHOLD, min_delta=DEFAULT_MIN_DELTA
+):
+    """Flag the results whose median time regressed beyond the threshold."""
+    regressions = []
+    for result in results:
+        key = (result["year"], result["day"], result["part"], result["input"])
+        if key not in baselines:
+            continue
+        baseline_median = baselines[key]["median"]
+        delta = result["median"] - baseline_median
+        if delta > threshold * baseline_median and delta > min_delta:
+            # A coarse timer can store a zero median, which gives no ratio:
+            ratio = (
+                result["median"] / baseline_median if baseline_median else None
+            )
+            regressions.append(
+                {
+                    "year": result["year"],
+                    "day": result["day"],
+                    "part": result["part"],
+                    "input": result["input"],
+                    "median": result["median"],
+                    "baseline": baseline_median,
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+This module provides bitsets for row-parallel simulations on grids.
+
+A row of a grid is represented by a Python int, in which bit x is set if the
+cell in column x is marked, and a board is a list of such rows. Shifting a row
+moves all of its cells by a column at once, and and/or combine rows cell by
+cell, so that stencils (e.g. 'is any neighbor marked') take a few operations
+per row rather than a few per cell. Shifting 'east' moves cells toward higher
+columns (higher bits), shifting 'west' toward lower columns. Rows have a width,
+which bounds them on the east side; the west side is bounded by column 0.
+"""
+
+
+def row_mask(width):
+    """Get the row with all cells of the given width marked."""
+    return (1 << width) - 1
+
+
+def from_lines(lines, marks="#"):
+    """Create a board from lines of text, marking the given characters."""
+    board = []
+    for line in lines:
+        row = 0
+        for idx_x, char in enumerate(line):
+            if char in marks:
+                row |= 1 << idx_x
+        board.append(row)
+    return board
+
+
+def to_lines(board, width, mark="#", blank="."):
+    """Convert a board to lines of text, e.g. to inspect it."""
+    return [
+        "".join(mark if row >> x & 1 else blank for x in range(width))
+        for row in board
+    ]
+
+
+def shift_east(row, width, nr_cols=1):
+    """Shift the cells of a row toward higher columns, dropping overflow."""
+    return (row << nr_cols) & row_mask(width)
+
+
+def shift_west(row, nr_cols=1):
+    """Shift the cells of a row toward lower columns, dropping overflow."""
+    return row >> nr_cols
+
+
+def rotate_east(row, width, nr_cols=1):
+    """Rotate the cells of a row toward higher columns, wrapping around."""
+    nr_cols %= width
+    return ((row << nr_cols) | (row >> (width - nr_cols))) & row_mask(width)
+
+
+def rotate_west(row, width, nr_cols=1):
+    """Rotate the cells of a row toward lower columns, wrapping around."""
+    return rotate_east(row, width, width - nr_cols % width)
+
+
+def spread(row, width):
+    """Mark the cells of a row that are marked or next to a marked cell."""
+    return (row | row << 1 | row >> 1) & row_mask(width)
+
+
+def dilate(board, width):
+    """Mark the cells of a board that are marked or next to a marked cell."""
+    dilated = []
+    for idx_y, row in enumerate(board):
+        new_row = spread(row, width)
+        if idx_y > 0:
+            new_row |= board[idx_y - 1]
+        if idx_y < len(board) - 1:
+            new_row |= board[idx_y + 1]
+        dilated.append(new_row)
+    return dilated
+
+
+def overlaps(board, rows, offset_y=0):
+    """Check whether rows, placed from a board row onward, hit marked cells."""
+    for idx_y, row in enumerate(rows, offset_y):
+        if board[idx_y] & row:
+            return True
+    return False
+
+
+def stamp(board, rows, offset_y=0):
+    """Mark the cells of rows on a board, placed from a board row onward."""
+    for idx_y, row in enumerate(rows, offset_y):
+        board[idx_y] |= row
+
+
+def count(board):
+    """Count the marked cells of a board."""
+    return sum(row.bit_count() for row in board)
+
+
+def bounding_box(board):
+    """Get min_x, max_x, min_y, max_y of the marked cells of a board."""
+    rows_y = [idx_y for idx_y, row in enumerate(board) if row]
+    if not rows_y:
+        raise ValueError("The board has no marked cells!")
+    union = 0
+    for idx_y in rows_y:
+        union |= board[idx_y]
+    min_x = (union & -union).bit_length() - 1
+    return min_x, union.bit_length() - 1, rows_y[0], rows_y[-1]
@@ -0,0 +1,198 @@
+"""
+Estimate how the time and memory use of the puzzle solutions grow with size.
+
+Every selected puzzle part is solved on synthetic inputs (see generators.py) of
+geometrically growing sizes. The time spent in every function of the solution
+module is obtained from a profiled run, and the peak memory use of the part
+from a separate run that traces memory allocations. Growth exponents are then
+fitted by least squares on a log-log scale: an exponent of 1 indicates linear
+growth, 2 quadratic growth, and so on. Note that the meaning of 'size' differs
+per puzzle (e.g., it is the side of the grid for day 8). Example, from the
+repository root:
+
+    python -m commons.complexity --day 20 --part 1 --steps 5
+"""
+
+import argparse
+import cProfile
+import json
+import math
+import os
+import pstats
+import tempfile
+import time
+import tracemalloc
+
+import aoc_tools as aoc
+import generators
+import puzzles
+
+DEFAULT_FACTOR = 2
+DEFAULT_STEPS = 4
+DEFAULT_MAX_TIME = 10.0
+
+BASE_SIZES = {
+    (2022, 1): 1000,
+    (2022, 2): 10_000,
+    (2022, 3): 3000,
+    (2022, 4): 10_000,
+    (2022, 5): 1000,
+    (2022, 6): 10_000,
+    (2022, 7): 1000,
+    (2022, 8): 25,
+    (2022, 9): 500,
+    (2022, 10): 1000,
+    (2022, 11): 4,
+    (2022, 12): 26,
+    (2022, 13): 200,
+    (2022, 14): 50,
+    (2022, 15): 10,
+    (2022, 16): 8,
+    (2022, 17): 1000,
+    (2022, 18): 500,
+    (2022, 19): 2,
+    (2022, 20): 500,
+    (2022, 21): 101,
+    (2022, 22): 10,
+    (2022, 23): 10,
+    (2022, 24): 20,
+    (2022, 25): 1000,
+}
+
+
+def main():
+    args = parse_arguments()
+    results = []
+    for year, day, part in puzzles.iter_parts(args.year, args.day):
+        if args.part is not None and part != args.part:
+            continue
+        base_size = args.base_size or BASE_SIZES[(year, day)]
+        sizes = get_sizes(base_size, args.factor, args.steps)
+        results.append(
+            profile_part(year, day, part, sizes, args.seed, args.max_time)
+        )
+    print(json.dumps(results, indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--day", type=int)
+    parser.add_argument("--part", type=int)
+    parser.add_argument(
+        "--base-size", type=int, help="smallest size (default: per puzzle)"
+    )
+    parser.add_argument("--factor", type=float, default=DEFAULT_FACTOR)
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=DEFAULT_MAX_TIME,
+        help="skip larger sizes once a run takes more seconds than this",
+    )
+    return parser.parse_args(argv)
+
+
+def get_sizes(base_size, factor=DEFAULT_FACTOR, steps=DEFAULT_STEPS):
+    """Get a geometric sequence of (distinct, integer) sizes."""
+    sizes = []
+    for step in range(steps):
+        size = round(base_size * factor**step)
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+    return sizes
+
+
+def profile_part(year, day, part, sizes, seed=0, max_time=DEFAULT_MAX_TIME):
+    """Profile a puzzle part on growing sizes, and fit growth exponents."""
+    profiled_sizes, times, peaks, function_times = [], [], [], {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = generators.write_inputs(year, day, size, seed, directory)
+            total, functions = time_functions(year, day, part, paths)
+            peak = trace_peak_memory(year, day, part, paths)
+        for name in set(function_times) | set(functions):
+            previous = function_times.setdefault(name, [0.0] * len(times))
+            previous.append(functions.get(name, 0.0))
+        profiled_sizes.append(size)
+        times.append(total)
+        peaks.append(peak)
+        if total > max_time:
+            break
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "sizes": profiled_sizes,
+        "time": summarize_growth(profiled_sizes, times),
+        "peak_memory": summarize_growth(profiled_sizes, peaks),
+        "functions": {
+            name: summarize_growth(profiled_sizes, function_times[name])
+            for name in sorted(function_times)
+        },
+    }
+
+
+def time_functions(year, day, part, paths):
+    """Solve a part under the profiler, return total and per-function times."""
+    module = puzzles.load_module(year, day)
+    solver_name, kwargs, _ = puzzles.get_solver(year, day, part)
+    solver = getattr(module, solver_name)
+    aoc.clear_parse_cache()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.runcall(solver, *paths, **kwargs)
+    total = time.perf_counter() - start
+
+    module_path = os.path.abspath(module.__file__)
+    functions = {}
+    for (path, _, name), stats in pstats.Stats(profiler).stats.items():
+        if os.path.abspath(path) == module_path:
+            key = f"{module.__name__}.{name}"
+            functions[key] = functions.get(key, 0.0) + stats[3]
+    return total, functions
+
+
+def trace_peak_memory(year, day, part, paths):
+    """Solve a part while tracing memory allocations, return the peak (B)."""
+    module = puzzles.load_module(year, day)
+    solver_name, kwargs, _ = puzzles.get_solver(year, day, part)
+    aoc.clear_parse_cache()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        getattr(module, solver_name)(*paths, **kwargs)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def summarize_growth(sizes, values):
+    """Summarize measurements by their values and fitted growth exponent."""
+    return {"values": values, "exponent": fit_exponent(sizes, values)}
+
+
+def fit_exponent(sizes, values):
+    """Fit value = c * size^exponent by least squares on a log-log scale."""
+    points = [
+        (math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(p[0] for p in points) / len(points)
+    mean_y = sum(p[1] for p in points) / len(points)
+    variance = sum((p[0] - mean_x) ** 2 for p in points)
+    if variance == 0:
+        return None
+    covariance = sum((p[0] - mean_x) * (p[1] - mean_y) for p in points)
+    return covariance / variance
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Measure the memory footprint of the entity classes of the puzzle solutions.
+
+The entity classes (e.g. the elves of day 23, or the states of day 19) declare
+__slots__, so that instances store their attributes in fixed slots rather than
+in a per-instance dictionary. For every entity class, a puzzle part is solved on
+a synthetic input (see generators.py), scaled from the base size used by the
+complexity profiler, while counting the instances created. The bytes per entity
+are then measured by allocating copies of an instance, in the slotted layout and
+in an equivalent dictionary-backed layout, under tracemalloc. The attribute
+values are shared by the copies, so the measurements reflect the layouts only.
+Example, from the repository root:
+
+    python -m commons.footprint --day 19 --scale 2
+"""
+
+import argparse
+import json
+import tempfile
+import tracemalloc
+
+import aoc_tools as aoc
+import complexity
+import generators
+import puzzles
+
+# For every puzzle: the entity classes, and the part (with keyword arguments
+# that override the registered ones) that is solved to create their instances.
+ENTITIES = {
+    (2022, 7): (("Directory",), 1, {}),
+    (2022, 11): (("Monkey",), 1, {}),
+    (2022, 15): (("Sensor",), 1, {}),
+    (2022, 16): (("Valve", "KeyValve"), 1, {}),
+    (2022, 17): (("Shape",), 1, {}),
+    (2022, 19): (("Blueprint", "State"), 1, {}),
+    (2022, 20): (("MovingNumber",), 1, {}),
+    (2022, 21): (("Monkey",), 1, {}),
+    (2022, 22): (("Facet",), 2, {}),
+    (2022, 23): (("Elf",), 1, {"engine": "elves"}),
+}
+NR_COPIES = 1000
+
+
+def main():
+    args = parse_arguments()
+    results = []
+    for year, day in ENTITIES:
+        if args.year is not None and year != args.year:
+            continue
+        if args.day is not None and day != args.day:
+            continue
+        results.extend(measure_entities(year, day, args.scale, args.seed))
+    print(json.dumps({"scale": args.scale, "results": results}, indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--day", type=int)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="input size, relative to the base size of the profiler",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def measure_entities(year, day, scale=1.0, seed=0, size=None):
+    """Count the entities created in a part, and measure bytes per entity."""
+    class_names, part, override_kwargs = ENTITIES[(year, day)]
+    if size is None:
+        size = max(round(complexity.BASE_SIZES[(year, day)] * scale), 1)
+    module = puzzles.load_module(year, day)
+    solver_name, kwargs, _ = puzzles.get_solver(year, day, part)
+    kwargs = {**kwargs, **override_kwargs}
+    counters = {
+        name: EntityCounter(getattr(module, name)) for name in class_names
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generators.write_inputs(year, day, size, seed, directory)
+        aoc.clear_parse_cache()
+        for name, counter in counters.items():
+            setattr(module, name, counter.variant)
+        try:
+            getattr(module, solver_name)(*paths, **kwargs)
+        finally:
+            for name, counter in counters.items():
+                setattr(module, name, counter.entity_class)
+            aoc.clear_parse_cache()
+
+    results = []
+    for name, counter in counters.items():
+        slots_bytes, dict_bytes = measure_layouts(
+            counter.entity_class, counter.sample
+        )
+        saved_bytes = None
+        if counter.sample is not None:
+            saved_bytes = counter.count * (dict_bytes - slots_bytes)
+        results.append(
+            {
+                "year": year,
+                "day": day,
+                "class": name,
+                "size": size,
+                "instances": counter.count,
+                "slots_bytes": slots_bytes,
+                "dict_bytes": dict_bytes,
+                "saved_bytes": saved_bytes,
+            }
+        )
+    return results
+
+
+class EntityCounter:
+    """Class to count the instances of an entity class, and keep a sample."""
+
+    def __init__(self, entity_class):
+        """Create a counter, and a subclass that reports new instances."""
+        self.entity_class = entity_class
+        self.count = 0
+        self.sample = None
+        counter = self
+
+        def __init__(self, *args, **kwargs):
+            """Create an instance, and report it to the counter."""
+            entity_class.__init__(self, *args, **kwargs)
+            counter.count += 1
+            if counter.sample is None:
+                counter.sample = self
+
+        self.variant = type(
+            entity_class.__name__,
+            (entity_class,),
+            {"__slots__": (), "__init__": __init__},
+        )
+
+
+def get_slot_names(entity_class):
+    """Get the names of the slots of a class, including inherited ones."""
+    return [
+        name
+        for cls in reversed(entity_class.__mro__)
+        for name in cls.__dict__.get("__slots__", ())
+    ]
+
+
+def measure_layouts(entity_class, sample):
+    """Measure the bytes per entity, in the slotted and a dictionary layout."""
+    if sample is None:
+        return None, None
+    values = {
+        name: getattr(sample, name)
+        for name in get_slot_names(entity_class)
+        if hasattr(sample, name)
+    }
+    dict_class = type(entity_class.__name__, (), {})
+    return (
+        trace_copies(lambda: object.__new__(entity_class), values),
+        trace_copies(dict_class, values),
+    )
+
+
+def trace_copies(create, values):
+    """Trace the bytes per copy of an entity, with attribute values shared."""
+    copies = [None] * NR_COPIES
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        for idx in range(NR_COPIES):
+            entity = create()
+            for name, value in values.items():
+                setattr(entity, name, value)
+            copies[idx] = entity
+        allocated = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return round(allocated / NR_COPIES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,744 @@
+"""
+Generate synthetic puzzle inputs of a requested size, to load-test solutions.
+
+For every puzzle there is a seeded generator that produces valid input (in the
+sense that it satisfies the parsing assumptions of the solution, and that the
+puzzle can be solved with the parameters in the puzzle registry). The meaning
+of 'size' differs per puzzle, and is given in the docstring of the generator;
+for example, it is the number of sensors for day 15, the side of the heightmap
+for day 12, and the number of numbers for day 20. Example, from the repository
+root:
+
+    python -m commons.generators --day 12 --size 1000 --seed 1 --output dir
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import string
+
+import puzzles
+
+
+def main():
+    args = parse_arguments()
+    paths = write_inputs(args.year, args.day, args.size, args.seed, args.output)
+    print(json.dumps(paths, indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=".", help="output directory")
+    return parser.parse_args(argv)
+
+
+def generate(year, day, size, seed=0):
+    """Generate the contents of the input file(s) of a puzzle."""
+    try:
+        generator, min_size = GENERATORS[(year, day)]
+    except KeyError as e:
+        raise ValueError(
+            f"No generator registered for {year} day {day}!"
+        ) from e
+    if size < min_size:
+        raise ValueError(f"The size must be at least {min_size}!")
+    return generator(size, random.Random(seed))
+
+
+def write_inputs(year, day, size, seed=0, directory="."):
+    """Generate input file(s), and write them using the registered filenames."""
+    contents = generate(year, day, size, seed)
+    filenames = puzzles.get_puzzle(year, day)["inputs"]
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for filename, content in zip(filenames, contents):
+        path = os.path.join(directory, filename)
+        with open(path, "w") as file_object:
+            file_object.write(content)
+        paths.append(path)
+    return paths
+
+
+def join_lines(lines):
+    """Join lines into file content, ending with a newline."""
+    return "\n".join(lines) + "\n"
+
+
+def generate_01(size, rng):
+    """Generate calorie lists for {size} elves."""
+    groups = []
+    for _ in range(size):
+        nr_items = rng.randint(1, 10)
+        groups.append(
+            "\n".join(str(rng.randint(1000, 9999)) for _ in range(nr_items))
+        )
+    return ("\n\n".join(groups) + "\n",)
+
+
+def generate_02(size, rng):
+    """Generate a strategy guide of {size} rounds."""
+    lines = [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)]
+    return (join_lines(lines),)
+
+
+def generate_03(size, rng):
+    """
+    Generate {size} rucksacks (rounded up to a multiple of 3).
+
+    Within every group, the item types other than the badge are drawn from
+    disjoint pools, and within every rucksack the compartments are drawn from
+    disjoint halves of the pool, except for the one duplicated item type.
+    """
+    lines = []
+    item_types = list(string.ascii_letters)
+    for _ in range(math.ceil(size / 3)):
+        rng.shuffle(item_types)
+        badge = item_types[0]
+        for idx in range(3):
+            pool = item_types[1 + 17 * idx : 1 + 17 * (idx + 1)]
+            duplicate = pool[0]
+            compartment_length = rng.randint(2, 16)
+            compartment_1 = [duplicate, badge] + rng.choices(
+                pool[1:9], k=compartment_length - 2
+            )
+            compartment_2 = [duplicate] + rng.choices(
+                pool[9:17], k=compartment_length - 1
+            )
+            rng.shuffle(compartment_1)
+            rng.shuffle(compartment_2)
+            if rng.random() < 0.5:
+                compartment_1, compartment_2 = compartment_2, compartment_1
+            lines.append("".join(compartment_1 + compartment_2))
+    return (join_lines(lines),)
+
+
+def generate_04(size, rng):
+    """Generate {size} pairs of section assignments."""
+    lines = []
+    for _ in range(size):
+        lower_1, lower_2 = rng.randint(1, 99), rng.randint(1, 99)
+        upper_1, upper_2 = rng.randint(lower_1, 99), rng.randint(lower_2, 99)
+        lines.append(f"{lower_1}-{upper_1},{lower_2}-{upper_2}")
+    return (join_lines(lines),)
+
+
+def generate_05(size, rng):
+    """Generate nine initial stacks and {size} moves, never emptying a stack."""
+    nr_stacks = 9
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, 8))
+        for _ in range(nr_stacks)
+    ]
+    max_height = max(len(stack) for stack in stacks)
+    initial_lines = []
+    for height in range(max_height - 1, -1, -1):
+        crates = [
+            f"[{stack[height]}]" if height < len(stack) else "   "
+            for stack in stacks
+        ]
+        initial_lines.append(" ".join(crates))
+    initial_lines.append(
+        " " + "   ".join(str(i + 1) for i in range(nr_stacks)) + " "
+    )
+
+    move_lines = []
+    heights = [len(stack) for stack in stacks]
+    for _ in range(size):
+        from_idx = rng.choice([i for i in range(nr_stacks) if heights[i] > 1])
+        to_idx = rng.choice([i for i in range(nr_stacks) if i != from_idx])
+        move_size = rng.randint(1, heights[from_idx] - 1)
+        heights[from_idx] -= move_size
+        heights[to_idx] += move_size
+        move_lines.append(
+            f"move {move_size} from {from_idx + 1} to {to_idx + 1}"
+        )
+    return join_lines(initial_lines), join_lines(move_lines)
+
+
+def generate_06(size, rng):
+    """Generate a datastream of {size} characters, with markers at the end."""
+    body = rng.choices("abc", k=size - 14)
+    marker = rng.sample(string.ascii_lowercase[3:], k=14)
+    return ("".join(body + marker) + "\n",)
+
+
+def generate_07(size, rng):
+    """
+    Generate the terminal output of browsing {size} directories.
+
+    File sizes are scaled such that the total size is about 50,000,000, so that
+    a directory needs to be deleted to free up space (for part 2).
+    """
+    mean_file_size = max(50_000_000 // (5 * size // 2), 1)
+    children = [[] for _ in range(size)]
+    for idx in range(1, size):
+        children[rng.randrange(idx)].append(idx)
+
+    lines = ["$ cd /"]
+    to_visit = [0]
+    while to_visit:
+        idx = to_visit.pop()
+        if idx == -1:
+            lines.append("$ cd ..")
+            continue
+        if idx != 0:
+            lines.append(f"$ cd d{idx}")
+        lines.append("$ ls")
+        entries = [f"dir d{child}" for child in children[idx]]
+        for file_idx in range(rng.randint(1, 4)):
+            file_size = rng.randint(1, 2 * mean_file_size)
+            entries.append(f"{file_size} f{file_idx}.txt")
+        rng.shuffle(entries)
+        lines.extend(entries)
+        # Visit the subdirectories, and return to this directory after each:
+        for child in children[idx]:
+            to_visit.extend((-1, child))
+    return (join_lines(lines),)
+
+
+def generate_08(size, rng):
+    """Generate a square grid of trees with side {size}."""
+    lines = ["".join(rng.choices("0123456789", k=size)) for _ in range(size)]
+    return (join_lines(lines),)
+
+
+def generate_09(size, rng):
+    """Generate {size} head motions."""
+    lines = [f"{rng.choice('UDLR')} {rng.randint(1, 10)}" for _ in range(size)]
+    return (join_lines(lines),)
+
+
+def generate_10(size, rng):
+    """Generate a program of {size} instructions (taking 240+ cycles)."""
+    lines = []
+    for _ in range(size):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            lines.append(f"addx {rng.randint(-10, 10)}")
+    return (join_lines(lines),)
+
+
+def generate_11(size, rng):
+    """
+    Generate the notes on {size} monkeys, with prime test divisors.
+
+    Operations do not square the worry level ('old * old'), which can make the
+    worry levels of part 1 (that are not reduced modulo the divisors) explode.
+    """
+    primes = get_primes(size)
+    blocks = []
+    for idx in range(size):
+        items = ", ".join(
+            str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))
+        )
+        operation = rng.choice(
+            (f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}")
+        )
+        others = [i for i in range(size) if i != idx]
+        true_idx, false_idx = (
+            rng.sample(others, 2) if len(others) >= 2 else others * 2
+        )
+        blocks.append(
+            f"Monkey {idx}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {primes[idx]}\n"
+            f"    If true: throw to monkey {true_idx}\n"
+            f"    If false: throw to monkey {false_idx}"
+        )
+    return ("\n\n".join(blocks) + "\n",)
+
+
+def get_primes(nr_primes):
+    """Get the first {nr_primes} prime numbers."""
+    primes = []
+    candidate = 2
+    while len(primes) < nr_primes:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate_12(size, rng):
+    """
+    Generate a square heightmap with side {size}.
+
+    Elevation increases from 'a' in the first column to 'z' in the last one,
+    with random dips elsewhere. The dips spare one row, ensuring a path from S
+    (in the first column) via that row to E (in the last column).
+    """
+    path_row = rng.randrange(size)
+    rows = []
+    for idx_y in range(size):
+        row = []
+        for idx_x in range(size):
+            level = min(idx_x * 26 // size, 25)
+            if idx_y != path_row and idx_x > 0 and rng.random() < 0.3:
+                level = max(level - rng.randint(0, 3), 0)
+            row.append(chr(ord("a") + level))
+        rows.append(row)
+    rows[rng.randrange(size)][0] = "S"
+    rows[path_row][size - 1] = "E"
+    return (join_lines("".join(row) for row in rows),)
+
+
+def generate_13(size, rng):
+    """
+    Generate {size} pairs of packets.
+
+    Every packet starts with a unique integer (other than the divider packets'
+    2 and 6), so that no two packets (or a packet and a divider) are tied.
+    """
+    first_values = [v for v in range(2 * size + 2) if v not in (2, 6)]
+    rng.shuffle(first_values)
+    lines = []
+    for idx in range(size):
+        for first_value in first_values[2 * idx : 2 * idx + 2]:
+            packet = [first_value] + generate_packet_list(rng, 3)
+            lines.append(str(packet).replace(" ", ""))
+        lines.append("")
+    return (join_lines(lines[:-1]),)
+
+
+def generate_packet_list(rng, max_depth):
+    """Generate a random list of integers and nested lists."""
+    packet_list = []
+    for _ in range(rng.randint(0, 4)):
+        if max_depth > 0 and rng.random() < 0.3:
+            packet_list.append(generate_packet_list(rng, max_depth - 1))
+        else:
+            packet_list.append(rng.randint(0, 10))
+    return packet_list
+
+
+def generate_14(size, rng):
+    """
+    Generate {size} rock paths, below the sand source.
+
+    All rock lies within the cone |x - 500| < y, so that the sand (without a
+    floor) can always flow around it into the abyss, rather than pile up until
+    it blocks the source.
+    """
+    depth = 10 + int(3 * math.sqrt(size))
+    # Ensure that rock paths are on both sides of the sand source:
+    lines = [f"{500 - depth // 4},{depth} -> {500 + depth // 4},{depth}"]
+    for _ in range(size - 1):
+        pos_y = rng.randint(2, depth)
+        pos_x = 500 + rng.randint(1 - pos_y, pos_y - 1)
+        points = [(pos_x, pos_y)]
+        for idx in range(rng.randint(1, 4)):
+            length = rng.choice((-1, 1)) * rng.randint(1, 6)
+            if idx % 2 == 0:
+                pos_x = min(max(pos_x + length, 501 - pos_y), 499 + pos_y)
+            else:
+                pos_y = min(max(pos_y + length, abs(pos_x - 500) + 1), depth)
+            points.append((pos_x, pos_y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return (join_lines(lines),)
+
+
+def generate_15(size, rng):
+    """
+    Generate {size} sensors with their closest beacons.
+
+    Four sensors, diagonally far outside the search area of the registered
+    parameters, together cover all of the area except one hidden distress
+    beacon position: the one at corner offset (d, d) covers the positions that
+    are right of or below that position, and so on. The other sensors are drawn
+    from the search area, with coverage that excludes the hidden position.
+    """
+    area_max = 4_000_000
+    hidden_x, hidden_y = rng.randint(0, area_max), rng.randint(0, area_max)
+    offset = 2 * area_max
+    lines = []
+    for sign_x, sign_y in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        pos_x, pos_y = hidden_x + sign_x * offset, hidden_y + sign_y * offset
+        # The closest beacon is next to the hidden position, at the radius:
+        lines.append(
+            f"Sensor at x={pos_x}, y={pos_y}: closest beacon is at "
+            f"x={hidden_x}, y={hidden_y + sign_y}"
+        )
+    while len(lines) < size:
+        pos_x, pos_y = rng.randint(0, area_max), rng.randint(0, area_max)
+        distance = abs(pos_x - hidden_x) + abs(pos_y - hidden_y)
+        if distance < 2:
+            continue
+        radius = rng.randint(max(distance // 2, 1), distance - 1)
+        delta_x = rng.randint(-radius, radius)
+        delta_y = rng.choice((-1, 1)) * (radius - abs(delta_x))
+        lines.append(
+            f"Sensor at x={pos_x}, y={pos_y}: closest beacon is at "
+            f"x={pos_x + delta_x}, y={pos_y + delta_y}"
+        )
+    rng.shuffle(lines)
+    return (join_lines(lines),)
+
+
+def generate_16(size, rng):
+    """
+    Generate a connected network of {size} valves.
+
+    At most 15 valves have a positive flow rate, as the number of key-valve
+    sets (and hence the running time) is exponential in their number.
+    """
+    names = ["AA"]
+    for length in itertools.count(2):
+        for letters in itertools.product(string.ascii_uppercase, repeat=length):
+            if len(names) == size:
+                break
+            if "".join(letters) != "AA":
+                names.append("".join(letters))
+        if len(names) == size:
+            break
+
+    neighbors = [set() for _ in range(size)]
+    for idx in range(1, size):
+        other = rng.randrange(idx)
+        neighbors[idx].add(other)
+        neighbors[other].add(idx)
+    for _ in range(size // 5):
+        idx_1, idx_2 = rng.sample(range(size), 2)
+        neighbors[idx_1].add(idx_2)
+        neighbors[idx_2].add(idx_1)
+
+    key_indices = set(rng.sample(range(1, size), min(15, size - 1)))
+    lines = []
+    for idx in range(size):
+        flow_rate = rng.randint(1, 25) if idx in key_indices else 0
+        neighbor_names = [names[n] for n in sorted(neighbors[idx])]
+        if len(neighbor_names) == 1:
+            tunnels = f"tunnel leads to valve {neighbor_names[0]}"
+        else:
+            tunnels = f"tunnels lead to valves {', '.join(neighbor_names)}"
+        lines.append(f"Valve {names[idx]} has flow rate={flow_rate}; {tunnels}")
+    rng.shuffle(lines)
+    return (join_lines(lines),)
+
+
+def generate_17(size, rng):
+    """
+    Generate a jet pattern of {size} jets.
+
+    (With much shorter patterns, the chamber state may never repeat.)
+    """
+    return ("".join(rng.choices("<>", k=size)) + "\n",)
+
+
+def generate_18(size, rng):
+    """Generate {size} distinct cubes, filling about half of a bounding box."""
+    side = max(math.ceil((2 * size) ** (1 / 3)), 2)
+    lines = []
+    for idx in rng.sample(range(side**3), size):
+        pos_x, pos_y, pos_z = idx % side, (idx // side) % side, idx // side**2
+        lines.append(f"{pos_x + 1},{pos_y + 1},{pos_z + 1}")
+    return (join_lines(lines),)
+
+
+def generate_19(size, rng):
+    """Generate {size} blueprints."""
+    lines = []
+    for idx in range(1, size + 1):
+        lines.append(
+            f"Blueprint {idx}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+        )
+    return (join_lines(lines),)
+
+
+def generate_20(size, rng):
+    """Generate an encrypted file of {size} numbers, exactly one being 0."""
+    numbers = [
+        rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(size)
+    ]
+    numbers[rng.randrange(size)] = 0
+    return (join_lines(str(n) for n in numbers),)
+
+
+def generate_21(size, rng):
+    """
+    Generate the jobs of {size} monkeys (rounded up to an odd number).
+
+    The monkeys form a binary expression tree. One input of 'root' depends on
+    'humn' (through additions, subtractions, and multiplications only); the
+    other input adds or subtracts a constant to make the part-2 answer a random
+    integer. Divisions are only generated where they are exact.
+    """
+    if size > 26**4 - 1:
+        raise ValueError("Monkey names are limited to four lowercase letters!")
+    names = iter(
+        rng.sample(
+            [
+                "".join(letters)
+                for letters in itertools.product(
+                    string.ascii_lowercase, repeat=4
+                )
+                if "".join(letters) not in ("root", "humn")
+            ],
+            size,
+        )
+    )
+    nr_humn_side = 2 * rng.randint(0, (size - 5) // 2) + 1
+    nr_other_side = size - 3 - nr_humn_side + (size % 2 == 0)
+    humn_leaf = rng.randrange((nr_humn_side + 1) // 2)
+    humn_answer = rng.randint(1, 10_000)
+
+    lines = []
+    leaf_counter = itertools.count()
+    humn_side = add_monkey_subtree(
+        rng, lines, names, nr_humn_side, leaf_counter, humn_leaf, humn_answer
+    )
+    other_side = add_monkey_subtree(
+        rng, lines, names, nr_other_side, itertools.count(), None, None
+    )
+    # Let the other side yell the humn side's number for the part-2 answer:
+    target = humn_side[2]
+    difference = target - other_side[1]
+    constant_name, adjusted_name = next(names), next(names)
+    lines.append(f"{constant_name}: {abs(difference)}")
+    operation = "+" if difference >= 0 else "-"
+    lines.append(
+        f"{adjusted_name}: {other_side[0]} {operation} {constant_name}"
+    )
+    inputs = [humn_side[0], adjusted_name]
+    rng.shuffle(inputs)
+    lines.append(f"root: {inputs[0]} + {inputs[1]}")
+    rng.shuffle(lines)
+    return (join_lines(lines),)
+
+
+def add_monkey_subtree(
+    rng, lines, names, nr_monkeys, leaf_counter, humn_leaf, humn_answer
+):
+    """
+    Add the jobs of a subtree of monkeys, return its name and numbers.
+
+    The numbers are the one yelled in part 1 and, if 'humn' is in the subtree,
+    the one yelled if 'humn' yells the part-2 answer.
+    """
+    if nr_monkeys == 1:
+        if next(leaf_counter) == humn_leaf:
+            number = rng.randint(1, 10)
+            lines.append(f"humn: {number}")
+            return "humn", number, humn_answer
+        name = next(names)
+        number = rng.randint(1, 10)
+        lines.append(f"{name}: {number}")
+        return name, number, number
+
+    nr_left = 2 * rng.randint(0, (nr_monkeys - 3) // 2) + 1
+    left = add_monkey_subtree(
+        rng, lines, names, nr_left, leaf_counter, humn_leaf, humn_answer
+    )
+    right = add_monkey_subtree(
+        rng,
+        lines,
+        names,
+        nr_monkeys - 1 - nr_left,
+        leaf_counter,
+        humn_leaf,
+        humn_answer,
+    )
+    on_humn_path = (
+        left[1] != left[2]
+        or right[1] != right[2]
+        or ("humn" in (left[0], right[0]))
+    )
+    operations = ["+", "-"]
+    if abs(left[1] * right[1]) < 10**12 and not (
+        on_humn_path and (left[1] == 0 or right[1] == 0)
+    ):
+        operations.append("*")
+    if not on_humn_path and right[1] != 0 and left[1] % right[1] == 0:
+        operations.append("/")
+    operation = rng.choice(operations)
+    name = next(names)
+    lines.append(f"{name}: {left[0]} {operation} {right[0]}")
+    return (
+        name,
+        evaluate_operation(left[1], right[1], operation),
+        evaluate_operation(left[2], right[2], operation),
+    )
+
+
+def evaluate_operation(number_1, number_2, operation):
+    """Evaluate a (integer) monkey operation."""
+    if operation == "+":
+        return number_1 + number_2
+    elif operation == "-":
+        return number_1 - number_2
+    elif operation == "*":
+        return number_1 * number_2
+    elif operation == "/":
+        return number_1 // number_2
+
+
+def generate_22(size, rng):
+    """
+    Generate a board of six {size} x {size} faces, and a path of 4 x {size}
+    moves.
+
+    The faces are laid out in the same cube net as the puzzle input.
+    """
+    net_positions = ((0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0))
+    map_lines = []
+    for net_y in range(4):
+        for frow in range(size):
+            line = ""
+            for net_x in range(3):
+                if (net_y, net_x) not in net_positions:
+                    line += " " * size
+                    continue
+                for fcol in range(size):
+                    is_start = (net_y, net_x, frow, fcol) == (0, 1, 0, 0)
+                    is_wall = not is_start and rng.random() < 0.1
+                    line += "#" if is_wall else "."
+            map_lines.append(line.rstrip())
+
+    moves = str(rng.randint(1, size))
+    for _ in range(4 * size - 1):
+        moves += rng.choice("LR") + str(rng.randint(1, size))
+    return join_lines(map_lines), moves + "\n"
+
+
+def generate_23(size, rng):
+    """Generate a square grid with side {size}, about one-third elves."""
+    lines = []
+    for _ in range(size):
+        lines.append(
+            "".join("#" if rng.random() < 1 / 3 else "." for _ in range(size))
+        )
+    if "#" not in "".join(lines):
+        lines[0] = "#" + lines[0][1:]
+    return (join_lines(lines),)
+
+
+def generate_24(size, rng):
+    """
+    Generate a valley with blizzards, of width {size} (height {size} / 5).
+
+    Valleys are generated until one is found in which the sink can be reached.
+    """
+    height = max(size // 5, 2)
+    while True:
+        rows = [
+            "".join(
+                rng.choice("<>^v") if rng.random() < 0.3 else "."
+                for _ in range(size)
+            )
+            for _ in range(height)
+        ]
+        if can_cross_valley(rows):
+            break
+    lines = ["#." + "#" * size]
+    lines.extend(f"#{row}#" for row in rows)
+    lines.append("#" * size + ".#")
+    return (join_lines(lines),)
+
+
+def can_cross_valley(rows):
+    """
+    Check whether the sink can be reached from the source of a valley.
+
+    The positions that can be reached are tracked as one bitmask per row. As
+    the blizzards repeat every lcm(height, width) minutes, the search gives up
+    after (height + width) such cycles.
+    """
+    height, width = len(rows), len(rows[0])
+    full = (1 << width) - 1
+    masks = {
+        direction: [
+            sum(1 << col for col, tile in enumerate(row) if tile == direction)
+            for row in rows
+        ]
+        for direction in "<>^v"
+    }
+    can_reach = [0] * height
+    for minute in range(1, math.lcm(height, width) * (height + width) + 1):
+        if can_reach[-1] >> (width - 1) & 1:
+            return True
+        shift = minute % width
+        updated = []
+        for idx in range(height):
+            right = masks[">"][idx]
+            left = masks["<"][idx]
+            is_blizzard = (
+                (right << shift | right >> (width - shift))
+                | (left >> shift | left << (width - shift))
+                | masks["v"][(idx - minute) % height]
+                | masks["^"][(idx + minute) % height]
+            )
+            reach = can_reach[idx]
+            reach |= reach << 1 | reach >> 1
+            if idx > 0:
+                reach |= can_reach[idx - 1]
+            else:
+                reach |= 1
+            if idx < height - 1:
+                reach |= can_reach[idx + 1]
+            updated.append(reach & ~is_blizzard & full)
+        can_reach = updated
+    return False
+
+
+def generate_25(size, rng):
+    """Generate {size} SNAFU numbers."""
+    lines = []
+    for _ in range(size):
+        number = rng.randint(1, 5 ** rng.randint(1, 20))
+        snafu = ""
+        while number:
+            number, remainder = divmod(number, 5)
+            if remainder > 2:
+                remainder -= 5
+                number += 1
+            snafu = "=-012"[remainder + 2] + snafu
+        lines.append(snafu)
+    return (join_lines(lines),)
+
+
+GENERATORS = {
+    (2022, 1): (generate_01, 3),
+    (2022, 2): (generate_02, 1),
+    (2022, 3): (generate_03, 3),
+    (2022, 4): (generate_04, 1),
+    (2022, 5): (generate_05, 1),
+    (2022, 6): (generate_06, 14),
+    (2022, 7): (generate_07, 1),
+    (2022, 8): (generate_08, 1),
+    (2022, 9): (generate_09, 1),
+    (2022, 10): (generate_10, 240),
+    (2022, 11): (generate_11, 2),
+    (2022, 12): (generate_12, 26),
+    (2022, 13): (generate_13, 1),
+    (2022, 14): (generate_14, 1),
+    (2022, 15): (generate_15, 4),
+    (2022, 16): (generate_16, 2),
+    (2022, 17): (generate_17, 100),
+    (2022, 18): (generate_18, 1),
+    (2022, 19): (generate_19, 1),
+    (2022, 20): (generate_20, 3),
+    (2022, 21): (generate_21, 5),
+    (2022, 22): (generate_22, 2),
+    (2022, 23): (generate_23, 1),
+    (2022, 24): (generate_24, 2),
+    (2022, 25): (generate_25, 1),
+}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+This module provides a compact grid type for grid-based puzzles.
+
+A Grid stores its cells row-major in one flat bytearray (or array.array, for
+other value types), rather than as a list of row lists with a pointer per cell.
+Cells are addressed by a single index: the cell at (y, x) has index
+(y + padding) * stride + (x + padding), so its neighbors are at fixed offsets,
+listed in the 'neighbor_offsets' and 'diagonal_offsets' attributes. A border of
+'padding' extra cells around the interior, filled with a chosen value (e.g. a
+wall), removes the need for bounds checks when visiting neighbors.
+"""
+
+from array import array
+
+BYTE_TYPECODE = "B"
+
+
+class Grid:
+    """Class to represent a rectangular grid, stored row-major in an array."""
+
+    def __init__(
+        self, height, width, fill=0, padding=0, border=None, typecode="B"
+    ):
+        """Create a grid of given size, optionally padded by a border."""
+        self.height = height
+        self.width = width
+        self.padding = padding
+        self.typecode = typecode
+        self.stride = width + 2 * padding
+        self.cells = self._make_cells(
+            fill, self.stride * (height + 2 * padding)
+        )
+        if padding and border is not None and border != fill:
+            self.fill_border(border)
+        self._set_offsets()
+
+    @classmethod
+    def from_lines(
+        cls, lines, values=None, padding=0, border=None, typecode="B"
+    ):
+        """Create a grid from lines of text, mapping characters to values."""
+        lines = [line for line in lines]
+        grid = cls(len(lines), len(lines[0]), 0, padding, border, typecode)
+        for idx_y, line in enumerate(lines):
+            if values is None:
+                row = [ord(char) for char in line]
+            else:
+                row = [values[char] for char in line]
+            grid.set_row(idx_y, row)
+        return grid
+
+    def _make_cells(self, value, length):
+        """Make a flat cell array, with all cells set to a value."""
+        if self.typecode == BYTE_TYPECODE:
+            return bytearray([value]) * length
+        return array(self.typecode, [value]) * length
+
+    def _set_offsets(self):
+        """Set the index offsets to the (orthogonal and diagonal) neighbors."""
+        # The orthogonal neighbors, clockwise from up: up, right, down, left.
+        self.neighbor_offsets = (-self.stride, 1, self.stride, -1)
+        # The diagonal neighbors, clockwise from up-right.
+        self.diagonal_offsets = (
+            1 - self.stride,
+            1 + self.stride,
+            self.stride - 1,
+            -1 - self.stride,
+        )
+
+    def index(self, idx_y, idx_x):
+        """Get the flat index of the cell at (y, x)."""
+        return (idx_y + self.padding) * self.stride + idx_x + self.padding
+
+    def position(self, index):
+        """Get the (y, x) position of the cell at a flat index."""
+        idx_y, idx_x = divmod(index, self.stride)
+        return idx_y - self.padding, idx_x - self.padding
+
+    def __getitem__(self, position):
+        """Get the value of the cell at (y, x)."""
+        return self.cells[self.index(*position)]
+
+    def __setitem__(self, position, value):
+        """Set the value of the cell at (y, x)."""
+        self.cells[self.index(*position)] = value
+
+    def get_row(self, idx_y):
+        """Get a copy of the (interior) values of a row."""
+        start = self.index(idx_y, 0)
+        return self.cells[start : start + self.width]
+
+    def set_row(self, idx_y, values):
+        """Set the (interior) values of a row."""
+        start = self.index(idx_y, 0)
+        if self.typecode == BYTE_TYPECODE:
+            self.cells[start : start + self.width] = bytes(values)
+        else:
+            self.cells[start : start + self.width] = array(
+                self.typecode, values
+            )
+
+    def iter_indices(self):
+        """Iterate over the flat indices of the interior cells, row by row."""
+        for idx_y in range(self.height):
+            start = self.index(idx_y, 0)
+            yield from range(start, start + self.width)
+
+    def fill(self, value):
+        """Set all interior cells to a value (leaving the border as is)."""
+        row = self._make_cells(value, self.width)
+        for idx_y in range(self.height):
+            start = self.index(idx_y, 0)
+            self.cells[start : start + self.width] = row
+
+    def fill_border(self, value):
+        """Set all border cells to a value."""
+        padding_rows = self._make_cells(value, self.padding * self.stride)
+        self.cells[: len(padding_rows)] = padding_rows
+        self.cells[len(self.cells) - len(padding_rows) :] = padding_rows
+        padding_cols = self._make_cells(value, self.padding)
+        for idx_y in range(self.height):
+            start = self.index(idx_y, 0)
+            self.cells[start - self.padding : start] = padding_cols
+            end = start + self.width
+            self.cells[end : end + self.padding] = padding_cols
+
+    def add_rows(self, nr_rows, fill=0):
+        """Add rows after the last row (keeping the border below them)."""
+        rows = self._make_cells(fill, nr_rows * self.stride)
+        if self.padding:
+            border = self.cells[self.index(self.height - 1, -self.padding)]
+            for idx_y in range(nr_rows):
+                start = idx_y * self.stride
+                rows[start : start + self.padding] = self._make_cells(
+                    border, self.padding
+                )
+                end = start + self.stride
+                rows[end - self.padding : end] = self._make_cells(
+                    border, self.padding
+                )
+            insert_at = self.index(self.height, -self.padding)
+            self.cells[insert_at:insert_at] = rows
+        else:
+            self.cells.extend(rows)
+        self.height += nr_rows
+
+    def count(self, value):
+        """Count the interior cells with a given value."""
+        if not self.padding:
+            return self.cells.count(value)
+        return sum(
+            self.get_row(idx_y).count(value) for idx_y in range(self.height)
+        )
+
+    def copy(self):
+        """Create a copy of the grid."""
+        grid = type(self).__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells[:]
+        return grid
@@ -0,0 +1,173 @@
+"""
+Profile the memory use of a puzzle part, per allocation site in its solution.
+
+A part is solved while tracemalloc traces allocations (with full tracebacks),
+which is slow, so memory is profiled in a run separate from the timed runs. The
+profile holds the peak traced memory, the high-water mark of the resident memory
+(RSS) during the run, and the memory in use near the peak broken down by the
+line of the solution module that allocated it: allocations made in other
+modules (e.g. by aoc_tools or the Grid type) are attributed to the line of the
+solution module that called them. To find the composition near the peak, a
+snapshot is taken whenever a function of the solution module returns with the
+traced memory grown by a factor since the last snapshot; the last one is used.
+Example, from the repository root:
+
+    python -m commons.memory --day 17 --part 2 --top 5
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tracemalloc
+
+import aoc_tools as aoc
+import puzzles
+import run
+
+DEFAULT_TOP = 10
+SNAPSHOT_GROWTH = 1.25
+TRACEBACK_LIMIT = 64
+CLEAR_REFS_PATH = "/proc/self/clear_refs"
+STATUS_PATH = "/proc/self/status"
+KILOBYTE = 1024
+
+
+def main():
+    args = parse_arguments()
+    parts = [args.part] if args.part is not None else None
+    if parts is None:
+        parts = list(puzzles.get_puzzle(args.year, args.day)["parts"])
+    results = [
+        profile_part(args.year, args.day, p, args.input, args.example, args.top)
+        for p in parts
+    ]
+    print(json.dumps(results, indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, help="default: all parts")
+    parser.add_argument(
+        "--input",
+        action="append",
+        help="input file (repeat for puzzles with multiple input files)",
+    )
+    parser.add_argument(
+        "--example",
+        type=int,
+        nargs="?",
+        const=1,
+        help="profile the (n-th) example instead of the puzzle input",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of allocation sites to report",
+    )
+    return parser.parse_args(argv)
+
+
+def profile_part(
+    year, day, part, filenames=None, example=None, top=DEFAULT_TOP
+):
+    """Solve a part while tracing memory, and return its memory profile."""
+    module = puzzles.load_module(year, day)
+    tracker = PeakTracker(os.path.abspath(module.__file__))
+    aoc.clear_parse_cache()
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()
+    tracemalloc.start(TRACEBACK_LIMIT)
+    is_rss_reset = reset_rss_peak()
+    previous_profiler = sys.getprofile()
+    sys.setprofile(tracker)
+    try:
+        run.solve_part(year, day, part, filenames, example)
+    finally:
+        sys.setprofile(previous_profiler)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+        aoc.clear_parse_cache()
+    return {
+        "peak_memory": peak_memory,
+        "peak_rss": get_rss_peak(),
+        "is_rss_reset": is_rss_reset,
+        "snapshot_memory": tracker.snapshot_memory,
+        "allocation_sites": tracker.get_allocation_sites(top),
+    }
+
+
+class PeakTracker:
+    """Class to keep a snapshot of the traced memory near its peak."""
+
+    def __init__(self, module_path, growth=SNAPSHOT_GROWTH):
+        """Create a tracker for the functions of a (solution) module."""
+        self.module_path = module_path
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_memory = 0
+
+    def __call__(self, frame, event, arg):
+        """Take a snapshot on returns from the module, if memory has grown."""
+        if event != "return" or frame.f_code.co_filename != self.module_path:
+            return
+        memory = tracemalloc.get_traced_memory()[0]
+        if memory > self.snapshot_memory * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_memory = memory
+
+    def get_allocation_sites(self, top=DEFAULT_TOP):
+        """Get the largest allocation sites in the module, in the snapshot."""
+        if self.snapshot is None:
+            return []
+        sites = {}
+        for trace in self.snapshot.traces:
+            site = "other"
+            for frame in reversed(trace.traceback):
+                if frame.filename == self.module_path:
+                    site = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+                    break
+            size_count = sites.setdefault(site, [0, 0])
+            size_count[0] += trace.size
+            size_count[1] += 1
+        ranked = sorted(sites.items(), key=lambda s: s[1][0], reverse=True)
+        return [
+            {"site": site, "size": size, "count": count}
+            for site, (size, count) in ranked[:top]
+        ]
+
+
+def reset_rss_peak():
+    """Reset the RSS high-water mark of this process, if the OS allows it."""
+    try:
+        with open(CLEAR_REFS_PATH, "w") as file_object:
+            file_object.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_rss_peak():
+    """Get the RSS high-water mark of this process, in bytes."""
+    try:
+        with open(STATUS_PATH) as file_object:
+            for line in file_object:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * KILOBYTE
+    except OSError:
+        pass
+    # On Linux, the maximum RSS is reported in kilobytes (on macOS, in bytes):
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * KILOBYTE
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Solve all (selected) puzzle parts concurrently, in a pool of processes.
+
+The parts are submitted longest-first, using the times of an earlier run (a
+benchmark report or a report of this driver): parts without a historical time
+are submitted first, and so are assumed to be long. Without such a history, the
+default estimates of the heavy parts are used, and other parts are assumed to be
+short. Every part is given a time limit, after which its worker gives up on it.
+The answers and timings are aggregated into one JSON report, which can be stored
+to serve as history for the next run. Example, from the repository root:
+
+    python -m commons.parallel --history timings.json --save timings.json
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import os
+import signal
+import time
+
+import aoc_tools as aoc
+import puzzles
+import run
+
+DEFAULT_TIMEOUT = 300.0
+# Estimated times of the heavy parts (in seconds, from a benchmark run):
+DEFAULT_COSTS = {
+    (2022, 20, 2): 1.6,
+    (2022, 14, 2): 0.5,
+    (2022, 23, 2): 0.45,
+    (2022, 11, 2): 0.3,
+    (2022, 16, 1): 0.25,
+    (2022, 20, 1): 0.2,
+    (2022, 19, 1): 0.15,
+    (2022, 16, 2): 0.1,
+    (2022, 19, 2): 0.05,
+}
+
+
+def main():
+    args = parse_arguments()
+    history = load_history(args.history) if args.history else {}
+    report = solve_concurrently(
+        args.year, args.day, args.workers, args.timeout, history
+    )
+    if args.save is not None:
+        with open(args.save, "w") as file_object:
+            json.dump(report, file_object, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--day", type=int)
+    parser.add_argument(
+        "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="time limit per part, in seconds",
+    )
+    parser.add_argument("--history", help="report with earlier timings")
+    parser.add_argument("--save", help="store the report (to use as history)")
+    return parser.parse_args(argv)
+
+
+def solve_concurrently(
+    year=None, day=None, workers=None, timeout=DEFAULT_TIMEOUT, history=None
+):
+    """Solve the selected parts in a process pool, and aggregate the results."""
+    jobs = schedule_jobs(list(puzzles.iter_parts(year, day)), history or {})
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_job, *job, timeout) for job in jobs]
+        results = [future.result() for future in as_completed(futures)]
+    wall_time = time.perf_counter() - start
+    results.sort(key=lambda r: (r["year"], r["day"], r["part"]))
+    total_time = sum(r["parse_time"] + r["solve_time"] for r in results)
+    return {
+        "workers": workers or os.cpu_count(),
+        "wall_time": wall_time,
+        "total_time": total_time,
+        "max_time": max(r["parse_time"] + r["solve_time"] for r in results),
+        "results": results,
+    }
+
+
+def schedule_jobs(jobs, history):
+    """Order jobs longest-first, by history if given, else by the defaults."""
+    if not history:
+        return sorted(jobs, key=lambda job: -DEFAULT_COSTS.get(job, 0.0))
+    return sorted(jobs, key=lambda job: -history.get(job, float("inf")))
+
+
+def load_history(path):
+    """Load puzzle input timings, from a benchmark or parallel report."""
+    with open(path) as file_object:
+        report = json.load(file_object)
+    history = {}
+    for result in report["results"]:
+        if result.get("input", "puzzle") != "puzzle":
+            continue
+        if "median" in result:
+            elapsed = result["median"]
+        else:
+            elapsed = result["parse_time"] + result["solve_time"]
+        history[(result["year"], result["day"], result["part"])] = elapsed
+    return history
+
+
+def solve_job(year, day, part, timeout=None):
+    """Solve a part (in a worker process), giving up after the time limit."""
+    result = {"year": year, "day": day, "part": part, "input": "puzzle"}
+    aoc.clear_progress()
+    start = time.perf_counter()
+    previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    if timeout:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        solved = run.solve_part(year, day, part)
+    except JobTimeout:
+        status, answer = "timeout", None
+        result["progress"] = aoc.get_progress()
+    except Exception as e:
+        status, answer = f"error: {e!r}", None
+    else:
+        status, answer = "ok", solved["answer"]
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+    if status == "ok":
+        parse_time, solve_time = solved["parse_time"], solved["solve_time"]
+    else:
+        parse_time, solve_time = 0.0, time.perf_counter() - start
+    result.update(
+        status=status,
+        answer=answer,
+        parse_time=parse_time,
+        solve_time=solve_time,
+        pid=os.getpid(),
+    )
+    return result
+
+
+def raise_timeout(signum, frame):
+    """Handle the alarm signal of an expired time limit."""
+    raise JobTimeout
+
+
+class JobTimeout(Exception):
+    """Exception raised when a part exceeds its time limit."""
+
+
+if __name__ == "__main__":
+    main()
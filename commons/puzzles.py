@@ -0,0 +1,365 @@
+"""
+This module registers the puzzle solutions, their input files and parameters.
+
+Every puzzle is identified by a (year, day) tuple, mapping to a dictionary with:
+
+* "inputs": the input filenames, relative to the directory of the solution;
+* "examples": a tuple of example input filename tuples;
+* "parsers": the (dotted) names of the functions that read and parse the input,
+  used to time parsing separately from solving;
+* "parts": for every part, a (solver, keyword arguments, result index) tuple,
+  where the result index selects one element if the solver returns a tuple;
+* "example_kwargs" (optional): keyword arguments that differ for the examples;
+* "batch" (optional): a (solver, keyword arguments) tuple, for a solver that
+  returns the answers of all parts at once, sharing intermediate results.
+"""
+
+import importlib.util
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PUZZLES = {
+    (2022, 1): {
+        "inputs": ("input_01.txt",),
+        "examples": (("input_01_example.txt",),),
+        "parsers": ("aoc.iter_stripped_lines",),
+        "parts": {
+            1: ("sum_top_totals", {"cut_off_rank": 1}, None),
+            2: ("sum_top_totals", {"cut_off_rank": 3}, None),
+        },
+        "batch": ("sum_top_totals_for_ranks", {"cut_off_ranks": (1, 3)}),
+    },
+    (2022, 2): {
+        "inputs": ("input_02.txt",),
+        "examples": (("input_02_example.txt",),),
+        "parsers": ("count_rounds",),
+        "parts": {
+            1: ("evaluate_strategy_guide", {"part": 1}, None),
+            2: ("evaluate_strategy_guide", {"part": 2}, None),
+        },
+        "batch": ("solve_parts", {}),
+    },
+    (2022, 3): {
+        "inputs": ("input_03.txt",),
+        "examples": (("input_03_example.txt",),),
+        "parsers": ("aoc.read_stripped_lines",),
+        "parts": {
+            1: ("sum_two_type_priorities", {}, None),
+            2: ("sum_badge_type_priorities", {}, None),
+        },
+        "batch": ("solve_parts", {}),
+    },
+    (2022, 4): {
+        "inputs": ("input_04.txt",),
+        "examples": (("input_04_example.txt",),),
+        "parsers": ("parse_endpoints",),
+        "parts": {
+            1: ("count_supersets", {}, None),
+            2: ("count_overlaps", {}, None),
+        },
+        "batch": ("count_pairs", {}),
+    },
+    (2022, 5): {
+        "inputs": ("input_05a.txt", "input_05b.txt"),
+        "examples": (("input_05a_example.txt", "input_05b_example.txt"),),
+        "parsers": ("initialize_stacks", "aoc.read_stripped_lines"),
+        "parts": {
+            1: ("get_final_top_crates", {"mover_9001": False}, None),
+            2: ("get_final_top_crates", {"mover_9001": True}, None),
+        },
+    },
+    (2022, 6): {
+        "inputs": ("input_06.txt",),
+        "examples": tuple((f"input_06_example_{i}.txt",) for i in range(1, 6)),
+        "parsers": ("aoc.read_stripped",),
+        "parts": {
+            1: ("get_first_start_marker", {"pattern_length": 4}, None),
+            2: ("get_first_start_marker", {"pattern_length": 14}, None),
+        },
+    },
+    (2022, 7): {
+        "inputs": ("input_07.txt",),
+        "examples": (("input_07_example.txt",),),
+        "parsers": ("get_directories",),
+        "parts": {
+            1: ("sum_small_directory_sizes", {}, None),
+            2: ("get_size_delete_directory", {}, None),
+        },
+    },
+    (2022, 8): {
+        "inputs": ("input_08.txt",),
+        "examples": (("input_08_example.txt",),),
+        "parsers": ("aoc.read_stripped_lines",),
+        "parts": {
+            1: ("calculate_tree_house_metrics", {}, 0),
+            2: ("calculate_tree_house_metrics", {}, 1),
+        },
+    },
+    (2022, 9): {
+        "inputs": ("input_09.txt",),
+        "examples": (("input_09_example_1.txt",), ("input_09_example_2.txt",)),
+        "parsers": ("initialize_moves",),
+        "parts": {
+            1: ("count_visited_positions", {"nr_knots": 2}, None),
+            2: ("count_visited_positions", {"nr_knots": 10}, None),
+        },
+    },
+    (2022, 10): {
+        "inputs": ("input_10.txt",),
+        "examples": (("input_10_example.txt",),),
+        "parsers": ("aoc.read_stripped_lines",),
+        "parts": {
+            1: ("simulate_crt", {}, 0),
+            2: ("simulate_crt", {}, 1),
+        },
+    },
+    (2022, 11): {
+        "inputs": ("input_11.txt",),
+        "examples": (("input_11_example.txt",),),
+        "parsers": ("initialize_monkeys",),
+        "parts": {
+            1: (
+                "calculate_business_level",
+                {"nr_rounds": 20, "worry_management": 1},
+                None,
+            ),
+            2: (
+                "calculate_business_level",
+                {"nr_rounds": 10_000, "worry_management": 2},
+                None,
+            ),
+        },
+    },
+    (2022, 12): {
+        "inputs": ("input_12.txt",),
+        "examples": (("input_12_example.txt",),),
+        "parsers": ("set_heightmap",),
+        "parts": {
+            1: ("compute_shortest", {"fix_source": True}, None),
+            2: ("compute_shortest", {"fix_source": False}, None),
+        },
+    },
+    (2022, 13): {
+        "inputs": ("input_13.txt",),
+        "examples": (("input_13_example.txt",),),
+        "parsers": ("aoc.read_stripped_lines",),
+        "parts": {
+            1: ("sum_indices", {}, None),
+            2: ("compute_decoder_key", {}, None),
+        },
+    },
+    (2022, 14): {
+        "inputs": ("input_14.txt",),
+        "examples": (("input_14_example.txt",),),
+        "parsers": ("initialize_grid",),
+        "parts": {
+            1: ("compute_rest_units", {"has_floor": False}, None),
+            2: ("compute_rest_units", {"has_floor": True}, None),
+        },
+    },
+    (2022, 15): {
+        "inputs": ("input_15.txt",),
+        "examples": (("input_15_example.txt",),),
+        "parsers": ("initialize_sensors",),
+        "parts": {
+            1: ("count_infeasible_positions", {"pos_y": 2_000_000}, None),
+            2: (
+                "calculate_tuning_frequency",
+                {"range_x": (0, 4_000_000), "range_y": (0, 4_000_000)},
+                None,
+            ),
+        },
+        "example_kwargs": {
+            1: {"pos_y": 10},
+            2: {"range_x": (0, 20), "range_y": (0, 20)},
+        },
+    },
+    (2022, 16): {
+        "inputs": ("input_16.txt",),
+        "examples": (("input_16_example.txt",),),
+        "parsers": ("initialize_network",),
+        "parts": {
+            1: (
+                "maximize_pressure_release",
+                {"nr_minutes": 30, "nr_agents": 1},
+                None,
+            ),
+            2: (
+                "maximize_pressure_release",
+                {"nr_minutes": 26, "nr_agents": 2},
+                None,
+            ),
+        },
+        "batch": ("solve_parts", {}),
+    },
+    (2022, 17): {
+        "inputs": ("input_17.txt",),
+        "examples": (("input_17_example.txt",),),
+        "parsers": ("initialize_simulation",),
+        "parts": {
+            1: ("simulate_falling_rocks", {"nr_rocks": 2022}, None),
+            2: (
+                "simulate_falling_rocks",
+                {"nr_rocks": 1_000_000_000_000},
+                None,
+            ),
+        },
+    },
+    (2022, 18): {
+        "inputs": ("input_18.txt",),
+        "examples": (("input_18_example.txt",),),
+        "parsers": ("set_cubes",),
+        "parts": {
+            1: ("calculate_surface", {"outer": False}, None),
+            2: ("calculate_surface", {"outer": True}, None),
+        },
+    },
+    (2022, 19): {
+        "inputs": ("input_19.txt",),
+        "examples": (("input_19_example.txt",),),
+        "parsers": ("set_blueprints",),
+        "parts": {
+            1: ("summarize_evaluations", {"nr_minutes": 24}, 1),
+            2: (
+                "summarize_evaluations",
+                {"nr_minutes": 32, "max_blueprints": 3},
+                0,
+            ),
+        },
+        "batch": ("solve_parts", {}),
+    },
+    (2022, 20): {
+        "inputs": ("input_20.txt",),
+        "examples": (("input_20_example.txt",),),
+        "parsers": ("initialize_numbers",),
+        "parts": {
+            1: (
+                "sum_grove_coordinates",
+                {"decryption_key": 1, "nr_mixes": 1},
+                None,
+            ),
+            2: (
+                "sum_grove_coordinates",
+                {"decryption_key": 811589153, "nr_mixes": 10},
+                None,
+            ),
+        },
+    },
+    (2022, 21): {
+        "inputs": ("input_21.txt",),
+        "examples": (("input_21_example.txt",),),
+        "parsers": ("initialize_monkeys",),
+        "parts": {
+            1: ("calculate_number", {"override_humn": False}, None),
+            2: ("calculate_number", {"override_humn": True}, None),
+        },
+    },
+    (2022, 22): {
+        "inputs": ("input_22a.txt", "input_22b.txt"),
+        "examples": (("input_22a_example.txt", "input_22b_example.txt"),),
+        "parsers": ("read_map", "read_moves"),
+        "parts": {
+            1: ("compute_password", {"part": 1}, None),
+            2: ("compute_password", {"part": 2}, None),
+        },
+    },
+    (2022, 23): {
+        "inputs": ("input_23.txt",),
+        "examples": (("input_23_example_1.txt",), ("input_23_example_2.txt",)),
+        "parsers": ("initialize_elves", "initialize_board", "initialize_array"),
+        "parts": {
+            1: ("simulate_elves", {"max_rounds": 10}, 0),
+            2: ("simulate_elves", {}, 1),
+        },
+    },
+    (2022, 24): {
+        "inputs": ("input_24.txt",),
+        "examples": (("input_24_example.txt",),),
+        "parsers": ("initialize_valley",),
+        "parts": {
+            1: ("compute_shortest", {"nr_sink_visits": 1}, None),
+            2: ("compute_shortest", {"nr_sink_visits": 2}, None),
+        },
+    },
+    (2022, 25): {
+        "inputs": ("input_25.txt",),
+        "examples": (("input_25_example.txt",),),
+        "parsers": ("aoc.iter_stripped_lines",),
+        "parts": {
+            1: ("compute_snafu_total", {}, None),
+        },
+    },
+}
+
+
+def get_puzzle(year, day):
+    """Look up the registry entry of a puzzle."""
+    try:
+        return PUZZLES[(year, day)]
+    except KeyError as e:
+        raise ValueError(f"No solution registered for {year} day {day}!") from e
+
+
+def iter_parts(year=None, day=None):
+    """Iterate over (year, day, part) tuples of all registered puzzle parts."""
+    for (puzzle_year, puzzle_day), puzzle in PUZZLES.items():
+        if year is not None and puzzle_year != year:
+            continue
+        if day is not None and puzzle_day != day:
+            continue
+        for part in puzzle["parts"]:
+            yield puzzle_year, puzzle_day, part
+
+
+def get_day_dir(year, day):
+    """Get the directory that contains the solution of a puzzle."""
+    return os.path.join(ROOT_DIR, str(year), f"{year}_{day:02d}")
+
+
+def get_input_paths(year, day, example=None):
+    """Get the paths of the input files (or of an example) of a puzzle."""
+    puzzle = get_puzzle(year, day)
+    if example is None:
+        filenames = puzzle["inputs"]
+    else:
+        filenames = puzzle["examples"][example - 1]
+    day_dir = get_day_dir(year, day)
+    return tuple(os.path.join(day_dir, filename) for filename in filenames)
+
+
+def get_solver(year, day, part, example=None):
+    """Get the solver name, keyword arguments, and result index of a part."""
+    puzzle = get_puzzle(year, day)
+    try:
+        solver_name, kwargs, result_index = puzzle["parts"][part]
+    except KeyError as e:
+        raise ValueError(f"Puzzle {year} day {day} has no part {part}!") from e
+    if example is not None and part in puzzle.get("example_kwargs", {}):
+        kwargs = {**kwargs, **puzzle["example_kwargs"][part]}
+    return solver_name, kwargs, result_index
+
+
+def get_batch_solver(year, day):
+    """Get the name and keyword arguments of the all-parts solver, if any."""
+    return get_puzzle(year, day).get("batch")
+
+
+def get_module_path(year, day):
+    """Get the path of the solution module of a puzzle."""
+    return os.path.join(get_day_dir(year, day), f"day_{day:02d}.py")
+
+
+def load_module(year, day):
+    """Import the solution module of a puzzle (if not imported already)."""
+    name = f"day_{day:02d}"
+    path = get_module_path(year, day)
+    module = sys.modules.get(name)
+    if module is not None and os.path.abspath(module.__file__) == path:
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
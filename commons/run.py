@@ -0,0 +1,431 @@
+"""
+Solve puzzle parts from one entry point, and report the answers and timings.
+
+Only the solution module of the requested puzzle is imported. The answers are
+printed as JSON, together with the time spent on parsing the input (in the
+functions listed as parsers in the puzzle registry, and in consuming the line
+generators they may return) and the time spent on solving. Example, from the
+repository root:
+
+    python -m commons.run --year 2022 --day 16 --part 2 --input input_16.txt
+
+With a time or memory limit, every part is solved in a child process, whose
+wall time and resident memory are polled. A child that exceeds its budget is
+sent SIGUSR1, upon which it cancels the solver, and reports the progress values
+reported by the solver so far (see aoc_tools.report_progress); if it does not
+respond within a grace period, it is killed. Limits can be set per day and per
+part in a JSON budgets file, e.g. {"2022/19": {"time_limit": 60},
+"2022/19/2": {"memory_limit": 500}} (in seconds and MB, respectively). With
+--memory, every result also holds a memory profile (see memory.py), obtained in
+a separate run after the timed one.
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import types
+
+import answers
+import aoc_tools as aoc
+import memory
+import puzzles
+
+BUDGET_POLL_INTERVAL = 0.02
+CANCEL_GRACE_PERIOD = 2.0
+MEGABYTE = 1 << 20
+
+
+def main():
+    args = parse_arguments()
+    if args.backend is not None:
+        aoc.set_backend(args.backend)
+    parts = [args.part] if args.part is not None else None
+    store = None
+    if args.store is not None:
+        store = answers.AnswerStore(args.store or None)
+    budgets = {}
+    if args.budgets is not None:
+        with open(args.budgets) as file_object:
+            budgets = json.load(file_object)
+    default_budget = {
+        "time_limit": args.time_limit,
+        "memory_limit": args.memory_limit,
+    }
+    try:
+        results = solve_puzzle(
+            args.year,
+            args.day,
+            parts,
+            args.input,
+            args.example,
+            store,
+            budgets,
+            default_budget,
+        )
+    finally:
+        if store is not None:
+            store.close()
+    if args.memory:
+        for result in results:
+            result["memory"] = memory.profile_part(
+                args.year, args.day, result["part"], args.input, args.example
+            )
+    print(json.dumps(results, indent=2))
+    if store is not None:
+        info = store.info()
+        print(
+            f"Answer store: {info['hits']} hits, {info['misses']} misses.",
+            file=sys.stderr,
+        )
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, help="default: all parts")
+    parser.add_argument(
+        "--input",
+        action="append",
+        help="input file (repeat for puzzles with multiple input files)",
+    )
+    parser.add_argument(
+        "--example",
+        type=int,
+        nargs="?",
+        const=1,
+        help="solve the (n-th) example instead of the puzzle input",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=aoc.BACKENDS,
+        help=f"default: ${aoc.BACKEND_VARIABLE} or {aoc.BACKENDS[0]}",
+    )
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        const="",
+        metavar="DIRECTORY",
+        help="return stored answers, and store new ones (default directory: "
+        f"${answers.STORE_DIR_VARIABLE} or {answers.DEFAULT_STORE_DIR})",
+    )
+    parser.add_argument(
+        "--time-limit", type=float, help="wall time limit per part, in seconds"
+    )
+    parser.add_argument(
+        "--memory-limit", type=float, help="resident memory limit, in MB"
+    )
+    parser.add_argument("--budgets", help="JSON file with limits per day/part")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also profile memory use (in a separate, untimed run)",
+    )
+    return parser.parse_args(argv)
+
+
+def solve_puzzle(
+    year,
+    day,
+    parts=None,
+    filenames=None,
+    example=None,
+    store=None,
+    budgets=None,
+    default_budget=None,
+):
+    """Solve (a selection of) the parts of a puzzle, possibly with budgets."""
+    if parts is None:
+        parts = list(puzzles.get_puzzle(year, day)["parts"])
+    results = []
+    for part in parts:
+        budget = get_budget(budgets or {}, year, day, part, default_budget)
+        if budget["time_limit"] is None and budget["memory_limit"] is None:
+            result = solve_part(year, day, part, filenames, example, store)
+        else:
+            result = solve_part_within_budget(
+                year, day, part, filenames, example, store, **budget
+            )
+        results.append(result)
+    return results
+
+
+def get_budget(budgets, year, day, part, default_budget=None):
+    """Get the time and memory limits of a part, from the day/part entries."""
+    budget = {"time_limit": None, "memory_limit": None}
+    budget.update(default_budget or {})
+    budget.update(budgets.get(f"{year}/{day}", {}))
+    budget.update(budgets.get(f"{year}/{day}/{part}", {}))
+    return budget
+
+
+def solve_part(year, day, part, filenames=None, example=None, store=None):
+    """
+    Solve one part of a puzzle, and time parsing and solving separately.
+
+    If an answer store is given, a stored answer is returned without importing
+    the solution module (with zero times), and a new answer is stored.
+    """
+    puzzle = puzzles.get_puzzle(year, day)
+    if filenames is None:
+        filenames = puzzles.get_input_paths(year, day, example)
+    solver_name, kwargs, result_index = puzzles.get_solver(
+        year, day, part, example
+    )
+    if store is not None:
+        key, result = look_up_answer(store, year, day, part, filenames, example)
+        if result is not None:
+            return result
+    module = puzzles.load_module(year, day)
+    solver = getattr(module, solver_name)
+
+    with time_parsers(module, puzzle["parsers"]) as parse_timer:
+        start = time.perf_counter()
+        answer = solver(*filenames, **kwargs)
+        total_time = time.perf_counter() - start
+    if result_index is not None:
+        answer = answer[result_index]
+    result = {
+        "year": year,
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "parse_time": parse_timer.elapsed,
+        "solve_time": total_time - parse_timer.elapsed,
+    }
+    if store is not None:
+        store.put(key, answer, total_time)
+        result["stored"] = False
+    return result
+
+
+def look_up_answer(store, year, day, part, filenames, example=None):
+    """Look up a stored answer, return its key and result (None if absent)."""
+    solver_name, kwargs, result_index = puzzles.get_solver(
+        year, day, part, example
+    )
+    key = answers.make_key(
+        year,
+        day,
+        part,
+        [solver_name, result_index],
+        kwargs,
+        filenames,
+        puzzles.get_module_path(year, day),
+    )
+    stored = store.get(key)
+    if stored is None:
+        return key, None
+    return key, {
+        "year": year,
+        "day": day,
+        "part": part,
+        "answer": stored[0],
+        "parse_time": 0.0,
+        "solve_time": 0.0,
+        "stored": True,
+    }
+
+
+def solve_part_within_budget(
+    year,
+    day,
+    part,
+    filenames=None,
+    example=None,
+    store=None,
+    time_limit=None,
+    memory_limit=None,
+):
+    """
+    Solve one part in a child process, and cancel it when over budget.
+
+    The result has a status: "ok", "error: ...", "time limit", or "memory
+    limit" (with the progress reported until the cancellation), or "killed" if
+    the child did not respond to the cancellation. The memory limit (in MB) is
+    only enforced where the resident memory can be read from /proc.
+    """
+    if filenames is None:
+        filenames = puzzles.get_input_paths(year, day, example)
+    if store is not None:
+        key, result = look_up_answer(store, year, day, part, filenames, example)
+        if result is not None:
+            return {**result, "status": "ok"}
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=solve_in_child,
+        args=(sender, year, day, part, filenames, example),
+    )
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    status, cancel_time, peak_rss = None, None, 0
+    while not receiver.poll(BUDGET_POLL_INTERVAL) and process.is_alive():
+        rss = get_rss(process.pid)
+        peak_rss = max(peak_rss, rss or 0)
+        if status is None:
+            if time_limit is not None and (
+                time.perf_counter() - start > time_limit
+            ):
+                status = "time limit"
+            elif memory_limit is not None and (
+                rss is not None and rss > memory_limit * MEGABYTE
+            ):
+                status = "memory limit"
+            if status is not None:
+                os.kill(process.pid, signal.SIGUSR1)
+                cancel_time = time.perf_counter()
+        elif time.perf_counter() - cancel_time > CANCEL_GRACE_PERIOD:
+            process.kill()
+            break
+    result = receiver.recv() if receiver.poll() else None
+    process.join()
+    receiver.close()
+    if result is None:
+        result = {"year": year, "day": day, "part": part, "answer": None}
+        result["status"] = "killed" if status is not None else "crashed"
+    elif result["status"] == "cancelled":
+        result["status"] = status
+    result.update(wall_time=time.perf_counter() - start, peak_rss=peak_rss)
+    if store is not None and result["status"] == "ok":
+        total_time = result["parse_time"] + result["solve_time"]
+        store.put(key, result["answer"], total_time)
+        result["stored"] = False
+    return result
+
+
+def solve_in_child(connection, year, day, part, filenames, example=None):
+    """Solve a part (in a child process), cancelling it on SIGUSR1."""
+    signal.signal(signal.SIGUSR1, raise_cancellation)
+    aoc.clear_progress()
+    try:
+        result = solve_part(year, day, part, filenames, example)
+    except SolveCancelled:
+        result = {"year": year, "day": day, "part": part, "answer": None}
+        result.update(status="cancelled", progress=aoc.get_progress())
+    except Exception as e:
+        result = {"year": year, "day": day, "part": part, "answer": None}
+        result["status"] = f"error: {e!r}"
+    else:
+        result["status"] = "ok"
+    finally:
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+    connection.send(result)
+    connection.close()
+
+
+def raise_cancellation(signum, frame):
+    """Handle the signal to cancel a solver that exceeded its budget."""
+    raise SolveCancelled
+
+
+class SolveCancelled(Exception):
+    """Exception raised when a solver is cancelled."""
+
+
+def get_rss(pid):
+    """Get the resident memory of a process in bytes (None if unavailable)."""
+    try:
+        with open(f"/proc/{pid}/statm") as file_object:
+            resident_pages = int(file_object.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+@contextlib.contextmanager
+def time_parsers(module, parser_names):
+    """
+    Temporarily wrap the parsers of a solution module in a timer.
+
+    Only the references of the solution module are replaced: for a dotted name
+    such as "aoc.read_stripped_lines", the module's 'aoc' is replaced by an
+    overlay of the shared module, so other users of aoc_tools are not affected.
+    """
+    timer = Timer()
+    originals = []
+    for parser_name in parser_names:
+        *owner_path, attribute = parser_name.split(".")
+        owner = module
+        for name in owner_path:
+            child = getattr(owner, name)
+            if not isinstance(child, Overlay):
+                originals.append((owner, name, child))
+                child = Overlay(child)
+                setattr(owner, name, child)
+            owner = child
+        original = getattr(owner, attribute)
+        originals.append((owner, attribute, original))
+        setattr(owner, attribute, timer.wrap(original))
+    try:
+        yield timer
+    finally:
+        for owner, attribute, original in reversed(originals):
+            setattr(owner, attribute, original)
+
+
+class Overlay:
+    """Class to override attributes of an object, without modifying it."""
+
+    def __init__(self, target):
+        """Create an overlay, which passes attribute lookups to the target."""
+        self._target = target
+
+    def __getattr__(self, name):
+        """Look up an attribute that is not overridden on the target."""
+        return getattr(self._target, name)
+
+
+class Timer:
+    """Class to accumulate the time spent in (non-nested) calls of functions."""
+
+    def __init__(self):
+        """Create a timer without any time accumulated."""
+        self.elapsed = 0.0
+        self.depth = 0
+
+    def wrap(self, function):
+        """Wrap a function, such that time spent in calls is accumulated."""
+
+        def timed_function(*args, **kwargs):
+            """Call the wrapped function, and accumulate the time spent."""
+            self.depth += 1
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.elapsed += time.perf_counter() - start
+            # A lazy parser (e.g. a line generator) reads while consumed:
+            if isinstance(result, types.GeneratorType):
+                return self.time_consumption(result)
+            return result
+
+        return timed_function
+
+    def time_consumption(self, iterator):
+        """Wrap an iterator, such that time spent in next() is accumulated."""
+        while True:
+            self.depth += 1
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.elapsed += time.perf_counter() - start
+            yield item
+
+
+if __name__ == "__main__":
+    main()
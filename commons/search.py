@@ -0,0 +1,103 @@
+"""
+This module provides graph searches for puzzles with implicit graphs.
+
+Graphs are never built explicitly: the searches take a function that yields
+the neighbors of a node (or, for weighted searches, pairs of a neighbor and the
+small non-negative integer weight of the arc to it). Nodes can be anything
+hashable, e.g. (y, x) tuples or flat Grid indices. Searches can start from
+multiple sources at once, and can stop early at the first node that satisfies a
+target predicate; as nodes are settled in order of distance, this is a nearest
+target.
+
+By default, distances are kept in a dictionary. For large grids, a flat array
+(e.g. the cells of a Grid) can be passed instead, with all values initialized
+to the 'unreached' value.
+"""
+
+from collections import deque
+
+UNREACHED = -1
+
+
+class Distances(dict):
+    """Class to represent a dictionary of distances to reached nodes."""
+
+    def __init__(self, unreached=UNREACHED):
+        """Create an empty dictionary, with a value for unreached nodes."""
+        super().__init__()
+        self.unreached = unreached
+
+    def __missing__(self, node):
+        """Return the unreached value, without adding the node."""
+        return self.unreached
+
+
+def breadth_first_search(
+    sources, neighbors, is_target=None, distances=None, unreached=UNREACHED
+):
+    """
+    Compute the number of steps from the nearest source to reachable nodes.
+
+    Returns the distances, and the first node found that satisfies the target
+    predicate (or None, if there is no such node or no predicate is given). In
+    the latter case, the distances are final for all reachable nodes; in the
+    former case, only for nodes no farther away than the target.
+    """
+    if distances is None:
+        distances = Distances(unreached)
+    queue = deque()
+    for source in sources:
+        if distances[source] == unreached:
+            distances[source] = 0
+            queue.append(source)
+
+    while queue:
+        node = queue.popleft()
+        if is_target is not None and is_target(node):
+            return distances, node
+        next_distance = distances[node] + 1
+        for neighbor in neighbors(node):
+            if distances[neighbor] == unreached:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+    return distances, None
+
+
+def dial_shortest_paths(
+    sources, neighbors, is_target=None, distances=None, unreached=UNREACHED
+):
+    """
+    Compute shortest distances using Dial's variant of Dijkstra's algorithm.
+
+    The priority queue is a list of buckets, one per distance, which suits small
+    integer weights: the total work is linear in the number of arcs plus the
+    largest distance. Return values are as for breadth_first_search.
+    """
+    if distances is None:
+        distances = Distances(unreached)
+    buckets = [[]]
+    for source in sources:
+        distances[source] = 0
+        buckets[0].append(source)
+
+    distance = 0
+    nr_queued = len(buckets[0])
+    while nr_queued:
+        while not buckets[distance]:
+            distance += 1
+        node = buckets[distance].pop()
+        nr_queued -= 1
+        if distances[node] < distance:
+            continue  # an outdated entry, the node has been settled before
+        if is_target is not None and is_target(node):
+            return distances, node
+        for neighbor, weight in neighbors(node):
+            new_distance = distance + weight
+            old_distance = distances[neighbor]
+            if old_distance == unreached or new_distance < old_distance:
+                distances[neighbor] = new_distance
+                while len(buckets) <= new_distance:
+                    buckets.append([])
+                buckets[new_distance].append(neighbor)
+                nr_queued += 1
+    return distances, None
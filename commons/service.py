@@ -0,0 +1,248 @@
+"""
+Serve puzzle solving over local HTTP, from a pool of pre-warmed processes.
+
+The worker processes import every registered solution module when they start,
+so a request pays neither interpreter start-up nor import time. A request posts
+JSON to /solve with the puzzle, the content of its input files, and optionally
+the parts (default: all) and an example number (to use the example parameters):
+
+    {"year": 2022, "day": 1, "inputs": ["1000\\n2000\\n..."], "parts": [2]}
+
+The response holds the answers and timings of the parts, as reported by the
+runner, with the wall time of the request. To batch requests, post a list of
+such payloads instead: they are solved concurrently, and the results are
+returned as a list in the same order. At most 'max_pending' payloads are
+accepted at a time; beyond that, the service answers '503 Service Unavailable'
+(with a Retry-After header), so that callers back off rather than queue
+indefinitely. If a worker process dies, the payloads in flight are answered
+with '500 Internal Server Error', and the pool of workers is restarted. GET
+/health reports the number of workers and pending payloads. Example, from the
+repository root:
+
+    python -m commons.service --port 8022 --workers 4
+"""
+
+import argparse
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, wait
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import tempfile
+import threading
+import time
+
+import puzzles
+import run
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8022
+DEFAULT_MAX_PENDING = 64
+RETRY_AFTER = 1
+
+
+def main():
+    args = parse_arguments()
+    service = SolveService(
+        (args.host, args.port), args.workers, args.max_pending
+    )
+    host, port = service.server_address[:2]
+    print(f"Serving on http://{host}:{port} with {service.workers} workers.")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.server_close()
+
+
+def parse_arguments(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=DEFAULT_MAX_PENDING,
+        help="number of payloads accepted at a time, before refusing more",
+    )
+    return parser.parse_args(argv)
+
+
+class SolveService(ThreadingHTTPServer):
+    """Class to represent an HTTP server that solves in a process pool."""
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=None, max_pending=DEFAULT_MAX_PENDING):
+        """Start the worker processes, and bind the server to an address."""
+        super().__init__(address, SolveRequestHandler)
+        self.workers = workers or os.cpu_count()
+        self.max_pending = max_pending
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.executor = self.start_workers()
+
+    def start_workers(self):
+        """Start a pool of worker processes."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=warm_up_worker
+        )
+        # Start the workers now, rather than on the first request:
+        wait([executor.submit(os.getpid) for _ in range(self.workers)])
+        return executor
+
+    def solve(self, payloads):
+        """Solve payloads in the pool, or return None if there is no room."""
+        for payload in payloads:
+            validate_payload(payload)
+        with self.lock:
+            if self.pending + len(payloads) > self.max_pending:
+                return None
+            self.pending += len(payloads)
+            executor = self.executor
+        try:
+            futures = [executor.submit(solve_payload, p) for p in payloads]
+            return [future.result() for future in futures]
+        except BrokenExecutor:
+            self.restart_workers(executor)
+            raise
+        finally:
+            with self.lock:
+                self.pending -= len(payloads)
+
+    def restart_workers(self, broken_executor):
+        """Replace a broken pool of workers (unless another thread did so)."""
+        with self.lock:
+            if self.executor is not broken_executor:
+                return
+            broken_executor.shutdown(wait=False)
+            self.executor = self.start_workers()
+
+    def server_close(self):
+        """Close the server, and shut down the worker processes."""
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """Class to handle the HTTP requests of the solve service."""
+
+    def do_GET(self):
+        """Report the health of the service."""
+        if self.path != "/health":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Unknown path!"})
+            return
+        self.send_json(
+            HTTPStatus.OK,
+            {
+                "workers": self.server.workers,
+                "pending": self.server.pending,
+                "max_pending": self.server.max_pending,
+            },
+        )
+
+    def do_POST(self):
+        """Solve a payload, or a batch (list) of payloads."""
+        if self.path != "/solve":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Unknown path!"})
+            return
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            is_batch = isinstance(request, list)
+            payloads = request if is_batch else [request]
+            responses = self.server.solve(payloads)
+        except (ValueError, TypeError, KeyError) as e:
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except BrokenExecutor as e:
+            self.send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"A worker process failed: {e!r}"},
+            )
+            return
+        if responses is None:
+            self.send_json(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"error": "Too many pending payloads, retry later."},
+                {"Retry-After": str(RETRY_AFTER)},
+            )
+            return
+        wall_time = time.perf_counter() - start
+        for response in responses:
+            response["wall_time"] = wall_time
+        self.send_json(HTTPStatus.OK, responses if is_batch else responses[0])
+
+    def send_json(self, status, content, headers=None):
+        """Send a response with JSON content."""
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Do not log every request."""
+
+
+def warm_up_worker():
+    """Import all registered solution modules (in a worker process)."""
+    for year, day in puzzles.PUZZLES:
+        puzzles.load_module(year, day)
+
+
+def validate_payload(payload):
+    """Check a payload, raising a ValueError if it cannot be solved."""
+    if not isinstance(payload, dict):
+        raise ValueError("A payload must be a JSON object!")
+    year, day = payload.get("year", 2022), payload["day"]
+    puzzle = puzzles.get_puzzle(year, day)
+    inputs = payload["inputs"]
+    if (
+        not isinstance(inputs, list)
+        or len(inputs) != len(puzzle["inputs"])
+        or not all(isinstance(i, str) for i in inputs)
+    ):
+        raise ValueError(
+            f"Puzzle {year} day {day} takes {len(puzzle['inputs'])} inputs!"
+        )
+    for part in payload.get("parts", ()):
+        puzzles.get_solver(year, day, part)
+
+
+def solve_payload(payload):
+    """Solve the parts of a payload (in a worker process)."""
+    year, day = payload.get("year", 2022), payload["day"]
+    puzzle = puzzles.get_puzzle(year, day)
+    parts = payload.get("parts") or list(puzzle["parts"])
+    example = payload.get("example")
+    response = {"year": year, "day": day, "pid": os.getpid()}
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = []
+        for filename, content in zip(puzzle["inputs"], payload["inputs"]):
+            filenames.append(os.path.join(directory, filename))
+            with open(filenames[-1], "w") as file_object:
+                file_object.write(content)
+        try:
+            response["results"] = [
+                run.solve_part(year, day, part, filenames, example)
+                for part in parts
+            ]
+        except Exception as e:
+            response.update(status=f"error: {e!r}", results=None)
+        else:
+            response["status"] = "ok"
+    return response
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+import answers
+import run
+
+
+class TestAnswers(unittest.TestCase):
+    """Tests for the persistent answer store."""
+
+    def setUp(self):
+        """Open a store in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.store = answers.AnswerStore(self.directory.name)
+        self.addCleanup(self.store.close)
+
+    def make_file(self, name, content):
+        """Create a file with the given content in the temporary directory."""
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file_object:
+            file_object.write(content)
+        return path
+
+    def test_keys(self):
+        """Test whether answers are stored per input and solver source."""
+        input_file = self.make_file("input.txt", "1\n2\n")
+        solver_file = self.make_file("solver.py", "def solve(): pass\n")
+        key = answers.make_key(
+            2022, 1, 1, "solve", {"n": 1}, [input_file], solver_file
+        )
+        self.assertIsNone(self.store.get(key))
+        self.store.put(key, 3, 0.5)
+        self.assertEqual(self.store.get(key), (3, 0.5))
+        new_solver_file = self.make_file(
+            "new_solver.py", "def solve(): return 3\n"
+        )
+        new_key = answers.make_key(
+            2022, 1, 1, "solve", {"n": 1}, [input_file], new_solver_file
+        )
+        self.assertIsNone(self.store.get(new_key))
+        self.assertEqual(self.store.info()["hits"], 1)
+        self.assertEqual(self.store.info()["misses"], 2)
+
+    def test_commons_keys(self):
+        """Test whether answers are no longer used once the commons change."""
+        input_file = self.make_file("input.txt", "1\n2\n")
+        solver_file = self.make_file("solver.py", "def solve(): pass\n")
+        commons_dir = os.path.join(self.directory.name, "commons")
+        os.mkdir(commons_dir)
+        keys = []
+        for source in ("VALUE = 1\n", "VALUE = 2\n"):
+            with open(os.path.join(commons_dir, "tools.py"), "w") as file:
+                file.write(source)
+            keys.append(
+                answers.make_key(
+                    2022,
+                    1,
+                    1,
+                    "solve",
+                    {},
+                    [input_file],
+                    solver_file,
+                    commons_dir,
+                )
+            )
+        self.assertNotEqual(keys[0], keys[1])
+
+    def test_runner(self):
+        """Test whether the runner returns stored answers the second time."""
+        results = run.solve_puzzle(2022, 1, example=1, store=self.store)
+        self.assertEqual([r["stored"] for r in results], [False, False])
+        results = run.solve_puzzle(2022, 1, example=1, store=self.store)
+        self.assertEqual([r["stored"] for r in results], [True, True])
+        self.assertEqual([r["answer"] for r in results], [24000, 45000])
+        report = self.store.report()
+        self.assertEqual(report["answers"], 2)
+        self.assertEqual(report["hit_rate"], 0.5)
+
+    def test_prune(self):
+        """Test whether answers of changed solution modules are removed."""
+        run.solve_part(2022, 1, 1, example=1, store=self.store)
+        outdated_key = (2022, 1, 1, "[]", "", "outdated")
+        self.store.put(outdated_key, 0, 0.0)
+        self.assertEqual(self.store.prune(), 1)
+        self.assertEqual(self.store.report()["answers"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import atexit
+import os
+import tempfile
+import tracemalloc
+import unittest
+import aoc_tools as aoc
+
+CONTENT = "1000\n2000  \n\n3000\n"
+
+
+class TestTools(unittest.TestCase):
+    """Tests for the advent-of-code tools."""
+
+    def setUp(self):
+        """Write the test content to a temporary file."""
+        file_descriptor, self.filename = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "w") as file_object:
+            file_object.write(CONTENT)
+        aoc.clear_parse_cache()
+
+    def tearDown(self):
+        """Remove the temporary file."""
+        os.remove(self.filename)
+
+    def test_iter_lines(self):
+        """Test whether streamed lines match the lines read as a list."""
+        self.assertEqual(
+            list(aoc.iter_lines(self.filename, add_line="")),
+            aoc.read_lines(self.filename, add_line=""),
+        )
+        self.assertEqual(
+            list(aoc.iter_stripped_lines(self.filename, add_line="")),
+            aoc.read_stripped_lines(self.filename, add_line=""),
+        )
+
+    def test_iter_empty(self):
+        """Test whether streaming an empty file raises an error immediately."""
+        with open(self.filename, "w"):
+            pass
+        with self.assertRaises(ValueError):
+            aoc.iter_stripped_lines(self.filename)
+
+    def test_index_lines(self):
+        """Test whether line offsets match the lines read as strings."""
+        lines = aoc.read_lines(self.filename)
+        with aoc.read_mapped(self.filename) as buffer:
+            offsets = aoc.index_lines(buffer)
+        self.assertEqual(len(offsets), len(lines) + 1)
+        self.assertEqual(offsets[-1], len(CONTENT))
+
+    def test_mapped_lines(self):
+        """Test whether mapped lines match the lines read as strings."""
+        lines = aoc.read_lines(self.filename)
+        stripped_lines = aoc.read_stripped_lines(self.filename)
+        with aoc.read_mapped(self.filename) as buffer:
+            mapped = [bytes(ml) for ml in aoc.iter_mapped_lines(buffer)]
+            mapped_stripped = [
+                bytes(ml) for ml in aoc.iter_mapped_lines(buffer, stripped=True)
+            ]
+        self.assertEqual(mapped, [line.encode() for line in lines])
+        self.assertEqual(
+            mapped_stripped, [line.encode() for line in stripped_lines]
+        )
+
+    def test_mapped_empty(self):
+        """Test whether mapping an empty file raises an error."""
+        with open(self.filename, "w"):
+            pass
+        with self.assertRaises(ValueError):
+            with aoc.read_mapped(self.filename):
+                pass
+
+    def test_extract_ints(self):
+        """Test whether signed integers are extracted and split into records."""
+        numbers = aoc.extract_ints(b"2-4,6-8\nx=-5, y=10: 0 2\n", per_record=4)
+        self.assertEqual(numbers.typecode, "q")
+        self.assertEqual(
+            list(aoc.iter_records(numbers, 4)), [(2, 4, 6, 8), (-5, 10, 0, 2)]
+        )
+        self.assertEqual(list(aoc.extract_ints("move 1 from 2")), [1, 2])
+        with self.assertRaises(ValueError):
+            aoc.extract_ints("1 2 3", per_record=2)
+
+    def test_parse_cache(self):
+        """Test whether parse results are cached by content, and copied."""
+        parser = aoc.cache_parsed(copier=list)(aoc.read_stripped_lines)
+        lines = parser(self.filename)
+        lines.append("mutated")
+        self.assertEqual(parser(self.filename), ["1000", "2000", "", "3000"])
+        info = aoc.parse_cache_info()
+        self.assertEqual((info["misses"], info["hits"]), (1, 1))
+        with open(self.filename, "w") as file_object:
+            file_object.write("4000\n")
+        self.assertEqual(parser(self.filename), ["4000"])
+        self.assertEqual(aoc.parse_cache_info()["misses"], 2)
+
+    def test_parse_cache_disk(self):
+        """Test whether parse results are loaded from the on-disk tier."""
+        parser = aoc.cache_parsed()(aoc.read_stripped_lines)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ[aoc.PARSE_CACHE_DIR_VARIABLE] = cache_dir
+            try:
+                parser(self.filename)
+                aoc.clear_parse_cache()
+                lines = parser(self.filename)
+            finally:
+                del os.environ[aoc.PARSE_CACHE_DIR_VARIABLE]
+        self.assertEqual(lines, aoc.read_stripped_lines(self.filename))
+        self.assertEqual(aoc.parse_cache_info()["disk_hits"], 1)
+
+    def test_instrument(self):
+        """Test whether calls, times, and peak memory are recorded."""
+        self.assertIs(aoc.instrument(len), len)
+        aoc.enable_instrumentation()
+        try:
+
+            @aoc.instrument
+            def count_down(n):
+                """Recursively count down, allocating a list at the end."""
+                return count_down(n - 1) if n > 0 else len([0] * 100_000)
+
+            self.assertEqual(count_down(9), 100_000)
+            report = aoc.instrument_report()
+        finally:
+            atexit.unregister(aoc.print_instrument_report)
+            aoc._instrument_mode = None
+            aoc._instrument_stats.clear()
+            tracemalloc.stop()
+        self.assertEqual(len(report), 1)
+        self.assertTrue(report[0]["function"].endswith("count_down"))
+        self.assertEqual(report[0]["calls"], 10)
+        self.assertLessEqual(report[0]["self"], report[0]["cumulative"] + 1e-9)
+        self.assertGreater(report[0]["peak"], 8 * 100_000)
+
+    def test_progress(self):
+        """Test whether the latest progress values are kept until cleared."""
+        aoc.clear_progress()
+        aoc.report_progress(lower_bound=1, stage=1)
+        aoc.report_progress(lower_bound=2)
+        self.assertEqual(aoc.get_progress(), {"lower_bound": 2, "stage": 1})
+        aoc.clear_progress()
+        self.assertEqual(aoc.get_progress(), {})
+
+    def test_backend(self):
+        """Test whether backends can be selected, and unknown ones refused."""
+        self.addCleanup(aoc.set_backend, aoc.get_backend())
+        aoc.set_backend("python")
+        self.assertEqual(aoc.get_backend(), "python")
+        with self.assertRaises(ValueError):
+            aoc.set_backend("fortran")
+        if aoc.has_numpy():
+            aoc.set_backend("numpy")
+            self.assertEqual(aoc.get_backend(), "numpy")
+        else:
+            with self.assertRaises(ImportError):
+                aoc.set_backend("numpy")
+            self.assertEqual(aoc.get_backend(), "python")
+
+    @unittest.skipUnless(aoc.has_numpy(), "NumPy is not installed.")
+    def test_numpy_backend_mixin(self):
+        """Test whether the mixin selects the numpy backend during a test."""
+
+        class BackendTest(aoc.NumpyBackendMixin, unittest.TestCase):
+            def runTest(self):
+                self.assertEqual(aoc.get_backend(), "numpy")
+
+        self.addCleanup(aoc.set_backend, aoc.get_backend())
+        aoc.set_backend("python")
+        result = unittest.TestResult()
+        BackendTest().run(result)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(aoc.get_backend(), "python")
+
+
+if __name__ == "__main__":
+    unittest.main()
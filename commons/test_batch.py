@@ -0,0 +1,34 @@
+import unittest
+import batch
+import puzzles
+
+
+class TestBatch(unittest.TestCase):
+    """Tests for the batch driver."""
+
+    def test_solve_all_parts(self):
+        """Test whether all parts are solved, with or without batch solver."""
+        for day, expected in (
+            (1, {1: 24000, 2: 45000}),
+            (16, {1: 1651, 2: 1707}),
+        ):
+            filenames = puzzles.get_input_paths(2022, day, example=1)
+            answers, parse_time = batch.solve_all_parts(2022, day, filenames)
+            self.assertEqual(answers, expected)
+            self.assertGreaterEqual(parse_time, 0.0)
+
+    def test_solve_batch(self):
+        """Test whether results are streamed for every input set."""
+        filenames = puzzles.get_input_paths(2022, 19, example=1)
+        input_sets = [filenames] * 3 + [("missing.txt",)]
+        results = list(batch.solve_batch(2022, 19, input_sets, workers=2))
+        self.assertEqual(len(results), 4)
+        statuses = sorted(r["status"][:5] for r in results)
+        self.assertEqual(statuses, ["error", "ok", "ok", "ok"])
+        for result in results:
+            if result["status"] == "ok":
+                self.assertEqual(result["answers"], {1: 33, 2: 56 * 62})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """Tests for the benchmark harness."""
+
+    def test_benchmark_part(self):
+        """Test whether the timed runs of a part are summarized."""
+        result = benchmark.benchmark_part(2022, 1, 1, 1, warmup=1, repeat=3)
+        self.assertEqual(result["input"], "example_1")
+        self.assertEqual(result["answer"], 24000)
+        self.assertEqual(len(result["times"]), 3)
+        self.assertIn(result["median"], result["times"])
+
+    def test_memory_profile(self):
+        """Test whether memory profiles are added to the benchmark results."""
+        (result,) = benchmark.run_benchmarks(
+            2022, 1, 1, "examples", warmup=0, repeat=1, profile_memory=True
+        )
+        self.assertEqual(result["answer"], 24000)
+        self.assertGreater(result["memory"]["peak_memory"], 0)
+
+    def test_find_regressions(self):
+        """Test whether only regressions beyond the thresholds are flagged."""
+        key = (2022, 1, 1, "puzzle")
+        result = dict(zip(("year", "day", "part", "input"), key))
+        baselines = {key: {"median": 1.0}}
+        for median, threshold, min_delta, expected in (
+            (1.1, 0.2, 0.001, 0),
+            (1.3, 0.2, 0.001, 1),
+            (1.3, 0.2, 0.5, 0),
+            (0.5, 0.0, 0.0, 0),
+        ):
+            result["median"] = median
+            regressions = benchmark.find_regressions(
+                [result], baselines, threshold, min_delta
+            )
+            self.assertEqual(len(regressions), expected)
+        baselines[key]["median"] = 0.0
+        result["median"] = 0.1
+        regressions = benchmark.find_regressions([result], baselines)
+        self.assertEqual(len(regressions), 1)
+        self.assertIsNone(regressions[0]["ratio"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import bitset
+
+
+class TestBitset(unittest.TestCase):
+    """Tests for the bitset rows and boards."""
+
+    def test_lines(self):
+        """Test whether lines convert to rows and back."""
+        lines = ["#..#", ".##.", "...."]
+        board = bitset.from_lines(lines)
+        self.assertEqual(board, [0b1001, 0b0110, 0])
+        self.assertEqual(bitset.to_lines(board, 4), lines)
+        self.assertEqual(bitset.from_lines(["<>.<"], "<"), [0b1001])
+
+    def test_shifts(self):
+        """Test whether shifts drop and rotations wrap overflowing cells."""
+        self.assertEqual(bitset.shift_east(0b1001, 4), 0b0010)
+        self.assertEqual(bitset.shift_west(0b1001), 0b0100)
+        self.assertEqual(bitset.rotate_east(0b1001, 4), 0b0011)
+        self.assertEqual(bitset.rotate_west(0b1001, 4), 0b1100)
+        self.assertEqual(bitset.rotate_east(0b0001, 4, 9), 0b0010)
+        self.assertEqual(bitset.rotate_west(0b0001, 4, 4), 0b0001)
+
+    def test_neighborhoods(self):
+        """Test whether cells next to marked cells are marked."""
+        self.assertEqual(bitset.spread(0b1000_0001, 8), 0b1100_0011)
+        board = bitset.from_lines([".....", "..#..", "....."])
+        self.assertEqual(
+            bitset.to_lines(bitset.dilate(board, 5), 5),
+            ["..#..", ".###.", "..#.."],
+        )
+
+    def test_overlaps_and_stamp(self):
+        """Test whether placed rows are checked for overlaps, and stamped."""
+        board = bitset.from_lines(["#...", "....", "...."])
+        rows = bitset.from_lines([".##.", "..#."])
+        self.assertFalse(bitset.overlaps(board, rows, 1))
+        bitset.stamp(board, rows, 1)
+        self.assertEqual(bitset.to_lines(board, 4), ["#...", ".##.", "..#."])
+        self.assertTrue(bitset.overlaps(board, rows, 1))
+        self.assertTrue(bitset.overlaps(board, [0b0001], 0))
+
+    def test_count_and_bounding_box(self):
+        """Test whether marked cells are counted and enclosed."""
+        board = bitset.from_lines(["......", "..#...", "....#.", "......"])
+        self.assertEqual(bitset.count(board), 2)
+        self.assertEqual(bitset.bounding_box(board), (2, 4, 1, 2))
+        with self.assertRaises(ValueError):
+            bitset.bounding_box([0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+import complexity
+
+
+class TestComplexity(unittest.TestCase):
+    """Tests for the empirical complexity profiler."""
+
+    def test_fit_exponent(self):
+        """Test whether growth exponents of power functions are recovered."""
+        sizes = complexity.get_sizes(10, 2, 4)
+        self.assertEqual(sizes, [10, 20, 40, 80])
+        for exponent in (0.5, 1, 2, 3):
+            values = [3 * s**exponent for s in sizes]
+            fitted = complexity.fit_exponent(sizes, values)
+            self.assertAlmostEqual(fitted, exponent)
+        self.assertIsNone(complexity.fit_exponent([10, 20], [0, 5]))
+
+    def test_profile_part(self):
+        """Test whether functions of the solution module are profiled."""
+        result = complexity.profile_part(2022, 20, 1, [100, 200, 400])
+        self.assertEqual(result["sizes"], [100, 200, 400])
+        self.assertIn("day_20.mix_numbers", result["functions"])
+        self.assertGreater(
+            result["functions"]["day_20.mix_numbers"]["exponent"], 1
+        )
+        self.assertEqual(len(result["peak_memory"]["values"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import footprint
+import puzzles
+
+
+class TestFootprint(unittest.TestCase):
+    """Tests for the entity footprint measurements."""
+
+    def test_entity_classes(self):
+        """Test whether instances of all entity classes lack a dictionary."""
+        for (year, day), (class_names, _, _) in footprint.ENTITIES.items():
+            module = puzzles.load_module(year, day)
+            for name in class_names:
+                entity = object.__new__(getattr(module, name))
+                self.assertFalse(hasattr(entity, "__dict__"), name)
+
+    def test_measure_entities(self):
+        """Test whether entities are counted, and slots take fewer bytes."""
+        (result,) = footprint.measure_entities(2022, 20, size=50)
+        self.assertEqual(result["instances"], 50)
+        self.assertLess(result["slots_bytes"], result["dict_bytes"])
+        self.assertEqual(
+            result["saved_bytes"],
+            50 * (result["dict_bytes"] - result["slots_bytes"]),
+        )
+        # The counting subclass must be replaced by the original class:
+        module = puzzles.load_module(2022, 20)
+        self.assertIs(module.MovingNumber.__base__, object)
+
+
+if __name__ == "__main__":
+    unittest.main()
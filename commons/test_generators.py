@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+import generators
+import run
+
+SMALL_SIZES = {
+    1: 20,
+    2: 20,
+    3: 30,
+    4: 20,
+    5: 20,
+    6: 50,
+    7: 20,
+    8: 10,
+    9: 20,
+    10: 240,
+    11: 4,
+    12: 26,
+    13: 20,
+    14: 20,
+    15: 10,
+    16: 8,
+    17: 100,
+    18: 50,
+    19: 2,
+    20: 53,
+    21: 21,
+    22: 4,
+    23: 10,
+    24: 10,
+    25: 20,
+}
+
+
+class TestGenerators(unittest.TestCase):
+    """Tests for the synthetic input generators."""
+
+    def test_solvable(self):
+        """Test whether generated inputs can be solved, for every day."""
+        for day, size in SMALL_SIZES.items():
+            with self.subTest(day=day), tempfile.TemporaryDirectory() as dir:
+                paths = generators.write_inputs(2022, day, size, 1, dir)
+                for result in run.solve_puzzle(2022, day, filenames=paths):
+                    self.assertIsNotNone(result["answer"])
+
+    def test_min_sizes(self):
+        """Test whether inputs of the minimum size can be solved, per seed."""
+        for day in (15, 21):
+            min_size = generators.GENERATORS[(2022, day)][1]
+            for seed in range(5):
+                with self.subTest(day=day, seed=seed):
+                    with tempfile.TemporaryDirectory() as dir:
+                        paths = generators.write_inputs(
+                            2022, day, min_size, seed, dir
+                        )
+                        results = run.solve_puzzle(2022, day, filenames=paths)
+                        answers = [r["answer"] for r in results]
+                    self.assertTrue(all(isinstance(a, int) for a in answers))
+
+    def test_seeded(self):
+        """Test whether generation is reproducible given the seed."""
+        contents = generators.generate(2022, 21, 101, seed=5)
+        self.assertEqual(contents, generators.generate(2022, 21, 101, seed=5))
+        self.assertNotEqual(
+            contents, generators.generate(2022, 21, 101, seed=6)
+        )
+
+    def test_min_size(self):
+        """Test whether sizes below the minimum are rejected."""
+        with self.assertRaises(ValueError):
+            generators.generate(2022, 12, 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
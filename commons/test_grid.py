@@ -0,0 +1,62 @@
+import unittest
+from grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    """Tests for the grid type."""
+
+    def test_from_lines(self):
+        """Test whether lines are converted to cells, mapped or as ordinals."""
+        grid = Grid.from_lines(["12", "34"], {str(n): n for n in range(5)})
+        self.assertEqual(grid.cells, bytearray([1, 2, 3, 4]))
+        grid = Grid.from_lines(["ab"])
+        self.assertEqual(grid[0, 1], ord("b"))
+
+    def test_index_and_position(self):
+        """Test whether flat indices and positions correspond."""
+        grid = Grid(3, 4, padding=2)
+        self.assertEqual(grid.stride, 8)
+        self.assertEqual(grid.index(0, 0), 18)
+        self.assertEqual(grid.position(grid.index(2, 3)), (2, 3))
+
+    def test_border(self):
+        """Test whether the border surrounds the interior and is kept intact."""
+        grid = Grid(2, 3, fill=0, padding=1, border=9)
+        self.assertEqual(grid.cells.count(9), 4 * 5 - 2 * 3)
+        idx = grid.index(0, 0)
+        self.assertEqual(
+            [grid.cells[idx + o] for o in grid.neighbor_offsets], [9, 0, 0, 9]
+        )
+        grid.fill(1)
+        self.assertEqual(grid.count(1), 6)
+        self.assertEqual(grid.count(9), 0)
+        grid.fill_border(0)
+        self.assertEqual(grid.cells.count(0), 14)
+
+    def test_typecode(self):
+        """Test whether other value types are stored in an array."""
+        grid = Grid(2, 2, fill=1000, padding=1, border=-1, typecode="l")
+        grid[1, 1] = -5
+        self.assertEqual(grid.get_row(1).tolist(), [1000, -5])
+        self.assertEqual(grid.count(1000), 3)
+
+    def test_add_rows(self):
+        """Test whether added rows are inserted inside the border."""
+        grid = Grid(1, 2, fill=1, padding=1, border=7)
+        grid.add_rows(2)
+        self.assertEqual(grid.height, 3)
+        self.assertEqual(grid.get_row(2), bytearray([0, 0]))
+        self.assertEqual(grid.cells.count(7), 5 * 4 - 3 * 2)
+        self.assertEqual(grid.count(1), 2)
+
+    def test_copy(self):
+        """Test whether a copy does not share its cells with the original."""
+        grid = Grid(2, 2)
+        duplicate = grid.copy()
+        duplicate[0, 0] = 1
+        self.assertEqual(grid[0, 0], 0)
+        self.assertEqual(duplicate.stride, grid.stride)
+
+
+if __name__ == "__main__":
+    unittest.main()
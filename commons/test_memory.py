@@ -0,0 +1,26 @@
+import tracemalloc
+import unittest
+import memory
+
+
+class TestMemory(unittest.TestCase):
+    """Tests for the memory profiler."""
+
+    def test_profile_part(self):
+        """Test whether peaks and allocation sites are reported."""
+        profile = memory.profile_part(2022, 17, 1, example=1, top=3)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(profile["peak_memory"], 0)
+        self.assertGreaterEqual(
+            profile["peak_memory"], profile["snapshot_memory"]
+        )
+        self.assertGreater(profile["peak_rss"], profile["peak_memory"])
+        sites = profile["allocation_sites"]
+        self.assertLessEqual(len(sites), 3)
+        self.assertTrue(any(s["site"].startswith("day_17.py:") for s in sites))
+        sizes = [s["size"] for s in sites]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import json
+import os
+import tempfile
+import unittest
+import parallel
+
+
+class TestParallel(unittest.TestCase):
+    """Tests for the parallel driver."""
+
+    def test_schedule_jobs(self):
+        """Test whether jobs are ordered longest-first, unknown ones first."""
+        jobs = [(2022, 1, 1), (2022, 16, 1), (2022, 20, 2)]
+        history = {(2022, 1, 1): 0.001, (2022, 16, 1): 0.2}
+        self.assertEqual(
+            parallel.schedule_jobs(jobs, history),
+            [(2022, 20, 2), (2022, 16, 1), (2022, 1, 1)],
+        )
+
+    def test_schedule_defaults(self):
+        """Test whether, without history, the heavy parts go first."""
+        jobs = [(2022, 1, 1), (2022, 16, 1), (2022, 19, 2), (2022, 20, 2)]
+        self.assertEqual(
+            parallel.schedule_jobs(jobs, {}),
+            [(2022, 20, 2), (2022, 16, 1), (2022, 19, 2), (2022, 1, 1)],
+        )
+
+    def test_solve_concurrently(self):
+        """Test whether answers are aggregated, and reports serve as history."""
+        report = parallel.solve_concurrently(day=1, workers=2)
+        self.assertEqual([r["part"] for r in report["results"]], [1, 2])
+        self.assertTrue(all(r["status"] == "ok" for r in report["results"]))
+        file_descriptor, path = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, "w") as file_object:
+            json.dump(report, file_object)
+        try:
+            history = parallel.load_history(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(set(history), {(2022, 1, 1), (2022, 1, 2)})
+
+    def test_timeout(self):
+        """Test whether a part is given up on after its time limit."""
+        result = parallel.solve_job(2022, 20, 2, timeout=0.01)
+        self.assertEqual(result["status"], "timeout")
+        self.assertIsNone(result["answer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
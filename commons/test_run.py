@@ -0,0 +1,105 @@
+import os
+import tempfile
+import time
+import types
+import unittest
+import aoc_tools as aoc
+import generators
+import run
+
+
+class TestRun(unittest.TestCase):
+    """Tests for the single entry-point runner."""
+
+    def test_example_answers(self):
+        """Test whether the runner reports the example answers of day 1."""
+        results = run.solve_puzzle(2022, 1, example=1)
+        self.assertEqual([r["answer"] for r in results], [24000, 45000])
+
+    def test_result_indices(self):
+        """Test whether tuple-valued solutions are reduced to one answer."""
+        results = run.solve_puzzle(2022, 8, parts=[2], example=1)
+        self.assertEqual(results[0]["answer"], 8)
+
+    def test_example_kwargs(self):
+        """Test whether example-specific parameters are applied."""
+        results = run.solve_puzzle(2022, 15, example=1)
+        self.assertEqual([r["answer"] for r in results], [26, 56000011])
+
+    def test_timings(self):
+        """Test whether parse and solve times are reported separately."""
+        result = run.solve_part(2022, 16, 1, example=1)
+        self.assertEqual(result["answer"], 1651)
+        self.assertGreater(result["parse_time"], 0)
+        self.assertGreater(result["solve_time"], 0)
+
+    def test_time_parsers(self):
+        """Test whether lazy parsers are timed, without patching aoc_tools."""
+
+        def parse_lines():
+            for _ in range(2):
+                time.sleep(0.01)
+                yield ""
+
+        module = types.SimpleNamespace(aoc=aoc, parse_lines=parse_lines)
+        original = aoc.iter_stripped_lines
+        parser_names = ("parse_lines", "aoc.iter_stripped_lines")
+        with run.time_parsers(module, parser_names) as parse_timer:
+            self.assertIs(aoc.iter_stripped_lines, original)
+            self.assertIsNot(module.aoc.iter_stripped_lines, original)
+            self.assertEqual(list(module.parse_lines()), ["", ""])
+        self.assertGreaterEqual(parse_timer.elapsed, 0.02)
+        self.assertIs(module.aoc, aoc)
+
+    def test_parse_once(self):
+        """Test whether solving both parts of a puzzle parses the input once."""
+        aoc.clear_parse_cache()
+        results = run.solve_puzzle(2022, 19, example=1)
+        self.assertEqual([r["answer"] for r in results], [33, 56 * 62])
+        info = aoc.parse_cache_info()
+        self.assertEqual((info["misses"], info["hits"]), (1, 1))
+
+    def test_get_budget(self):
+        """Test whether part limits override day limits and the defaults."""
+        budgets = {
+            "2022/19": {"time_limit": 60, "memory_limit": 500},
+            "2022/19/2": {"time_limit": 120},
+        }
+        self.assertEqual(
+            run.get_budget(budgets, 2022, 19, 2, {"time_limit": 10}),
+            {"time_limit": 120, "memory_limit": 500},
+        )
+        self.assertEqual(
+            run.get_budget(budgets, 2022, 18, 1, {"time_limit": 10}),
+            {"time_limit": 10, "memory_limit": None},
+        )
+
+    def test_time_limit(self):
+        """Test whether a solver is cancelled, and reports its progress."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = generators.write_inputs(2022, 19, 40, 0, directory)
+            result = run.solve_part_within_budget(
+                2022, 19, 1, paths, time_limit=0.3
+            )
+        self.assertEqual(result["status"], "time limit")
+        self.assertIsNone(result["answer"])
+        self.assertIn("lower_bound", result["progress"])
+
+    @unittest.skipUnless(os.path.exists("/proc/self/statm"), "requires /proc")
+    def test_memory_limit(self):
+        """Test whether a solver is cancelled when it exceeds memory."""
+        result = run.solve_part_within_budget(2022, 16, 2, memory_limit=1)
+        self.assertEqual(result["status"], "memory limit")
+        self.assertGreater(result["peak_rss"], 1 << 20)
+
+    def test_within_budget(self):
+        """Test whether a solver within budget reports its answer."""
+        results = run.solve_puzzle(
+            2022, 1, example=1, default_budget={"time_limit": 60}
+        )
+        self.assertEqual([r["status"] for r in results], ["ok", "ok"])
+        self.assertEqual([r["answer"] for r in results], [24000, 45000])
+
+
+if __name__ == "__main__":
+    unittest.main()
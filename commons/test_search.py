@@ -0,0 +1,85 @@
+import unittest
+from array import array
+import search
+
+
+def grid_neighbors(lines):
+    """Create a neighbor function for the open squares of a small maze."""
+
+    def neighbors(node):
+        idx_y, idx_x = node
+        for pos_y, pos_x in (
+            (idx_y - 1, idx_x),
+            (idx_y + 1, idx_x),
+            (idx_y, idx_x - 1),
+            (idx_y, idx_x + 1),
+        ):
+            if (
+                0 <= pos_y < len(lines)
+                and 0 <= pos_x < len(lines[0])
+                and lines[pos_y][pos_x] != "#"
+            ):
+                yield pos_y, pos_x
+
+    return neighbors
+
+
+MAZE = ["..#.", ".##.", "....", "#..."]
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for the graph searches."""
+
+    def test_breadth_first_search(self):
+        """Test whether all reachable nodes get their number of steps."""
+        distances, target = search.breadth_first_search(
+            [(0, 0)], grid_neighbors(MAZE)
+        )
+        self.assertIsNone(target)
+        self.assertEqual(distances[(0, 3)], 7)
+        self.assertEqual(distances[(3, 3)], 6)
+        self.assertEqual(distances[(0, 2)], search.UNREACHED)
+        self.assertNotIn((0, 2), distances)
+        self.assertEqual(len(distances), 12)
+
+    def test_multiple_sources_and_target(self):
+        """Test whether the search stops at the target nearest to a source."""
+        distances, target = search.breadth_first_search(
+            [(0, 0), (0, 3)], grid_neighbors(MAZE), lambda n: n[0] == 3
+        )
+        self.assertEqual(target, (3, 3))
+        self.assertEqual(distances[target], 3)
+
+    def test_array_distances(self):
+        """Test whether distances can be kept in a preallocated array."""
+        distances = array("l", [-1] * 10)
+        result, _ = search.breadth_first_search(
+            [0], lambda n: [n + 2] if n < 8 else [], distances=distances
+        )
+        self.assertIs(result, distances)
+        self.assertEqual(
+            distances.tolist(), [0, -1, 1, -1, 2, -1, 3, -1, 4, -1]
+        )
+
+    def test_dial_shortest_paths(self):
+        """Test whether weighted distances match those of a known graph."""
+        arcs = {
+            "a": [("b", 4), ("c", 1)],
+            "b": [("d", 1)],
+            "c": [("b", 2), ("d", 5), ("e", 0)],
+            "d": [],
+            "e": [("d", 3)],
+        }
+        distances, target = search.dial_shortest_paths(["a"], arcs.get)
+        self.assertIsNone(target)
+        self.assertEqual(
+            dict(distances), {"a": 0, "b": 3, "c": 1, "d": 4, "e": 1}
+        )
+        distances, target = search.dial_shortest_paths(
+            ["a"], arcs.get, "b".__eq__
+        )
+        self.assertEqual((target, distances[target]), ("b", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
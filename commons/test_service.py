@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import unittest
+import urllib.error
+import urllib.request
+import puzzles
+import service
+
+
+class TestService(unittest.TestCase):
+    """Tests for the solve service."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a service with one worker on a free port."""
+        cls.service = service.SolveService(
+            ("127.0.0.1", 0), workers=1, max_pending=2
+        )
+        cls.thread = threading.Thread(target=cls.service.serve_forever)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.service.server_address[1]}"
+        (filename,) = puzzles.get_input_paths(2022, 1, example=1)
+        with open(filename) as file_object:
+            cls.payload = {"day": 1, "inputs": [file_object.read()]}
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the service."""
+        cls.service.shutdown()
+        cls.service.server_close()
+        cls.thread.join()
+
+    def post(self, content, url=None):
+        """Post JSON content to the solve endpoint, and return the response."""
+        request = urllib.request.Request(
+            (url or self.url) + "/solve",
+            data=json.dumps(content).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+
+    def test_solve(self):
+        """Test whether a payload is solved from its input content."""
+        response = self.post(self.payload)
+        self.assertEqual(response["status"], "ok")
+        answers = [r["answer"] for r in response["results"]]
+        self.assertEqual(answers, [24000, 45000])
+
+    def test_batch(self):
+        """Test whether a batch of payloads is solved in order."""
+        payloads = [{**self.payload, "parts": [p]} for p in (2, 1)]
+        responses = self.post(payloads)
+        answers = [r["results"][0]["answer"] for r in responses]
+        self.assertEqual(answers, [45000, 24000])
+
+    def test_backpressure(self):
+        """Test whether payloads beyond the maximum pending are refused."""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.post([self.payload] * 3)
+        self.assertEqual(context.exception.code, 503)
+        self.assertEqual(context.exception.headers["Retry-After"], "1")
+
+    def test_broken_worker(self):
+        """Test whether a dead worker gives a JSON error, and a new pool."""
+        broken_service = service.SolveService(("127.0.0.1", 0), workers=1)
+        thread = threading.Thread(target=broken_service.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(broken_service.server_close)
+        self.addCleanup(broken_service.shutdown)
+        url = f"http://127.0.0.1:{broken_service.server_address[1]}"
+        broken_service.executor.submit(os._exit, 1).exception()
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.post(self.payload, url)
+        self.assertEqual(context.exception.code, 500)
+        self.assertIn("error", json.load(context.exception))
+        self.assertEqual(self.post(self.payload, url)["status"], "ok")
+
+    def test_bad_request(self):
+        """Test whether invalid payloads are refused."""
+        for payload in ({"day": 26, "inputs": [""]}, {"day": 1, "inputs": []}):
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                self.post(payload)
+            self.assertEqual(context.exception.code, 400)
+
+    def test_health(self):
+        """Test whether the health report lists workers and pending payloads."""
+        with urllib.request.urlopen(self.url + "/health") as response:
+            health = json.load(response)
+        self.assertEqual(health, {"workers": 1, "pending": 0, "max_pending": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()